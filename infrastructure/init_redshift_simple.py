@@ -71,6 +71,24 @@ def test_connection(config):
         logger.error(f"Connection failed: {e}")
         return False
 
+def migrate_calculated_on(cursor, table, sort_key):
+    """Add calculated_on to an analytics table created before it, backfilled from calculated_at."""
+    cursor.execute("""
+        SELECT 1
+        FROM information_schema.columns
+        WHERE table_schema = 'concert_dw' AND table_name = %s AND column_name = 'calculated_on';
+    """, (table,))
+    if cursor.fetchone():
+        return
+    
+    logger.info(f"Adding calculated_on to {table}...")
+    cursor.execute("BEGIN;")
+    cursor.execute(f"ALTER TABLE concert_dw.{table} ADD COLUMN calculated_on DATE NOT NULL DEFAULT CURRENT_DATE;")
+    cursor.execute(f"UPDATE concert_dw.{table} SET calculated_on = calculated_at::DATE;")
+    cursor.execute("COMMIT;")
+    cursor.execute(f"ALTER TABLE concert_dw.{table} ALTER SORTKEY ({sort_key});")
+    logger.info(f"✓ {table} migrated to the calculated_on sort key")
+
 def create_schema(config):
     """Create the concert_dw schema and tables."""
     try:
@@ -192,11 +210,13 @@ def create_schema(config):
                 booking_frequency DECIMAL(8,2),
                 total_events INTEGER,
                 calculated_at TIMESTAMP NOT NULL,
+                calculated_on DATE NOT NULL DEFAULT CURRENT_DATE,
                 PRIMARY KEY (venue_id, calculated_at)
             )
             DISTSTYLE EVEN
-            SORTKEY (calculated_at, popularity_rank);
+            SORTKEY (calculated_on, popularity_rank);
         """)
+        migrate_calculated_on(cursor, 'venue_popularity', 'calculated_on, popularity_rank')
         logger.info("✓ Venue popularity table created")
         
         logger.info("Creating artist_performance table...")
@@ -209,11 +229,13 @@ def create_schema(config):
                 fan_engagement_score DECIMAL(5,2) DEFAULT 0.0,
                 growth_trend VARCHAR(20) DEFAULT 'stable',
                 calculated_at TIMESTAMP NOT NULL,
+                calculated_on DATE NOT NULL DEFAULT CURRENT_DATE,
                 PRIMARY KEY (artist_id, calculated_at)
             )
             DISTSTYLE EVEN
-            SORTKEY (calculated_at, revenue_generated);
+            SORTKEY (calculated_on, revenue_generated);
         """)
+        migrate_calculated_on(cursor, 'artist_performance', 'calculated_on, revenue_generated')
         logger.info("✓ Artist performance table created")
         
         logger.info("Creating daily_sales_summary table...")
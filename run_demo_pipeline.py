@@ -177,6 +177,7 @@ class DemoPipelineOrchestrator:
         try:
             # Check Redshift connection
             conn = self.redshift_client.get_connection()
+            self.redshift_client.release_connection(conn)
             print("✓ Connected to Redshift")
             
             # Initialize data loader
@@ -2,6 +2,7 @@
 
 from src.infrastructure.lake_formation_client import (
     LakeFormationClient,
+    AsyncLakeFormationClient,
     AccessResult,
     LineageResult,
     AuditResult,
@@ -11,6 +12,7 @@ from src.infrastructure.lake_formation_client import (
 
 __all__ = [
     'LakeFormationClient',
+    'AsyncLakeFormationClient',
     'AccessResult',
     'LineageResult',
     'AuditResult',
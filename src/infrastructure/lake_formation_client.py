@@ -10,15 +10,98 @@ This module provides functionality for:
 Requirements: 5.1, 5.4, 5.5
 """
 
+import asyncio
 import boto3
+import itertools
+import json
 import logging
-from typing import List, Dict, Optional, Any
-from datetime import datetime
-from dataclasses import dataclass, asdict
+import time
+from boto3.dynamodb.conditions import Key
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Any, Tuple, FrozenSet
+from datetime import datetime, timedelta
+from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Per-process sequence appended to audit IDs so events logged within the
+# same millisecond still get distinct identifiers.
+_audit_id_counter = itertools.count()
+
+# CloudWatch log stream names; audit and lineage records get one stream per day
+_AUDIT_STREAM_PREFIX = 'audit/'
+_LINEAGE_STREAM_PREFIX = 'lineage/'
+_AUDIT_STREAM_FMT = _AUDIT_STREAM_PREFIX + '{}'
+_LINEAGE_STREAM_FMT = _LINEAGE_STREAM_PREFIX + '{}'
+
+# Audit log queries over long time ranges are split into at most this many
+# shards (each at least one hour wide) and fetched concurrently.
+_MAX_LOG_QUERY_WORKERS = 8
+_MIN_LOG_QUERY_SHARD = timedelta(hours=1)
+
+# Global secondary index on the lineage table keyed by target, used for
+# upstream lookups (the base table is keyed by source for downstream ones).
+_LINEAGE_TARGET_INDEX = 'TargetIndex'
+
+
+def _json_dumps(data: Any) -> str:
+    """Serialize data to a JSON string, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, default=str)
+
+
+def _json_loads(data: str) -> Any:
+    """Deserialize a JSON string, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _message_needle(value: Optional[str]) -> Optional[str]:
+    """
+    Get the quoted form of a value as it appears in a serialized log record.
+    
+    Returns None when the value is empty or could be escaped differently
+    by json and orjson (non-ASCII, quotes, backslashes, control characters),
+    in which case no substring prefilter is applied.
+    """
+    if not value or not value.isascii() or not value.isprintable():
+        return None
+    if '"' in value or '\\' in value:
+        return None
+    return f'"{value}"'
+
+
+def _json_filter_pattern(clauses: List[Tuple[str, str]], operator: str = '&&') -> str:
+    """
+    Build a CloudWatch Logs JSON filter pattern from field/value pairs.
+    
+    Args:
+        clauses: List of (field, value) equality predicates
+        operator: Logical operator joining the predicates ('&&' or '||')
+        
+    Returns:
+        Filter pattern string, or '' to match all events
+    """
+    if not clauses:
+        return ''
+    terms = []
+    for field, value in clauses:
+        escaped = value.replace('\\', '\\\\').replace('"', '\\"')
+        terms.append(f'$.{field} = "{escaped}"')
+    return '{ ' + f' {operator} '.join(terms) + ' }'
+
 
 class PermissionType(Enum):
     """Lake Formation permission types."""
@@ -32,6 +115,21 @@ class PermissionType(Enum):
     ALL = "ALL"
 
 
+_VALID_PERMISSIONS: FrozenSet[str] = frozenset(p.value for p in PermissionType)
+
+# Maximum entries Lake Formation accepts in one BatchGrantPermissions call
+_BATCH_GRANT_MAX_ENTRIES = 20
+
+# Fields returned by glue get_table that update_table does not accept
+_READ_ONLY_TABLE_FIELDS: FrozenSet[str] = frozenset({
+    'DatabaseName', 'CreateTime', 'UpdateTime', 'CreatedBy',
+    'IsRegisteredWithLakeFormation', 'CatalogId', 'VersionId'
+})
+
+# How long a fetched table definition is reused by update_table_metadata
+_TABLE_CACHE_TTL_SECONDS = 30.0
+
+
 class ResourceType(Enum):
     """Lake Formation resource types."""
     DATABASE = "DATABASE"
@@ -40,7 +138,7 @@ class ResourceType(Enum):
     CATALOG = "CATALOG"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AccessResult:
     """Result of access control operation."""
     success: bool
@@ -51,7 +149,7 @@ class AccessResult:
     timestamp: datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LineageResult:
     """Result of data lineage tracking operation."""
     success: bool
@@ -62,7 +160,7 @@ class LineageResult:
     timestamp: datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AuditResult:
     """Result of audit logging operation."""
     success: bool
@@ -80,7 +178,9 @@ class LakeFormationClient:
     def __init__(
         self,
         region_name: str = 'us-east-1',
-        profile_name: Optional[str] = None
+        profile_name: Optional[str] = None,
+        lineage_table_name: str = 'lake-formation-data-lineage',
+        max_pool_connections: int = 50
     ):
         """
         Initialize Lake Formation client.
@@ -88,22 +188,51 @@ class LakeFormationClient:
         Args:
             region_name: AWS region name
             profile_name: AWS profile name (optional)
+            lineage_table_name: DynamoDB table used to index data lineage
+            max_pool_connections: HTTP connection pool size per AWS client;
+                should cover the number of threads sharing the client
         """
         session_kwargs = {'region_name': region_name}
         if profile_name:
             session_kwargs['profile_name'] = profile_name
             
+        # Size the pool for the concurrent fan-out paths and use adaptive
+        # retries so throttling under load backs off instead of failing
+        client_config = Config(
+            max_pool_connections=max_pool_connections,
+            retries={'mode': 'adaptive', 'max_attempts': 5},
+            tcp_keepalive=True
+        )
+        
         session = boto3.Session(**session_kwargs)
-        self.lf_client = session.client('lakeformation')
-        self.glue_client = session.client('glue')
-        self.cloudwatch_client = session.client('logs')
+        self.lf_client = session.client('lakeformation', config=client_config)
+        self.glue_client = session.client('glue', config=client_config)
+        self.cloudwatch_client = session.client('logs', config=client_config)
+        self.dynamodb = session.resource('dynamodb', config=client_config)
         self.region_name = region_name
         
+        # CloudWatch keeps the lineage record of truth; DynamoDB indexes it
+        # for lookups when the table is available
+        self.lineage_table_name = lineage_table_name
+        self.lineage_table = self.dynamodb.Table(lineage_table_name)
+        
+        # Audit events from management calls are written off the request path
+        self._audit_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='lf-audit'
+        )
+        
+        # Stream format -> (day ordinal, stream name), rebuilt when the day rolls over
+        self._stream_name_cache: Dict[str, Tuple[int, str]] = {}
+        
+        # (database, table) -> (expiry, TableInput) for update_table_metadata
+        self._table_input_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+        
         # Initialize audit log group
         self.audit_log_group = '/aws/lakeformation/audit'
         self._ensure_log_group_exists()
+        self.create_lineage_table_if_not_exists()
         
-        logger.info(f"Initialized Lake Formation client in region {region_name}")
+        logger.info("Initialized Lake Formation client in region %s", region_name)
     
     def _ensure_log_group_exists(self):
         """Ensure CloudWatch log group exists for audit logging."""
@@ -111,12 +240,74 @@ class LakeFormationClient:
             self.cloudwatch_client.create_log_group(
                 logGroupName=self.audit_log_group
             )
-            logger.info(f"Created audit log group: {self.audit_log_group}")
+            logger.info("Created audit log group: %s", self.audit_log_group)
         except self.cloudwatch_client.exceptions.ResourceAlreadyExistsException:
-            logger.debug(f"Audit log group already exists: {self.audit_log_group}")
+            logger.debug("Audit log group already exists: %s", self.audit_log_group)
         except Exception as e:
-            logger.error(f"Error ensuring log group exists: {str(e)}")
+            logger.error("Error ensuring log group exists: %s", e)
 
+    def create_lineage_table_if_not_exists(self) -> bool:
+        """
+        Create the DynamoDB lineage table if it doesn't exist.
+        
+        The table is keyed by source (downstream lookups) with a global
+        secondary index on target (upstream lookups).
+        
+        Returns:
+            True if the table exists or was created, False otherwise
+        """
+        try:
+            self.dynamodb.create_table(
+                TableName=self.lineage_table_name,
+                KeySchema=[
+                    {'AttributeName': 'source', 'KeyType': 'HASH'},
+                    {'AttributeName': 'lineage_key', 'KeyType': 'RANGE'}
+                ],
+                AttributeDefinitions=[
+                    {'AttributeName': 'source', 'AttributeType': 'S'},
+                    {'AttributeName': 'target', 'AttributeType': 'S'},
+                    {'AttributeName': 'lineage_key', 'AttributeType': 'S'}
+                ],
+                GlobalSecondaryIndexes=[
+                    {
+                        'IndexName': _LINEAGE_TARGET_INDEX,
+                        'KeySchema': [
+                            {'AttributeName': 'target', 'KeyType': 'HASH'},
+                            {'AttributeName': 'lineage_key', 'KeyType': 'RANGE'}
+                        ],
+                        'Projection': {'ProjectionType': 'ALL'}
+                    }
+                ],
+                BillingMode='PAY_PER_REQUEST'
+            )
+            logger.info("Created lineage table: %s", self.lineage_table_name)
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ResourceInUseException':
+                logger.debug("Lineage table already exists: %s", self.lineage_table_name)
+                return True
+            logger.error("Error creating lineage table: %s", e)
+            return False
+        except BotoCoreError as e:
+            logger.error("Error creating lineage table: %s", e)
+            return False
+    
+    def _enqueue_audit(self, **audit_kwargs) -> None:
+        """
+        Record an audit event without blocking the caller.
+        
+        The CloudWatch write runs on a single background worker so
+        management calls return after their own AWS request completes.
+        
+        Args:
+            **audit_kwargs: Arguments for audit_data_access
+        """
+        try:
+            self._audit_executor.submit(self.audit_data_access, **audit_kwargs)
+        except RuntimeError:
+            # Executor already shut down (interpreter exit); log inline
+            self.audit_data_access(**audit_kwargs)
+    
     def register_data_location(
         self,
         s3_path: str,
@@ -139,29 +330,29 @@ class LakeFormationClient:
                 RoleArn=role_arn
             )
             
-            logger.info(f"Registered data location: {s3_path}")
-            
-            # Audit log the registration
-            self.audit_data_access(
-                user='system',
-                resource=s3_path,
-                action='REGISTER_LOCATION',
-                details={'role_arn': role_arn}
-            )
-            
-            return {
-                'success': True,
-                'resource_arn': s3_path,
-                'message': 'Data location registered successfully'
-            }
-            
         except Exception as e:
-            logger.error(f"Error registering data location {s3_path}: {str(e)}")
+            logger.error("Error registering data location %s: %s", s3_path, e)
             return {
                 'success': False,
                 'resource_arn': s3_path,
                 'message': f'Registration failed: {str(e)}'
             }
+        
+        logger.info("Registered data location: %s", s3_path)
+        
+        # Audit log the registration off the request path
+        self._enqueue_audit(
+            user='system',
+            resource=s3_path,
+            action='REGISTER_LOCATION',
+            details={'role_arn': role_arn}
+        )
+        
+        return {
+            'success': True,
+            'resource_arn': s3_path,
+            'message': 'Data location registered successfully'
+        }
     
     def deregister_data_location(self, s3_path: str) -> Dict[str, Any]:
         """
@@ -178,29 +369,29 @@ class LakeFormationClient:
                 ResourceArn=s3_path
             )
             
-            logger.info(f"Deregistered data location: {s3_path}")
-            
-            # Audit log the deregistration
-            self.audit_data_access(
-                user='system',
-                resource=s3_path,
-                action='DEREGISTER_LOCATION',
-                details={}
-            )
-            
-            return {
-                'success': True,
-                'resource_arn': s3_path,
-                'message': 'Data location deregistered successfully'
-            }
-            
         except Exception as e:
-            logger.error(f"Error deregistering data location {s3_path}: {str(e)}")
+            logger.error("Error deregistering data location %s: %s", s3_path, e)
             return {
                 'success': False,
                 'resource_arn': s3_path,
                 'message': f'Deregistration failed: {str(e)}'
             }
+        
+        logger.info("Deregistered data location: %s", s3_path)
+        
+        # Audit log the deregistration off the request path
+        self._enqueue_audit(
+            user='system',
+            resource=s3_path,
+            action='DEREGISTER_LOCATION',
+            details={}
+        )
+        
+        return {
+            'success': True,
+            'resource_arn': s3_path,
+            'message': 'Data location deregistered successfully'
+        }
     
     def grant_table_access(
         self,
@@ -225,14 +416,15 @@ class LakeFormationClient:
         """
         try:
             # Validate permissions
-            valid_permissions = [p.value for p in PermissionType]
-            invalid_perms = [p for p in permissions if p not in valid_permissions]
+            invalid_perms = [p for p in permissions if p not in _VALID_PERMISSIONS]
             if invalid_perms:
                 raise ValueError(f"Invalid permissions: {invalid_perms}")
             
+            principal_dict = {'DataLakePrincipalIdentifier': principal}
+            
             # Grant permissions
             response = self.lf_client.grant_permissions(
-                Principal={'DataLakePrincipalIdentifier': principal},
+                Principal=principal_dict,
                 Resource={
                     'Table': {
                         'DatabaseName': database_name,
@@ -243,34 +435,10 @@ class LakeFormationClient:
                 PermissionsWithGrantOption=permissions if grantable else []
             )
             
-            logger.info(
-                f"Granted permissions {permissions} on {database_name}.{table_name} "
-                f"to {principal}"
-            )
-            
-            # Audit log the grant
-            self.audit_data_access(
-                user=principal,
-                resource=f"{database_name}.{table_name}",
-                action='GRANT_PERMISSIONS',
-                details={
-                    'permissions': permissions,
-                    'grantable': grantable
-                }
-            )
-            
-            return AccessResult(
-                success=True,
-                principal=principal,
-                resource=f"{database_name}.{table_name}",
-                permissions=permissions,
-                message='Permissions granted successfully',
-                timestamp=datetime.utcnow()
-            )
-            
         except Exception as e:
             logger.error(
-                f"Error granting permissions on {database_name}.{table_name}: {str(e)}"
+                "Error granting permissions on %s.%s: %s",
+                database_name, table_name, e
             )
             return AccessResult(
                 success=False,
@@ -280,6 +448,139 @@ class LakeFormationClient:
                 message=f'Grant failed: {str(e)}',
                 timestamp=datetime.utcnow()
             )
+        
+        logger.info(
+            "Granted permissions %s on %s.%s to %s",
+            permissions, database_name, table_name, principal
+        )
+        
+        # Audit log the grant off the request path
+        self._enqueue_audit(
+            user=principal,
+            resource=f"{database_name}.{table_name}",
+            action='GRANT_PERMISSIONS',
+            details={
+                'permissions': permissions,
+                'grantable': grantable
+            }
+        )
+        
+        return AccessResult(
+            success=True,
+            principal=principal,
+            resource=f"{database_name}.{table_name}",
+            permissions=permissions,
+            message='Permissions granted successfully',
+            timestamp=datetime.utcnow()
+        )
+    
+    def grant_table_access_bulk(
+        self,
+        principal: str,
+        grants: List[Tuple[str, str, List[str]]],
+        grantable: bool = False
+    ) -> List[AccessResult]:
+        """
+        Grant table-level permissions on many tables to a principal.
+        
+        Grants are sent with BatchGrantPermissions in chunks of up to 20
+        entries and audited with a single record per chunk.
+        
+        Args:
+            principal: IAM user/role ARN or principal identifier
+            grants: List of (database_name, table_name, permissions) tuples
+            grantable: Whether principal can grant these permissions to others
+            
+        Returns:
+            AccessResult per grant, in the same order as grants
+        """
+        now = datetime.utcnow()
+        principal_dict = {'DataLakePrincipalIdentifier': principal}
+        results: List[Optional[AccessResult]] = [None] * len(grants)
+        entries = []
+        
+        for i, (database_name, table_name, permissions) in enumerate(grants):
+            invalid_perms = [p for p in permissions if p not in _VALID_PERMISSIONS]
+            if invalid_perms:
+                results[i] = AccessResult(
+                    success=False,
+                    principal=principal,
+                    resource=f"{database_name}.{table_name}",
+                    permissions=permissions,
+                    message=f'Grant failed: Invalid permissions: {invalid_perms}',
+                    timestamp=now
+                )
+                continue
+            
+            entries.append({
+                'Id': str(i),
+                'Principal': principal_dict,
+                'Resource': {
+                    'Table': {
+                        'DatabaseName': database_name,
+                        'Name': table_name
+                    }
+                },
+                'Permissions': permissions,
+                'PermissionsWithGrantOption': permissions if grantable else []
+            })
+        
+        for start in range(0, len(entries), _BATCH_GRANT_MAX_ENTRIES):
+            chunk = entries[start:start + _BATCH_GRANT_MAX_ENTRIES]
+            
+            try:
+                response = self.lf_client.batch_grant_permissions(Entries=chunk)
+                failures = {
+                    failure['RequestEntry']['Id']: failure.get('Error', {}).get(
+                        'ErrorMessage', 'Unknown error'
+                    )
+                    for failure in response.get('Failures', [])
+                }
+            except Exception as e:
+                logger.error("Error batch granting permissions to %s: %s", principal, e)
+                failures = {entry['Id']: str(e) for entry in chunk}
+            
+            granted = []
+            for entry in chunk:
+                i = int(entry['Id'])
+                database_name, table_name, permissions = grants[i]
+                resource = f"{database_name}.{table_name}"
+                
+                if entry['Id'] in failures:
+                    message = f"Grant failed: {failures[entry['Id']]}"
+                    success = False
+                else:
+                    message = 'Permissions granted successfully'
+                    success = True
+                    granted.append(resource)
+                
+                results[i] = AccessResult(
+                    success=success,
+                    principal=principal,
+                    resource=resource,
+                    permissions=permissions,
+                    message=message,
+                    timestamp=now
+                )
+            
+            logger.info(
+                "Batch granted permissions on %s/%s tables to %s",
+                len(granted), len(chunk), principal
+            )
+            
+            if granted:
+                # Audit log the batch as a single record off the request path
+                self._enqueue_audit(
+                    user=principal,
+                    resource=','.join(granted),
+                    action='BATCH_GRANT_PERMISSIONS',
+                    details={
+                        'table_count': len(granted),
+                        'grantable': grantable
+                    }
+                )
+        
+        return results
     
     def revoke_table_access(
         self,
@@ -312,31 +613,10 @@ class LakeFormationClient:
                 Permissions=permissions
             )
             
-            logger.info(
-                f"Revoked permissions {permissions} on {database_name}.{table_name} "
-                f"from {principal}"
-            )
-            
-            # Audit log the revocation
-            self.audit_data_access(
-                user=principal,
-                resource=f"{database_name}.{table_name}",
-                action='REVOKE_PERMISSIONS',
-                details={'permissions': permissions}
-            )
-            
-            return AccessResult(
-                success=True,
-                principal=principal,
-                resource=f"{database_name}.{table_name}",
-                permissions=permissions,
-                message='Permissions revoked successfully',
-                timestamp=datetime.utcnow()
-            )
-            
         except Exception as e:
             logger.error(
-                f"Error revoking permissions on {database_name}.{table_name}: {str(e)}"
+                "Error revoking permissions on %s.%s: %s",
+                database_name, table_name, e
             )
             return AccessResult(
                 success=False,
@@ -346,6 +626,28 @@ class LakeFormationClient:
                 message=f'Revoke failed: {str(e)}',
                 timestamp=datetime.utcnow()
             )
+        
+        logger.info(
+            "Revoked permissions %s on %s.%s from %s",
+            permissions, database_name, table_name, principal
+        )
+        
+        # Audit log the revocation off the request path
+        self._enqueue_audit(
+            user=principal,
+            resource=f"{database_name}.{table_name}",
+            action='REVOKE_PERMISSIONS',
+            details={'permissions': permissions}
+        )
+        
+        return AccessResult(
+            success=True,
+            principal=principal,
+            resource=f"{database_name}.{table_name}",
+            permissions=permissions,
+            message='Permissions revoked successfully',
+            timestamp=datetime.utcnow()
+        )
 
     def grant_database_access(
         self,
@@ -378,34 +680,10 @@ class LakeFormationClient:
                 PermissionsWithGrantOption=permissions if grantable else []
             )
             
-            logger.info(
-                f"Granted permissions {permissions} on database {database_name} "
-                f"to {principal}"
-            )
-            
-            # Audit log the grant
-            self.audit_data_access(
-                user=principal,
-                resource=database_name,
-                action='GRANT_DATABASE_PERMISSIONS',
-                details={
-                    'permissions': permissions,
-                    'grantable': grantable
-                }
-            )
-            
-            return AccessResult(
-                success=True,
-                principal=principal,
-                resource=database_name,
-                permissions=permissions,
-                message='Database permissions granted successfully',
-                timestamp=datetime.utcnow()
-            )
-            
         except Exception as e:
             logger.error(
-                f"Error granting database permissions on {database_name}: {str(e)}"
+                "Error granting database permissions on %s: %s",
+                database_name, e
             )
             return AccessResult(
                 success=False,
@@ -415,6 +693,31 @@ class LakeFormationClient:
                 message=f'Grant failed: {str(e)}',
                 timestamp=datetime.utcnow()
             )
+        
+        logger.info(
+            "Granted permissions %s on database %s to %s",
+            permissions, database_name, principal
+        )
+        
+        # Audit log the grant off the request path
+        self._enqueue_audit(
+            user=principal,
+            resource=database_name,
+            action='GRANT_DATABASE_PERMISSIONS',
+            details={
+                'permissions': permissions,
+                'grantable': grantable
+            }
+        )
+        
+        return AccessResult(
+            success=True,
+            principal=principal,
+            resource=database_name,
+            permissions=permissions,
+            message='Database permissions granted successfully',
+            timestamp=datetime.utcnow()
+        )
     
     def list_permissions(
         self,
@@ -424,6 +727,9 @@ class LakeFormationClient:
         """
         List Lake Formation permissions.
         
+        All result pages are read. Without a resource type, permissions on
+        every kind of resource (LF-tags and data cells included) are listed.
+        
         Args:
             principal: Filter by principal (optional)
             resource_type: Filter by resource type (optional)
@@ -435,20 +741,36 @@ class LakeFormationClient:
             kwargs = {}
             if principal:
                 kwargs['Principal'] = {'DataLakePrincipalIdentifier': principal}
+            
             if resource_type:
                 kwargs['ResourceType'] = resource_type
             
-            response = self.lf_client.list_permissions(**kwargs)
-            permissions = response.get('PrincipalResourcePermissions', [])
+            permissions = self._list_permissions_pages(**kwargs)
             
-            logger.info(f"Listed {len(permissions)} permission entries")
+            logger.info("Listed %s permission entries", len(permissions))
             
             return permissions
             
         except Exception as e:
-            logger.error(f"Error listing permissions: {str(e)}")
+            logger.error("Error listing permissions: %s", e)
             return []
     
+    def _list_permissions_pages(self, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Fetch all pages of list_permissions.
+        
+        Args:
+            **kwargs: list_permissions parameters
+            
+        Returns:
+            Permission entries across every page
+        """
+        paginator = self.lf_client.get_paginator('list_permissions')
+        permissions = []
+        for page in paginator.paginate(**kwargs):
+            permissions.extend(page.get('PrincipalResourcePermissions', []))
+        return permissions
+    
     def register_catalog_table(
         self,
         database_name: str,
@@ -492,28 +814,8 @@ class LakeFormationClient:
                 TableInput=table_input
             )
             
-            logger.info(f"Registered table {database_name}.{table_name} in catalog")
-            
-            # Audit log the registration
-            self.audit_data_access(
-                user='system',
-                resource=f"{database_name}.{table_name}",
-                action='REGISTER_TABLE',
-                details={
-                    's3_location': s3_location,
-                    'columns': len(columns)
-                }
-            )
-            
-            return {
-                'success': True,
-                'database': database_name,
-                'table': table_name,
-                'message': 'Table registered successfully'
-            }
-            
         except self.glue_client.exceptions.AlreadyExistsException:
-            logger.warning(f"Table {database_name}.{table_name} already exists")
+            logger.warning("Table %s.%s already exists", database_name, table_name)
             return {
                 'success': True,
                 'database': database_name,
@@ -521,19 +823,76 @@ class LakeFormationClient:
                 'message': 'Table already exists'
             }
         except Exception as e:
-            logger.error(f"Error registering table {database_name}.{table_name}: {str(e)}")
+            logger.error(
+                "Error registering table %s.%s: %s",
+                database_name, table_name, e
+            )
             return {
                 'success': False,
                 'database': database_name,
                 'table': table_name,
                 'message': f'Registration failed: {str(e)}'
             }
+        
+        logger.info("Registered table %s.%s in catalog", database_name, table_name)
+        
+        # Audit log the registration off the request path
+        self._enqueue_audit(
+            user='system',
+            resource=f"{database_name}.{table_name}",
+            action='REGISTER_TABLE',
+            details={
+                's3_location': s3_location,
+                'columns': len(columns)
+            }
+        )
+        
+        return {
+            'success': True,
+            'database': database_name,
+            'table': table_name,
+            'message': 'Table registered successfully'
+        }
+    
+    def _get_table_input(self, database_name: str, table_name: str) -> Dict[str, Any]:
+        """
+        Get a table's current definition as an update_table TableInput.
+        
+        Definitions are cached for a short TTL so back-to-back metadata
+        updates do not each pay for a get_table call.
+        
+        Args:
+            database_name: Glue database name
+            table_name: Table name
+            
+        Returns:
+            TableInput dictionary with read-only fields removed
+        """
+        cache_key = (database_name, table_name)
+        cached = self._table_input_cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
+        response = self.glue_client.get_table(
+            DatabaseName=database_name,
+            Name=table_name
+        )
+        table_input = {
+            k: v for k, v in response['Table'].items()
+            if k not in _READ_ONLY_TABLE_FIELDS
+        }
+        self._table_input_cache[cache_key] = (
+            time.monotonic() + _TABLE_CACHE_TTL_SECONDS, table_input
+        )
+        return table_input
     
     def update_table_metadata(
         self,
         database_name: str,
         table_name: str,
-        metadata: Dict[str, str]
+        metadata: Dict[str, str],
+        existing_table_input: Optional[Dict[str, Any]] = None,
+        version_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Update table metadata in the Glue Data Catalog.
@@ -542,60 +901,73 @@ class LakeFormationClient:
             database_name: Glue database name
             table_name: Table name
             metadata: Metadata key-value pairs to update
+            existing_table_input: Current table definition, if the caller
+                already has one (skips the get_table lookup)
+            version_id: Expected table VersionId; the update fails if the
+                table was modified since that version (optional)
             
         Returns:
             Update result
         """
+        cache_key = (database_name, table_name)
         try:
             # Get current table definition
-            response = self.glue_client.get_table(
-                DatabaseName=database_name,
-                Name=table_name
-            )
-            
-            table_input = response['Table']
+            if existing_table_input is not None:
+                current = {
+                    k: v for k, v in existing_table_input.items()
+                    if k not in _READ_ONLY_TABLE_FIELDS
+                }
+            else:
+                current = self._get_table_input(database_name, table_name)
             
-            # Remove read-only fields
-            for field in ['DatabaseName', 'CreateTime', 'UpdateTime', 'CreatedBy', 
-                         'IsRegisteredWithLakeFormation', 'CatalogId', 'VersionId']:
-                table_input.pop(field, None)
+            # Update parameters (metadata) without mutating the cached copy
+            table_input = {
+                **current,
+                'Parameters': {**current.get('Parameters', {}), **metadata}
+            }
             
-            # Update parameters (metadata)
-            if 'Parameters' not in table_input:
-                table_input['Parameters'] = {}
-            table_input['Parameters'].update(metadata)
+            update_kwargs = {
+                'DatabaseName': database_name,
+                'TableInput': table_input
+            }
+            if version_id:
+                update_kwargs['VersionId'] = version_id
             
             # Update table
-            self.glue_client.update_table(
-                DatabaseName=database_name,
-                TableInput=table_input
-            )
-            
-            logger.info(f"Updated metadata for {database_name}.{table_name}")
-            
-            # Audit log the update
-            self.audit_data_access(
-                user='system',
-                resource=f"{database_name}.{table_name}",
-                action='UPDATE_METADATA',
-                details={'metadata_keys': list(metadata.keys())}
+            self.glue_client.update_table(**update_kwargs)
+            self._table_input_cache[cache_key] = (
+                time.monotonic() + _TABLE_CACHE_TTL_SECONDS, table_input
             )
             
-            return {
-                'success': True,
-                'database': database_name,
-                'table': table_name,
-                'message': 'Metadata updated successfully'
-            }
-            
         except Exception as e:
-            logger.error(f"Error updating metadata for {database_name}.{table_name}: {str(e)}")
+            self._table_input_cache.pop(cache_key, None)
+            logger.error(
+                "Error updating metadata for %s.%s: %s",
+                database_name, table_name, e
+            )
             return {
                 'success': False,
                 'database': database_name,
                 'table': table_name,
                 'message': f'Update failed: {str(e)}'
             }
+        
+        logger.info("Updated metadata for %s.%s", database_name, table_name)
+        
+        # Audit log the update off the request path
+        self._enqueue_audit(
+            user='system',
+            resource=f"{database_name}.{table_name}",
+            action='UPDATE_METADATA',
+            details={'metadata_keys': list(metadata.keys())}
+        )
+        
+        return {
+            'success': True,
+            'database': database_name,
+            'table': table_name,
+            'message': 'Metadata updated successfully'
+        }
 
     def track_data_lineage(
         self,
@@ -616,26 +988,42 @@ class LakeFormationClient:
         Returns:
             LineageResult with tracking details
         """
+        now = datetime.utcnow()
         try:
-            lineage_id = f"{source}_{target}_{datetime.utcnow().isoformat()}"
+            now_iso = now.isoformat()
+            lineage_id = f"{source}_{target}_{now_iso}"
             
             lineage_data = {
                 'lineage_id': lineage_id,
                 'source': source,
                 'target': target,
                 'transformation': transformation,
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': now_iso,
                 'metadata': metadata or {}
             }
             
-            # Store lineage in CloudWatch Logs
-            log_stream_name = f"lineage/{datetime.utcnow().strftime('%Y/%m/%d')}"
+            # CloudWatch Logs holds every lineage record
+            log_stream_name = self._daily_stream_name(_LINEAGE_STREAM_FMT, now)
             self._write_to_cloudwatch(
                 log_stream_name,
-                lineage_data
+                lineage_data,
+                timestamp_ms=int(now.timestamp() * 1000)
             )
             
-            logger.info(f"Tracked lineage: {source} -> {target}")
+            # Index lineage in DynamoDB for source/target lookups; lookups
+            # fall back to the logs while the table is missing or unavailable
+            try:
+                self.lineage_table.put_item(
+                    Item={
+                        **lineage_data,
+                        'lineage_key': f"{now_iso}#{lineage_id}",
+                        'metadata': _json_dumps(lineage_data['metadata'])
+                    }
+                )
+            except (ClientError, BotoCoreError) as e:
+                logger.warning("Lineage not indexed in %s: %s", self.lineage_table_name, e)
+            
+            logger.info("Tracked lineage: %s -> %s", source, target)
             
             return LineageResult(
                 success=True,
@@ -643,18 +1031,18 @@ class LakeFormationClient:
                 target=target,
                 transformation=transformation,
                 lineage_id=lineage_id,
-                timestamp=datetime.utcnow()
+                timestamp=now
             )
             
         except Exception as e:
-            logger.error(f"Error tracking lineage: {str(e)}")
+            logger.error("Error tracking lineage: %s", e)
             return LineageResult(
                 success=False,
                 source=source,
                 target=target,
                 transformation=transformation,
                 lineage_id='',
-                timestamp=datetime.utcnow()
+                timestamp=now
             )
     
     def audit_data_access(
@@ -676,26 +1064,29 @@ class LakeFormationClient:
         Returns:
             AuditResult with audit log details
         """
+        now = datetime.utcnow()
         try:
-            audit_id = f"audit_{datetime.utcnow().timestamp()}"
+            now_ms = int(now.timestamp() * 1000)
+            audit_id = f"audit_{now_ms}_{next(_audit_id_counter)}"
             
             audit_data = {
                 'audit_id': audit_id,
                 'user': user,
                 'resource': resource,
                 'action': action,
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': now.isoformat(),
                 'details': details or {}
             }
             
             # Store audit log in CloudWatch Logs
-            log_stream_name = f"audit/{datetime.utcnow().strftime('%Y/%m/%d')}"
+            log_stream_name = self._daily_stream_name(_AUDIT_STREAM_FMT, now)
             self._write_to_cloudwatch(
                 log_stream_name,
-                audit_data
+                audit_data,
+                timestamp_ms=now_ms
             )
             
-            logger.info(f"Audit logged: {user} performed {action} on {resource}")
+            logger.info("Audit logged: %s performed %s on %s", user, action, resource)
             
             return AuditResult(
                 success=True,
@@ -703,26 +1094,49 @@ class LakeFormationClient:
                 user=user,
                 resource=resource,
                 action=action,
-                timestamp=datetime.utcnow(),
+                timestamp=now,
                 details=audit_data
             )
             
         except Exception as e:
-            logger.error(f"Error logging audit: {str(e)}")
+            logger.error("Error logging audit: %s", e)
             return AuditResult(
                 success=False,
                 audit_id='',
                 user=user,
                 resource=resource,
                 action=action,
-                timestamp=datetime.utcnow(),
+                timestamp=now,
                 details={'error': str(e)}
             )
     
+    def _daily_stream_name(self, stream_fmt: str, now: datetime) -> str:
+        """
+        Get the log stream name for the day of the given timestamp.
+        
+        The formatted name is cached and only rebuilt when the day changes.
+        
+        Args:
+            stream_fmt: Stream name format (_AUDIT_STREAM_FMT or _LINEAGE_STREAM_FMT)
+            now: Event timestamp
+            
+        Returns:
+            Log stream name such as audit/2025/01/15
+        """
+        day = now.toordinal()
+        cached = self._stream_name_cache.get(stream_fmt)
+        if cached and cached[0] == day:
+            return cached[1]
+        
+        stream_name = stream_fmt.format(now.strftime('%Y/%m/%d'))
+        self._stream_name_cache[stream_fmt] = (day, stream_name)
+        return stream_name
+    
     def _write_to_cloudwatch(
         self,
         log_stream_name: str,
-        log_data: Dict[str, Any]
+        log_data: Dict[str, Any],
+        timestamp_ms: Optional[int] = None
     ):
         """
         Write log data to CloudWatch Logs.
@@ -730,6 +1144,7 @@ class LakeFormationClient:
         Args:
             log_stream_name: CloudWatch log stream name
             log_data: Data to log
+            timestamp_ms: Event time in epoch milliseconds (defaults to now)
         """
         try:
             # Create log stream if it doesn't exist
@@ -742,20 +1157,86 @@ class LakeFormationClient:
                 pass
             
             # Put log event
-            import json
             self.cloudwatch_client.put_log_events(
                 logGroupName=self.audit_log_group,
                 logStreamName=log_stream_name,
                 logEvents=[
                     {
-                        'timestamp': int(datetime.utcnow().timestamp() * 1000),
-                        'message': json.dumps(log_data)
+                        'timestamp': (
+                            timestamp_ms if timestamp_ms is not None
+                            else int(datetime.utcnow().timestamp() * 1000)
+                        ),
+                        'message': _json_dumps(log_data)
                     }
                 ]
             )
             
         except Exception as e:
-            logger.error(f"Error writing to CloudWatch: {str(e)}")
+            logger.error("Error writing to CloudWatch: %s", e)
+    
+    def _filter_log_events(self, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Fetch all pages of filter_log_events from the audit log group.
+        
+        Args:
+            **kwargs: Additional filter_log_events parameters
+            
+        Returns:
+            List of log events across every page
+        """
+        paginator = self.cloudwatch_client.get_paginator('filter_log_events')
+        events = []
+        for page in paginator.paginate(logGroupName=self.audit_log_group, **kwargs):
+            events.extend(page.get('events', []))
+        return events
+    
+    def _filter_log_events_sharded(
+        self,
+        start_ms: int,
+        end_ms: int,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch log events for a time range, splitting it into concurrent shards.
+        
+        Args:
+            start_ms: Range start in epoch milliseconds
+            end_ms: Range end in epoch milliseconds
+            **kwargs: Additional filter_log_events parameters
+            
+        Returns:
+            List of log events ordered by timestamp
+        """
+        min_shard_ms = int(_MIN_LOG_QUERY_SHARD.total_seconds() * 1000)
+        span_ms = max(end_ms - start_ms, 0)
+        shard_count = max(1, min(_MAX_LOG_QUERY_WORKERS, span_ms // min_shard_ms))
+        
+        if shard_count == 1:
+            return self._filter_log_events(startTime=start_ms, endTime=end_ms, **kwargs)
+        
+        # Shard bounds are inclusive on both ends in CloudWatch, so each shard
+        # ends one millisecond before the next begins
+        shard_ms = -(-span_ms // shard_count)
+        bounds = []
+        for i in range(shard_count):
+            shard_start = start_ms + i * shard_ms
+            shard_end = end_ms if i == shard_count - 1 else shard_start + shard_ms - 1
+            bounds.append((shard_start, shard_end))
+        
+        with ThreadPoolExecutor(max_workers=len(bounds)) as executor:
+            futures = [
+                executor.submit(
+                    self._filter_log_events,
+                    startTime=shard_start,
+                    endTime=shard_end,
+                    **kwargs
+                )
+                for shard_start, shard_end in bounds
+            ]
+            events = [event for future in futures for event in future.result()]
+        
+        events.sort(key=lambda event: event['timestamp'])
+        return events
     
     def get_audit_logs(
         self,
@@ -777,20 +1258,34 @@ class LakeFormationClient:
             List of audit log entries
         """
         try:
-            import json
-            
-            # Query CloudWatch Logs
-            response = self.cloudwatch_client.filter_log_events(
-                logGroupName=self.audit_log_group,
-                startTime=int(start_time.timestamp() * 1000),
-                endTime=int(end_time.timestamp() * 1000),
-                filterPattern='audit'
+            clauses = []
+            if user:
+                clauses.append(('user', user))
+            if resource:
+                clauses.append(('resource', resource))
+            
+            # Query CloudWatch Logs, letting the service apply the filters
+            events = self._filter_log_events_sharded(
+                start_ms=int(start_time.timestamp() * 1000),
+                end_ms=int(end_time.timestamp() * 1000),
+                logStreamNamePrefix=_AUDIT_STREAM_PREFIX,
+                filterPattern=_json_filter_pattern(clauses)
             )
             
+            # Cheap substring checks reject non-matching events before parsing
+            needles = [
+                needle for needle in (_message_needle(user), _message_needle(resource))
+                if needle
+            ]
+            
             logs = []
-            for event in response.get('events', []):
+            for event in events:
+                message = event['message']
+                if any(needle not in message for needle in needles):
+                    continue
+                
                 try:
-                    log_data = json.loads(event['message'])
+                    log_data = _json_loads(message)
                     
                     # Apply filters
                     if user and log_data.get('user') != user:
@@ -802,13 +1297,65 @@ class LakeFormationClient:
                 except json.JSONDecodeError:
                     continue
             
-            logger.info(f"Retrieved {len(logs)} audit log entries")
+            logger.info("Retrieved %s audit log entries", len(logs))
             return logs
             
         except Exception as e:
-            logger.error(f"Error retrieving audit logs: {str(e)}")
+            logger.error("Error retrieving audit logs: %s", e)
             return []
     
+    def _query_lineage(self, key_condition, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Query all pages of the lineage table for a key condition.
+        
+        Args:
+            key_condition: boto3 key condition expression
+            **kwargs: Additional query parameters (e.g. IndexName)
+            
+        Returns:
+            List of lineage records in timestamp order
+        """
+        query_params = {'KeyConditionExpression': key_condition, **kwargs}
+        records = []
+        
+        while True:
+            response = self.lineage_table.query(**query_params)
+            for item in response.get('Items', []):
+                item.pop('lineage_key', None)
+                item['metadata'] = _json_loads(item.get('metadata') or '{}')
+                records.append(item)
+            
+            last_key = response.get('LastEvaluatedKey')
+            if not last_key:
+                return records
+            query_params['ExclusiveStartKey'] = last_key
+    
+    def _query_lineage_logs(self, field: str, resource: str) -> List[Dict[str, Any]]:
+        """
+        Scan the lineage log streams for records whose field equals a resource.
+        
+        Args:
+            field: 'source' or 'target'
+            resource: Resource identifier
+            
+        Returns:
+            List of lineage records in timestamp order
+        """
+        events = self._filter_log_events(
+            logStreamNamePrefix=_LINEAGE_STREAM_PREFIX,
+            filterPattern=_json_filter_pattern([(field, resource)])
+        )
+        
+        records = []
+        for event in events:
+            try:
+                lineage_data = _json_loads(event['message'])
+            except ValueError:
+                continue
+            if lineage_data.get(field) == resource:
+                records.append(lineage_data)
+        return records
+    
     def get_data_lineage(
         self,
         resource: str,
@@ -817,6 +1364,9 @@ class LakeFormationClient:
         """
         Get data lineage for a resource.
         
+        Lineage is looked up in the DynamoDB index, or in the lineage log
+        streams if the table cannot be queried.
+        
         Args:
             resource: Resource identifier
             direction: 'upstream', 'downstream', or 'both'
@@ -825,31 +1375,24 @@ class LakeFormationClient:
             Dictionary with upstream and/or downstream lineage
         """
         try:
-            import json
-            
-            # Query CloudWatch Logs for lineage
-            response = self.cloudwatch_client.filter_log_events(
-                logGroupName=self.audit_log_group,
-                filterPattern='lineage'
-            )
-            
             upstream = []
             downstream = []
             
-            for event in response.get('events', []):
-                try:
-                    lineage_data = json.loads(event['message'])
-                    
-                    if direction in ['upstream', 'both']:
-                        if lineage_data.get('target') == resource:
-                            upstream.append(lineage_data)
-                    
-                    if direction in ['downstream', 'both']:
-                        if lineage_data.get('source') == resource:
-                            downstream.append(lineage_data)
-                            
-                except json.JSONDecodeError:
-                    continue
+            try:
+                if direction in ['upstream', 'both']:
+                    upstream = self._query_lineage(
+                        Key('target').eq(resource),
+                        IndexName=_LINEAGE_TARGET_INDEX
+                    )
+                
+                if direction in ['downstream', 'both']:
+                    downstream = self._query_lineage(Key('source').eq(resource))
+            except (ClientError, BotoCoreError) as e:
+                logger.warning("Lineage table unavailable, querying logs: %s", e)
+                if direction in ['upstream', 'both']:
+                    upstream = self._query_lineage_logs('target', resource)
+                if direction in ['downstream', 'both']:
+                    downstream = self._query_lineage_logs('source', resource)
             
             result = {}
             if direction in ['upstream', 'both']:
@@ -858,12 +1401,106 @@ class LakeFormationClient:
                 result['downstream'] = downstream
             
             logger.info(
-                f"Retrieved lineage for {resource}: "
-                f"{len(upstream)} upstream, {len(downstream)} downstream"
+                "Retrieved lineage for %s: %s upstream, %s downstream",
+                resource, len(upstream), len(downstream)
             )
             
             return result
             
         except Exception as e:
-            logger.error(f"Error retrieving lineage: {str(e)}")
+            logger.error("Error retrieving lineage: %s", e)
             return {'upstream': [], 'downstream': []}
+
+
+class AsyncLakeFormationClient:
+    """
+    Asyncio facade over LakeFormationClient.
+    
+    Each call runs the blocking boto3 operation on the default executor so
+    async callers (FastAPI handlers, ingestion pipelines) can overlap many
+    grants or lookups with asyncio.gather instead of serializing them.
+    """
+    
+    def __init__(
+        self,
+        region_name: str = 'us-east-1',
+        profile_name: Optional[str] = None,
+        client: Optional[LakeFormationClient] = None,
+        **client_kwargs
+    ):
+        """
+        Initialize async Lake Formation client.
+        
+        Args:
+            region_name: AWS region name
+            profile_name: AWS profile name (optional)
+            client: Existing synchronous client to wrap (optional)
+            **client_kwargs: Extra LakeFormationClient arguments
+        """
+        self.client = client or LakeFormationClient(
+            region_name=region_name,
+            profile_name=profile_name,
+            **client_kwargs
+        )
+    
+    async def _run(self, method_name: str, *args, **kwargs) -> Any:
+        """Run a LakeFormationClient method in a worker thread."""
+        return await asyncio.to_thread(
+            getattr(self.client, method_name), *args, **kwargs
+        )
+    
+    async def create_lineage_table_if_not_exists(self) -> bool:
+        """Async variant of LakeFormationClient.create_lineage_table_if_not_exists."""
+        return await self._run('create_lineage_table_if_not_exists')
+    
+    async def register_data_location(self, *args, **kwargs) -> Dict[str, Any]:
+        """Async variant of LakeFormationClient.register_data_location."""
+        return await self._run('register_data_location', *args, **kwargs)
+    
+    async def deregister_data_location(self, *args, **kwargs) -> Dict[str, Any]:
+        """Async variant of LakeFormationClient.deregister_data_location."""
+        return await self._run('deregister_data_location', *args, **kwargs)
+    
+    async def grant_table_access(self, *args, **kwargs) -> AccessResult:
+        """Async variant of LakeFormationClient.grant_table_access."""
+        return await self._run('grant_table_access', *args, **kwargs)
+    
+    async def grant_table_access_bulk(self, *args, **kwargs) -> List[AccessResult]:
+        """Async variant of LakeFormationClient.grant_table_access_bulk."""
+        return await self._run('grant_table_access_bulk', *args, **kwargs)
+    
+    async def revoke_table_access(self, *args, **kwargs) -> AccessResult:
+        """Async variant of LakeFormationClient.revoke_table_access."""
+        return await self._run('revoke_table_access', *args, **kwargs)
+    
+    async def grant_database_access(self, *args, **kwargs) -> AccessResult:
+        """Async variant of LakeFormationClient.grant_database_access."""
+        return await self._run('grant_database_access', *args, **kwargs)
+    
+    async def list_permissions(self, *args, **kwargs) -> List[Dict[str, Any]]:
+        """Async variant of LakeFormationClient.list_permissions."""
+        return await self._run('list_permissions', *args, **kwargs)
+    
+    async def register_catalog_table(self, *args, **kwargs) -> Dict[str, Any]:
+        """Async variant of LakeFormationClient.register_catalog_table."""
+        return await self._run('register_catalog_table', *args, **kwargs)
+    
+    async def update_table_metadata(self, *args, **kwargs) -> Dict[str, Any]:
+        """Async variant of LakeFormationClient.update_table_metadata."""
+        return await self._run('update_table_metadata', *args, **kwargs)
+    
+    async def track_data_lineage(self, *args, **kwargs) -> LineageResult:
+        """Async variant of LakeFormationClient.track_data_lineage."""
+        return await self._run('track_data_lineage', *args, **kwargs)
+    
+    async def audit_data_access(self, *args, **kwargs) -> AuditResult:
+        """Async variant of LakeFormationClient.audit_data_access."""
+        return await self._run('audit_data_access', *args, **kwargs)
+    
+    async def get_audit_logs(self, *args, **kwargs) -> List[Dict[str, Any]]:
+        """Async variant of LakeFormationClient.get_audit_logs."""
+        return await self._run('get_audit_logs', *args, **kwargs)
+    
+    async def get_data_lineage(self, *args, **kwargs) -> Dict[str, List[Dict[str, Any]]]:
+        """Async variant of LakeFormationClient.get_data_lineage."""
+        return await self._run('get_data_lineage', *args, **kwargs)
@@ -1,12 +1,23 @@
 """
 Deployment utilities for AWS Lambda functions.
 """
+import asyncio
+import base64
+import functools
+import hashlib
+import io
 import json
+import tempfile
+import threading
+import time
 import zipfile
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Collection, Dict, List, Optional, Any, Sequence, Tuple
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import structlog
 
@@ -14,6 +25,193 @@ from ..config.settings import settings
 
 logger = structlog.get_logger(__name__)
 
+# Function deployments are submitted in batches of this size with a short
+# pause between batches to stay under Lambda's CreateFunction rate limits
+DEPLOY_BATCH_SIZE = 10
+DEPLOY_BATCH_PAUSE_SECONDS = 1.0
+
+# Lambda functions deployed for Kinesis stream processing
+KINESIS_FUNCTIONS_CONFIG: List[Dict[str, Any]] = [
+    {
+        'name': 'kinesis-stream-processor',
+        'handler': 'lambda_functions.kinesis_stream_processor_handler',
+        'description': 'Process concert data from Kinesis stream',
+        'timeout': 300,
+        'memory_size': 512
+    },
+    {
+        'name': 'data-quality-processor',
+        'handler': 'lambda_functions.data_quality_processor_handler',
+        'description': 'Validate and monitor data quality',
+        'timeout': 180,
+        'memory_size': 256
+    },
+    {
+        'name': 'stream-analytics-processor',
+        'handler': 'lambda_functions.stream_analytics_processor_handler',
+        'description': 'Real-time analytics on stream data',
+        'timeout': 240,
+        'memory_size': 384
+    }
+]
+
+# Configuration bundled alongside each function as config.json. The values
+# come from settings and don't change per call, so it is encoded once here.
+# Dependencies would be handled by Lambda layers in production.
+_PACKAGE_CONFIG_JSON = json.dumps({
+    "aws_region": settings.aws.region,
+    "kinesis_stream_name": settings.aws.kinesis_stream_name,
+    "s3_bucket_raw": settings.aws.s3_bucket_raw,
+    "s3_bucket_processed": settings.aws.s3_bucket_processed
+}).encode('utf-8')
+
+# Environment every deployed function receives; values come from settings
+_BASE_ENV: Dict[str, str] = {
+    'AWS_REGION': settings.aws.region,
+    'KINESIS_STREAM_NAME': settings.aws.kinesis_stream_name,
+    'S3_BUCKET_RAW': settings.aws.s3_bucket_raw,
+    'S3_BUCKET_PROCESSED': settings.aws.s3_bucket_processed
+}
+
+# Trust policy allowing Lambda to assume the execution role
+_TRUST_POLICY_JSON = json.dumps({
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Effect": "Allow",
+            "Principal": {
+                "Service": "lambda.amazonaws.com"
+            },
+            "Action": "sts:AssumeRole"
+        }
+    ]
+})
+
+# Managed policies attached to the execution role
+_LAMBDA_MANAGED_POLICIES = (
+    'arn:aws:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole',
+    'arn:aws:iam::aws:policy/service-role/AWSLambdaKinesisExecutionRole',
+    'arn:aws:iam::aws:policy/AmazonS3FullAccess'  # For writing processed data
+)
+
+# Fingerprints of the last successful deploy per function; when code and
+# configuration are unchanged the deploy is skipped without any API calls
+DEPLOY_CACHE_DIR = Path.home() / '.cache' / 'lambda_deploy'
+
+# Packages above this size are staged in S3 and referenced by bucket/key
+# instead of being sent inline in the CreateFunction request body
+S3_STAGING_THRESHOLD_BYTES = 3 * 1024 * 1024
+# Archives are assembled in memory up to this size and spill to a temporary
+# file beyond it, so large packages aren't held in memory twice while building
+PACKAGE_SPOOL_MAX_BYTES = 32 * 1024 * 1024
+_STAGING_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=5 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True
+)
+
+# A newly created IAM role takes a few seconds before Lambda can assume it;
+# create_function is retried with exponential backoff until it is accepted
+ROLE_PROPAGATION_TIMEOUT_SECONDS = 30.0
+ROLE_PROPAGATION_INITIAL_DELAY = 0.25
+ROLE_PROPAGATION_MAX_DELAY = 4.0
+
+# Resolved execution role ARNs are reused for this long before IAM is
+# consulted again
+ROLE_CACHE_TTL_SECONDS = 300.0
+
+# Existing event source mapping lookups are reused for this long so repeated
+# conflicts during retries don't re-list mappings on every attempt
+MAPPING_CACHE_TTL_SECONDS = 60.0
+
+# Function listings are read-heavy during validation and status checks
+FUNCTION_LIST_CACHE_TTL_SECONDS = 60.0
+
+
+# Upper bounds on in-flight control-plane calls from concurrent deploy paths,
+# shared by every deployer in the process
+MAX_CONCURRENT_IAM_CALLS = 5
+MAX_CONCURRENT_LAMBDA_DEPLOYS = 10
+_iam_call_slots = threading.BoundedSemaphore(MAX_CONCURRENT_IAM_CALLS)
+_lambda_deploy_slots = threading.BoundedSemaphore(MAX_CONCURRENT_LAMBDA_DEPLOYS)
+
+
+# Shared configuration for deployment clients: a pool large enough for the
+# concurrent deploy paths, keepalive to reuse connections, and adaptive
+# retries to back off under control-plane throttling
+_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={'max_attempts': 15, 'mode': 'adaptive'},
+    connect_timeout=5,
+    read_timeout=30
+)
+
+_shared_clients: Dict[str, Any] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _log_retries(parsed: Optional[Dict[str, Any]] = None, model: Any = None, **kwargs):
+    """Log calls that needed retries so throttling hot spots are visible."""
+    retry_attempts = (parsed or {}).get('ResponseMetadata', {}).get('RetryAttempts', 0)
+    if retry_attempts:
+        logger.warning(
+            "AWS call retried",
+            operation=getattr(model, 'name', None),
+            retry_attempts=retry_attempts,
+            error_code=parsed.get('Error', {}).get('Code')
+        )
+
+
+def _get_shared_client(service_name: str) -> Any:
+    """
+    Get the process-wide boto3 client for a service, creating it on first use.
+    
+    boto3 clients are thread-safe, so every LambdaDeployer reuses the same
+    client and its connection pool instead of opening new connections.
+    
+    Args:
+        service_name: AWS service name (e.g. 'lambda', 'iam')
+        
+    Returns:
+        boto3 client
+    """
+    client = _shared_clients.get(service_name)
+    if client is None:
+        with _shared_clients_lock:
+            client = _shared_clients.get(service_name)
+            if client is None:
+                client = boto3.client(
+                    service_name,
+                    config=_CLIENT_CONFIG,
+                    **settings.get_aws_credentials()
+                )
+                client.meta.events.register('after-call', _log_retries)
+                _shared_clients[service_name] = client
+    return client
+
+
+_account_id: Optional[str] = None
+_account_id_lock = threading.Lock()
+
+
+def _get_account_id(sts_client: Any) -> str:
+    """
+    Get the AWS account id for the current credentials, resolved once per process.
+    
+    Args:
+        sts_client: STS client used for the first lookup
+        
+    Returns:
+        12-digit AWS account id
+    """
+    global _account_id
+    if _account_id is None:
+        with _account_id_lock:
+            if _account_id is None:
+                _account_id = sts_client.get_caller_identity()['Account']
+    return _account_id
+
 
 class LambdaDeploymentError(Exception):
     """Custom exception for Lambda deployment operations."""
@@ -25,15 +223,45 @@ class LambdaDeployer:
     Utility class for deploying Lambda functions for Kinesis stream processing.
     """
     
-    def __init__(self):
+    # role_name -> (role_arn, resolved_at); shared across deployers
+    _role_cache: Dict[str, Tuple[str, float]] = {}
+    _role_cache_lock = threading.Lock()
+    
+    def __init__(
+        self,
+        lambda_client: Optional[Any] = None,
+        iam_client: Optional[Any] = None,
+        s3_client: Optional[Any] = None,
+        staging_bucket: Optional[str] = None,
+        sts_client: Optional[Any] = None
+    ):
+        """
+        Initialize the deployer.
+        
+        Args:
+            lambda_client: Lambda client override (defaults to the shared client)
+            iam_client: IAM client override (defaults to the shared client)
+            s3_client: S3 client override (defaults to the shared client)
+            staging_bucket: S3 bucket for large deployment packages
+                (defaults to the raw data bucket)
+            sts_client: STS client override (defaults to the shared client)
+        """
         self.logger = structlog.get_logger("LambdaDeployer")
+        self.staging_bucket = staging_bucket or settings.aws.s3_bucket_raw
+        self._staging_lock = threading.Lock()
+        self._staging_bucket_ready = False
+        self._staged_keys: set = set()
+        # (stream_arn, function_name) -> (mapping_uuid, fetched_at)
+        self._mapping_cache: Dict[Tuple[str, str], Tuple[Optional[str], float]] = {}
+        # requested names (None for all) -> (functions, fetched_at)
+        self._function_list_cache: Dict[Optional[Tuple[str, ...]], Tuple[List[Dict[str, Any]], float]] = {}
         
         # Initialize AWS clients
         try:
-            aws_credentials = settings.get_aws_credentials()
-            self.lambda_client = boto3.client('lambda', **aws_credentials)
-            self.iam_client = boto3.client('iam', **aws_credentials)
-            self.s3_client = boto3.client('s3', **aws_credentials)
+            self.lambda_client = lambda_client or _get_shared_client('lambda')
+            self.iam_client = iam_client or _get_shared_client('iam')
+            self.s3_client = s3_client or _get_shared_client('s3')
+            self.sts_client = sts_client or _get_shared_client('sts')
             self.logger.info("Lambda deployment clients initialized")
         except Exception as e:
             self.logger.error("Failed to initialize Lambda deployment clients", error=str(e))
@@ -43,55 +271,89 @@ class LambdaDeployer:
         """
         Create IAM role for Lambda execution with necessary permissions.
         
+        The role is looked up first and only created if it doesn't exist yet.
+        Resolved role ARNs are cached for ROLE_CACHE_TTL_SECONDS, so repeated
+        deploys in the same process skip the IAM round trips.
+        
         Args:
             role_name: Name for the IAM role
             
         Returns:
             ARN of the created role
         """
-        trust_policy = {
-            "Version": "2012-10-17",
-            "Statement": [
-                {
-                    "Effect": "Allow",
-                    "Principal": {
-                        "Service": "lambda.amazonaws.com"
-                    },
-                    "Action": "sts:AssumeRole"
-                }
-            ]
-        }
+        cached = self._cached_role_arn(role_name)
+        if cached:
+            return cached
+        
+        with self._role_cache_lock:
+            cached = self._cached_role_arn(role_name)
+            if cached:
+                return cached
+            
+            role_arn = self._get_or_create_role(role_name)
+            self._role_cache[role_name] = (role_arn, time.monotonic())
+            return role_arn
+    
+    def _cached_role_arn(self, role_name: str) -> Optional[str]:
+        """Return the cached role ARN if it is still fresh."""
+        entry = self._role_cache.get(role_name)
+        if entry and time.monotonic() - entry[1] < ROLE_CACHE_TTL_SECONDS:
+            return entry[0]
+        return None
+    
+    def _get_or_create_role(self, role_name: str) -> str:
+        """
+        Look up the execution role's ARN, creating the role if it doesn't exist.
+        
+        Args:
+            role_name: Name for the IAM role
+            
+        Returns:
+            ARN of the role
+            
+        Raises:
+            LambdaDeploymentError: If the role can't be resolved or is left
+                without its managed policies
+        """
+        try:
+            response = self.iam_client.get_role(RoleName=role_name)
+            role_arn = response['Role']['Arn']
+            self.logger.info("Lambda execution role already exists", role_name=role_name, role_arn=role_arn)
+            
+            # Repair a role whose policies failed to attach on an earlier run
+            attached = {
+                policy['PolicyArn']
+                for page in self.iam_client.get_paginator('list_attached_role_policies').paginate(RoleName=role_name)
+                for policy in page['AttachedPolicies']
+            }
+            self._ensure_role_policies(role_name, attached)
+            return role_arn
+        except LambdaDeploymentError:
+            raise
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'NoSuchEntity':
+                error_msg = f"Failed to look up Lambda execution role: {str(e)}"
+                self.logger.error(error_msg, role_name=role_name)
+                raise LambdaDeploymentError(error_msg)
+        except Exception as e:
+            error_msg = f"Unexpected error looking up Lambda execution role: {str(e)}"
+            self.logger.error(error_msg, role_name=role_name)
+            raise LambdaDeploymentError(error_msg)
         
         try:
             # Create the role
             response = self.iam_client.create_role(
                 RoleName=role_name,
-                AssumeRolePolicyDocument=json.dumps(trust_policy),
+                AssumeRolePolicyDocument=_TRUST_POLICY_JSON,
                 Description="Execution role for Kinesis stream processing Lambda functions"
             )
             
             role_arn = response['Role']['Arn']
             self.logger.info("Lambda execution role created", role_name=role_name, role_arn=role_arn)
             
-            # Attach necessary policies
-            policies = [
-                'arn:aws:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole',
-                'arn:aws:iam::aws:policy/service-role/AWSLambdaKinesisExecutionRole',
-                'arn:aws:iam::aws:policy/AmazonS3FullAccess'  # For writing processed data
-            ]
-            
-            for policy_arn in policies:
-                self.iam_client.attach_role_policy(
-                    RoleName=role_name,
-                    PolicyArn=policy_arn
-                )
-                self.logger.info("Policy attached to role", role_name=role_name, policy_arn=policy_arn)
-            
-            return role_arn
-            
         except ClientError as e:
             if e.response['Error']['Code'] == 'EntityAlreadyExists':
-                # Role already exists, get its ARN
+                # Created concurrently by another deployer, get its ARN
                 response = self.iam_client.get_role(RoleName=role_name)
                 role_arn = response['Role']['Arn']
                 self.logger.info("Lambda execution role already exists", role_name=role_name, role_arn=role_arn)
@@ -104,11 +366,79 @@ class LambdaDeployer:
             error_msg = f"Unexpected error creating Lambda execution role: {str(e)}"
             self.logger.error(error_msg, role_name=role_name)
             raise LambdaDeploymentError(error_msg)
+        
+        self._ensure_role_policies(role_name)
+        
+        return role_arn
+    
+    def _ensure_role_policies(self, role_name: str, attached: Collection[str] = ()):
+        """
+        Attach the managed policies a role is missing, retrying failures once.
+        
+        Args:
+            role_name: Name of the IAM role
+            attached: ARNs of the policies already attached to the role
+            
+        Raises:
+            LambdaDeploymentError: If any policy still fails to attach
+        """
+        missing = [policy_arn for policy_arn in _LAMBDA_MANAGED_POLICIES if policy_arn not in attached]
+        for _ in range(2):
+            if not missing:
+                return
+            missing = self._attach_role_policies(role_name, missing)
+        
+        error_msg = f"Failed to attach policies to Lambda execution role: {', '.join(missing)}"
+        self.logger.error(error_msg, role_name=role_name)
+        raise LambdaDeploymentError(error_msg)
+    
+    def _attach_role_policies(self, role_name: str, policies: Sequence[str]) -> List[str]:
+        """
+        Attach managed policies to a role concurrently.
+        
+        A failed attach is logged and does not abort the others.
+        
+        Args:
+            role_name: Name of the IAM role
+            policies: ARNs of the managed policies to attach
+            
+        Returns:
+            ARNs of the policies that failed to attach
+        """
+        failed = []
+        
+        def attach(policy_arn: str):
+            with _iam_call_slots:
+                self.iam_client.attach_role_policy(RoleName=role_name, PolicyArn=policy_arn)
+        
+        with ThreadPoolExecutor(max_workers=len(policies)) as executor:
+            futures = {
+                executor.submit(attach, policy_arn): policy_arn
+                for policy_arn in policies
+            }
+            for future in as_completed(futures):
+                policy_arn = futures[future]
+                try:
+                    future.result()
+                    self.logger.info("Policy attached to role", role_name=role_name, policy_arn=policy_arn)
+                except Exception as e:
+                    failed.append(policy_arn)
+                    self.logger.error(
+                        "Failed to attach policy to role",
+                        role_name=role_name,
+                        policy_arn=policy_arn,
+                        error=str(e)
+                    )
+        
+        return failed
     
     def create_deployment_package(self, function_file: str, package_name: str) -> bytes:
         """
         Create deployment package (ZIP file) for Lambda function.
         
+        Packages are cached per source file modification time and
+        configuration, so repeated calls with unchanged inputs skip zipping.
+        
         Args:
             function_file: Path to the Python file containing the Lambda function
             package_name: Name for the deployment package
@@ -117,34 +447,18 @@ class LambdaDeployer:
             ZIP file content as bytes
         """
         try:
-            # Create a temporary ZIP file in memory
-            import io
-            zip_buffer = io.BytesIO()
-            
-            with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                # Add the main function file
-                function_path = Path(function_file)
-                if function_path.exists():
-                    zip_file.write(function_path, function_path.name)
-                    self.logger.info("Added function file to package", file=function_file)
-                else:
-                    raise LambdaDeploymentError(f"Function file not found: {function_file}")
-                
-                # Add dependencies (requirements would be handled by Lambda layers in production)
-                # For this demo, we'll include minimal dependencies
-                
-                # Add configuration
-                config_content = json.dumps({
-                    "aws_region": settings.aws.region,
-                    "kinesis_stream_name": settings.aws.kinesis_stream_name,
-                    "s3_bucket_raw": settings.aws.s3_bucket_raw,
-                    "s3_bucket_processed": settings.aws.s3_bucket_processed
-                })
-                
-                zip_file.writestr("config.json", config_content)
-                self.logger.info("Added configuration to package")
+            function_path = Path(function_file)
+            try:
+                source_stat = function_path.stat()
+            except FileNotFoundError:
+                raise LambdaDeploymentError(f"Function file not found: {function_file}")
             
-            zip_content = zip_buffer.getvalue()
+            zip_content = self._build_package_cached(
+                str(function_path),
+                source_stat.st_mtime_ns,
+                source_stat.st_size,
+                _PACKAGE_CONFIG_JSON
+            )
             self.logger.info("Deployment package created", package_name=package_name, size_bytes=len(zip_content))
             
             return zip_content
@@ -154,6 +468,48 @@ class LambdaDeployer:
             self.logger.error(error_msg, function_file=function_file)
             raise LambdaDeploymentError(error_msg)
     
+    @classmethod
+    @functools.lru_cache(maxsize=8)
+    def _build_package_cached(
+        cls,
+        function_file: str,
+        mtime_ns: int,
+        size: int,
+        config_content: bytes
+    ) -> bytes:
+        """
+        Build the deployment ZIP for a function file and configuration.
+        
+        The modification time and size are part of the cache key so edits to
+        the source invalidate the cached package, even on filesystems with
+        coarse timestamps. Cache hits return the same immutable bytes object,
+        so every function deployed from one source shares a single buffer.
+        
+        Args:
+            function_file: Path to the Python file containing the Lambda function
+            mtime_ns: Modification time of function_file in nanoseconds
+            size: Size of function_file in bytes
+            config_content: Encoded JSON configuration written to config.json
+            
+        Returns:
+            ZIP file content as bytes
+        """
+        function_path = Path(function_file)
+        
+        with tempfile.SpooledTemporaryFile(max_size=PACKAGE_SPOOL_MAX_BYTES) as spool:
+            # Entries are stored uncompressed; for a few KB of source, DEFLATE
+            # costs more CPU than it saves in upload size. ZipFile.write copies
+            # the source in chunks rather than reading it whole.
+            with zipfile.ZipFile(spool, 'w', zipfile.ZIP_STORED) as zip_file:
+                zip_file.write(function_path, function_path.name)
+                zip_file.writestr("config.json", config_content)
+            
+            spool.seek(0)
+            zip_content = spool.read()
+        
+        logger.info("Built deployment package", file=function_file)
+        return zip_content
+    
     def deploy_lambda_function(
         self,
         function_name: str,
@@ -182,28 +538,35 @@ class LambdaDeployer:
             ARN of the deployed function
         """
         try:
-            # Prepare environment variables
-            env_vars = environment_variables or {}
-            env_vars.update({
-                'AWS_REGION': settings.aws.region,
-                'KINESIS_STREAM_NAME': settings.aws.kinesis_stream_name,
-                'S3_BUCKET_RAW': settings.aws.s3_bucket_raw,
-                'S3_BUCKET_PROCESSED': settings.aws.s3_bucket_processed
-            })
+            # Settings-derived variables take precedence over caller-supplied ones
+            env_vars = {**(environment_variables or {}), **_BASE_ENV}
+            configuration = {
+                'Role': role_arn,
+                'Handler': handler,
+                'Description': description,
+                'Timeout': timeout,
+                'MemorySize': memory_size,
+                'Environment': {'Variables': env_vars}
+            }
+            
+            # Same encoding Lambda reports as CodeSha256
+            code_sha256 = base64.b64encode(hashlib.sha256(zip_content).digest()).decode('ascii')
+            fingerprint = self._deploy_fingerprint(code_sha256, configuration)
+            
+            if self._read_deploy_cache(function_name, fingerprint):
+                function_arn = self._deployed_function_arn(function_name, code_sha256, configuration)
+                if function_arn:
+                    self.logger.info("Lambda function unchanged since last deploy", function_name=function_name)
+                    return function_arn
             
             # Try to create the function
             try:
-                response = self.lambda_client.create_function(
+                response = self._create_function_when_role_ready(
                     FunctionName=function_name,
                     Runtime='python3.9',
-                    Role=role_arn,
-                    Handler=handler,
-                    Code={'ZipFile': zip_content},
-                    Description=description,
-                    Timeout=timeout,
-                    MemorySize=memory_size,
-                    Environment={'Variables': env_vars},
-                    Publish=True
+                    Code=self._get_code_location(zip_content),
+                    Publish=True,
+                    **configuration
                 )
                 
                 function_arn = response['FunctionArn']
@@ -214,28 +577,17 @@ class LambdaDeployer:
                     # Function already exists, update it
                     self.logger.info("Function already exists, updating", function_name=function_name)
                     
-                    # Update function code
-                    self.lambda_client.update_function_code(
-                        FunctionName=function_name,
-                        ZipFile=zip_content
-                    )
-                    
-                    # Update function configuration
-                    response = self.lambda_client.update_function_configuration(
-                        FunctionName=function_name,
-                        Role=role_arn,
-                        Handler=handler,
-                        Description=description,
-                        Timeout=timeout,
-                        MemorySize=memory_size,
-                        Environment={'Variables': env_vars}
+                    function_arn = self._update_existing_function(
+                        function_name,
+                        zip_content,
+                        code_sha256,
+                        configuration
                     )
-                    
-                    function_arn = response['FunctionArn']
                     self.logger.info("Lambda function updated", function_name=function_name, function_arn=function_arn)
                 else:
                     raise
             
+            self._write_deploy_cache(function_name, fingerprint, function_arn)
             return function_arn
             
         except ClientError as e:
@@ -246,35 +598,337 @@ class LambdaDeployer:
             error_msg = f"Unexpected error deploying Lambda function: {str(e)}"
             self.logger.error(error_msg, function_name=function_name)
             raise LambdaDeploymentError(error_msg)
+        finally:
+            # Even a failed deploy may have created or changed the function
+            self._function_list_cache.clear()
+    
+    def delete_lambda_function(self, function_name: str) -> bool:
+        """
+        Delete a Lambda function and forget any cached state for it.
+        
+        Args:
+            function_name: Name of the Lambda function
+            
+        Returns:
+            True if the function was deleted, False if it did not exist
+        """
+        try:
+            self.lambda_client.delete_function(FunctionName=function_name)
+            self.logger.info("Lambda function deleted", function_name=function_name)
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ResourceNotFoundException':
+                return False
+            error_msg = f"Failed to delete Lambda function: {str(e)}"
+            self.logger.error(error_msg, function_name=function_name)
+            raise LambdaDeploymentError(error_msg)
+        finally:
+            self._function_list_cache.clear()
+            (DEPLOY_CACHE_DIR / f"{function_name}.json").unlink(missing_ok=True)
+    
+    def _update_existing_function(
+        self,
+        function_name: str,
+        zip_content: bytes,
+        code_sha256: str,
+        configuration: Dict[str, Any]
+    ) -> str:
+        """
+        Update an existing function's code and configuration where they changed.
+        
+        The code upload is skipped when the deployed CodeSha256 already
+        matches the package. Updates are conditioned on the function's
+        RevisionId, so a concurrent deploy makes this fail instead of
+        silently overwriting it.
+        
+        Args:
+            function_name: Name of the Lambda function
+            zip_content: ZIP file content
+            code_sha256: Base64-encoded SHA-256 of zip_content
+            configuration: Desired Role, Handler, Description, Timeout,
+                MemorySize and Environment
+            
+        Returns:
+            ARN of the updated function
+        """
+        response = self.lambda_client.get_function_configuration(FunctionName=function_name)
+        configuration_changed = self._configuration_changed(response, configuration)
+        
+        if response.get('CodeSha256') == code_sha256:
+            self.logger.info("Function code unchanged", function_name=function_name)
+        else:
+            response = self.lambda_client.update_function_code(
+                FunctionName=function_name,
+                RevisionId=response['RevisionId'],
+                **self._get_code_location(zip_content)
+            )
+            
+            if configuration_changed:
+                # Lambda rejects a configuration update while the code update
+                # is still in progress
+                self.lambda_client.get_waiter('function_updated').wait(
+                    FunctionName=function_name,
+                    WaiterConfig={'Delay': 1, 'MaxAttempts': 60}
+                )
+        
+        if not configuration_changed:
+            self.logger.info("Function configuration unchanged", function_name=function_name)
+            return response['FunctionArn']
+        
+        response = self.lambda_client.update_function_configuration(
+            FunctionName=function_name,
+            RevisionId=response['RevisionId'],
+            **configuration
+        )
+        return response['FunctionArn']
+    
+    @staticmethod
+    def _configuration_changed(current: Dict[str, Any], desired: Dict[str, Any]) -> bool:
+        """Compare a get_function_configuration response with the desired configuration."""
+        return (
+            current.get('Role') != desired['Role']
+            or current.get('Handler') != desired['Handler']
+            or current.get('Description', '') != desired['Description']
+            or current.get('Timeout') != desired['Timeout']
+            or current.get('MemorySize') != desired['MemorySize']
+            or current.get('Environment', {}).get('Variables', {}) != desired['Environment']['Variables']
+        )
+    
+    @staticmethod
+    def _deploy_fingerprint(code_sha256: str, configuration: Dict[str, Any]) -> str:
+        """Hash the package and configuration that identify a deploy."""
+        payload = json.dumps(
+            {'region': settings.aws.region, 'code_sha256': code_sha256, **configuration},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def _read_deploy_cache(self, function_name: str, fingerprint: str) -> Optional[str]:
+        """
+        Get the function ARN recorded by the last deploy if its fingerprint matches.
+        
+        Args:
+            function_name: Name of the Lambda function
+            fingerprint: Fingerprint of the deploy being attempted
+            
+        Returns:
+            Function ARN recorded with the fingerprint, or None if the
+            function needs deploying
+        """
+        try:
+            cached = json.loads((DEPLOY_CACHE_DIR / f"{function_name}.json").read_text())
+        except (OSError, ValueError):
+            return None
+        
+        if cached.get('fingerprint') == fingerprint:
+            return cached.get('function_arn')
+        return None
+    
+    def _deployed_function_arn(
+        self,
+        function_name: str,
+        code_sha256: str,
+        configuration: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        Confirm a cached deploy against the live function.
+        
+        The local cache only says what was deployed from this machine; the
+        function may since have been deleted or changed elsewhere.
+        
+        Returns:
+            Function ARN if the function exists with the same code and
+            configuration, otherwise None
+        """
+        try:
+            response = self.lambda_client.get_function_configuration(FunctionName=function_name)
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ResourceNotFoundException':
+                return None
+            raise
+        
+        if response.get('CodeSha256') != code_sha256 or self._configuration_changed(response, configuration):
+            return None
+        return response['FunctionArn']
+    
+    def _write_deploy_cache(self, function_name: str, fingerprint: str, function_arn: str):
+        """Record a successful deploy; failures to write the cache are not fatal."""
+        try:
+            DEPLOY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            (DEPLOY_CACHE_DIR / f"{function_name}.json").write_text(
+                json.dumps({'fingerprint': fingerprint, 'function_arn': function_arn})
+            )
+        except OSError as e:
+            self.logger.warning("Failed to write deploy cache", function_name=function_name, error=str(e))
+    
+    def _get_code_location(self, zip_content: bytes) -> Dict[str, Any]:
+        """
+        Get the Code argument for a deployment package.
+        
+        Small packages are sent inline. Packages over
+        S3_STAGING_THRESHOLD_BYTES are uploaded once to the staging bucket
+        (multipart, keyed by content hash) and referenced by bucket and key.
+        
+        Args:
+            zip_content: ZIP file content
+            
+        Returns:
+            Either {'ZipFile': ...} or {'S3Bucket': ..., 'S3Key': ...}; the
+            same keys are accepted by create_function and update_function_code
+        """
+        if len(zip_content) <= S3_STAGING_THRESHOLD_BYTES:
+            return {'ZipFile': zip_content}
+        
+        if not self.staging_bucket:
+            raise LambdaDeploymentError(
+                "Deployment package exceeds inline size limit and no staging bucket is configured"
+            )
+        
+        key = f"lambda-packages/{hashlib.sha256(zip_content).hexdigest()}.zip"
+        
+        with self._staging_lock:
+            if not self._staging_bucket_ready:
+                self._ensure_staging_bucket()
+                self._staging_bucket_ready = True
+            
+            if key not in self._staged_keys:
+                self.s3_client.upload_fileobj(
+                    io.BytesIO(zip_content),
+                    self.staging_bucket,
+                    key,
+                    Config=_STAGING_TRANSFER_CONFIG
+                )
+                self._staged_keys.add(key)
+                self.logger.info(
+                    "Deployment package staged in S3",
+                    bucket=self.staging_bucket,
+                    key=key,
+                    size_bytes=len(zip_content)
+                )
+        
+        return {'S3Bucket': self.staging_bucket, 'S3Key': key}
+    
+    def _ensure_staging_bucket(self):
+        """Create the staging bucket if it doesn't exist."""
+        try:
+            self.s3_client.head_bucket(Bucket=self.staging_bucket)
+        except ClientError as e:
+            if e.response['Error']['Code'] not in ('404', 'NoSuchBucket'):
+                raise
+            
+            create_kwargs = {'Bucket': self.staging_bucket}
+            if settings.aws.region != 'us-east-1':
+                create_kwargs['CreateBucketConfiguration'] = {
+                    'LocationConstraint': settings.aws.region
+                }
+            self.s3_client.create_bucket(**create_kwargs)
+            self.logger.info("Created deployment staging bucket", bucket=self.staging_bucket)
+    
+    def _create_function_when_role_ready(self, **create_kwargs) -> Dict[str, Any]:
+        """
+        Call create_function, retrying while the execution role propagates.
+        
+        Lambda rejects a role that IAM has not finished propagating with an
+        InvalidParameterValueException saying it cannot be assumed. Those
+        errors are retried with exponential backoff up to
+        ROLE_PROPAGATION_TIMEOUT_SECONDS; any other error is raised.
+        
+        Args:
+            **create_kwargs: Arguments for lambda_client.create_function
+            
+        Returns:
+            create_function response
+        """
+        deadline = time.monotonic() + ROLE_PROPAGATION_TIMEOUT_SECONDS
+        delay = ROLE_PROPAGATION_INITIAL_DELAY
+        
+        while True:
+            try:
+                return self.lambda_client.create_function(**create_kwargs)
+            except ClientError as e:
+                error = e.response['Error']
+                role_not_ready = (
+                    error['Code'] == 'InvalidParameterValueException'
+                    and 'assume' in error.get('Message', '')
+                )
+                if not role_not_ready or time.monotonic() + delay > deadline:
+                    raise
+                
+                self.logger.info(
+                    "Waiting for execution role to propagate",
+                    function_name=create_kwargs.get('FunctionName'),
+                    retry_in_seconds=delay
+                )
+                time.sleep(delay)
+                delay = min(delay * 2, ROLE_PROPAGATION_MAX_DELAY)
     
     def create_kinesis_event_source_mapping(
         self,
         function_name: str,
         stream_arn: str,
-        batch_size: int = 100,
-        starting_position: str = 'LATEST'
+        batch_size: int = 500,
+        starting_position: str = 'LATEST',
+        parallelization_factor: int = 10,
+        maximum_batching_window_in_seconds: int = 1,
+        maximum_retry_attempts: int = -1,
+        maximum_record_age_in_seconds: int = -1,
+        bisect_batch_on_function_error: bool = True,
+        tumbling_window_in_seconds: Optional[int] = None,
+        on_failure_destination_arn: Optional[str] = None
     ) -> str:
         """
         Create event source mapping between Kinesis stream and Lambda function.
         
+        Defaults favour throughput and latency: up to 10 concurrent batches
+        per shard, a 1 second batching window, and partial batch failure
+        reporting. The function must answer with 'batchItemFailures' (as
+        kinesis_stream_processor_handler does) so retries resume from the
+        first failed record instead of redelivering the whole batch.
+        Failed batches are retried until they succeed; finite retry or age
+        limits discard records, so they require an on-failure destination
+        to keep a record of what was dropped.
+        
         Args:
             function_name: Name of the Lambda function
             stream_arn: ARN of the Kinesis stream
             batch_size: Number of records to send to function in each batch
             starting_position: Starting position in the stream (LATEST, TRIM_HORIZON)
+            parallelization_factor: Concurrent batches processed per shard (1-10)
+            maximum_batching_window_in_seconds: Time to gather records before invoking
+            maximum_retry_attempts: Retries for a failed batch (-1 for unlimited)
+            maximum_record_age_in_seconds: Age after which records are discarded (-1 for unlimited)
+            bisect_batch_on_function_error: Split a failed batch in two before retrying
+            tumbling_window_in_seconds: Optional tumbling window for stateful aggregation
+            on_failure_destination_arn: SQS queue or SNS topic ARN for discarded batches
             
         Returns:
             UUID of the event source mapping
         """
-        try:
-            response = self.lambda_client.create_event_source_mapping(
-                EventSourceArn=stream_arn,
-                FunctionName=function_name,
-                StartingPosition=starting_position,
-                BatchSize=batch_size,
-                MaximumBatchingWindowInSeconds=5,  # Wait up to 5 seconds to collect records
-                ParallelizationFactor=1  # Process one shard at a time
+        limits_discard_records = maximum_retry_attempts != -1 or maximum_record_age_in_seconds != -1
+        if limits_discard_records and not on_failure_destination_arn:
+            raise LambdaDeploymentError(
+                "Finite retry or record age limits discard records and require an on_failure_destination_arn"
             )
+        
+        mapping_kwargs = {
+            'EventSourceArn': stream_arn,
+            'FunctionName': function_name,
+            'StartingPosition': starting_position,
+            'BatchSize': batch_size,
+            'MaximumBatchingWindowInSeconds': maximum_batching_window_in_seconds,
+            'ParallelizationFactor': parallelization_factor,
+            'MaximumRetryAttempts': maximum_retry_attempts,
+            'MaximumRecordAgeInSeconds': maximum_record_age_in_seconds,
+            'BisectBatchOnFunctionError': bisect_batch_on_function_error,
+            'FunctionResponseTypes': ['ReportBatchItemFailures']
+        }
+        if tumbling_window_in_seconds is not None:
+            mapping_kwargs['TumblingWindowInSeconds'] = tumbling_window_in_seconds
+        if on_failure_destination_arn:
+            mapping_kwargs['DestinationConfig'] = {'OnFailure': {'Destination': on_failure_destination_arn}}
+        
+        try:
+            response = self.lambda_client.create_event_source_mapping(**mapping_kwargs)
             
             mapping_uuid = response['UUID']
             self.logger.info(
@@ -289,13 +943,9 @@ class LambdaDeployer:
         except ClientError as e:
             if e.response['Error']['Code'] == 'ResourceConflictException':
                 self.logger.info("Event source mapping already exists", function_name=function_name)
-                # List existing mappings to find the UUID
-                mappings = self.lambda_client.list_event_source_mappings(
-                    EventSourceArn=stream_arn,
-                    FunctionName=function_name
-                )
-                if mappings['EventSourceMappings']:
-                    return mappings['EventSourceMappings'][0]['UUID']
+                mapping_uuid = self._find_event_source_mapping(function_name, stream_arn)
+                if mapping_uuid:
+                    return mapping_uuid
             
             error_msg = f"Failed to create event source mapping: {str(e)}"
             self.logger.error(error_msg, function_name=function_name, stream_arn=stream_arn)
@@ -305,6 +955,115 @@ class LambdaDeployer:
             self.logger.error(error_msg, function_name=function_name, stream_arn=stream_arn)
             raise LambdaDeploymentError(error_msg)
     
+    def _find_event_source_mapping(self, function_name: str, stream_arn: str) -> Optional[str]:
+        """
+        Look up the UUID of an existing event source mapping.
+        
+        Results are cached for MAPPING_CACHE_TTL_SECONDS.
+        
+        Args:
+            function_name: Name of the Lambda function
+            stream_arn: ARN of the Kinesis stream
+            
+        Returns:
+            UUID of the first matching mapping, or None if there is none
+        """
+        cache_key = (stream_arn, function_name)
+        cached = self._mapping_cache.get(cache_key)
+        if cached and time.monotonic() - cached[1] < MAPPING_CACHE_TTL_SECONDS:
+            return cached[0]
+        
+        mappings = self.lambda_client.list_event_source_mappings(
+            EventSourceArn=stream_arn,
+            FunctionName=function_name
+        )
+        mapping_uuid = None
+        if mappings['EventSourceMappings']:
+            mapping_uuid = mappings['EventSourceMappings'][0]['UUID']
+        
+        self._mapping_cache[cache_key] = (mapping_uuid, time.monotonic())
+        return mapping_uuid
+    
+    def _kinesis_stream_arn(self) -> str:
+        """Build the ARN of the configured Kinesis stream."""
+        account_id = _get_account_id(self.sts_client)
+        return f"arn:aws:kinesis:{settings.aws.region}:{account_id}:stream/{settings.aws.kinesis_stream_name}"
+    
+    def _deploy_one(
+        self,
+        func_config: Dict[str, Any],
+        role_arn: str,
+        zip_content: bytes
+    ) -> Dict[str, Any]:
+        """
+        Deploy a single Kinesis processing function.
+        
+        Args:
+            func_config: Function configuration (name, handler, description, timeout, memory_size)
+            role_arn: ARN of the execution role
+            zip_content: Deployment package shared by all functions
+            
+        Returns:
+            Dictionary with the function ARN, event source mapping UUID (if any)
+            and non-fatal errors
+        """
+        outcome = {
+            'function_arn': None,
+            'mapping_uuid': None,
+            'errors': []
+        }
+        
+        # Deploy function
+        with _lambda_deploy_slots:
+            outcome['function_arn'] = self.deploy_lambda_function(
+                function_name=func_config['name'],
+                handler=func_config['handler'],
+                role_arn=role_arn,
+                zip_content=zip_content,
+                description=func_config['description'],
+                timeout=func_config['timeout'],
+                memory_size=func_config['memory_size']
+            )
+        
+        # Create event source mapping for main processor
+        if func_config['name'] == 'kinesis-stream-processor':
+            try:
+                outcome['mapping_uuid'] = self.create_kinesis_event_source_mapping(
+                    function_name=func_config['name'],
+                    stream_arn=self._kinesis_stream_arn()
+                )
+            except Exception as e:
+                error_msg = f"Failed to create event source mapping for {func_config['name']}: {str(e)}"
+                outcome['errors'].append(error_msg)
+                self.logger.error(error_msg)
+        
+        return outcome
+    
+    def _record_deploy_outcome(
+        self,
+        results: Dict[str, Any],
+        function_name: str,
+        outcome: Any
+    ):
+        """
+        Merge one function's deployment outcome into the overall results.
+        
+        Args:
+            results: Deployment results being accumulated
+            function_name: Name of the deployed function
+            outcome: _deploy_one result, or the exception it raised
+        """
+        if isinstance(outcome, Exception):
+            error_msg = f"Failed to deploy function {function_name}: {str(outcome)}"
+            results['errors'].append(error_msg)
+            self.logger.error(error_msg)
+            return
+        
+        results['functions'][function_name] = outcome['function_arn']
+        if outcome['mapping_uuid']:
+            results['event_source_mappings'][function_name] = outcome['mapping_uuid']
+        results['errors'].extend(outcome['errors'])
+    
     def deploy_kinesis_processing_functions(self) -> Dict[str, Any]:
         """
         Deploy all Lambda functions for Kinesis stream processing.
@@ -323,78 +1082,35 @@ class LambdaDeployer:
             role_name = "KinesisStreamProcessingRole"
             role_arn = self.create_lambda_execution_role(role_name)
             
-            # Wait a bit for role to propagate
-            import time
-            time.sleep(10)
-            
-            # Function configurations
-            functions_config = [
-                {
-                    'name': 'kinesis-stream-processor',
-                    'handler': 'lambda_functions.kinesis_stream_processor_handler',
-                    'description': 'Process concert data from Kinesis stream',
-                    'timeout': 300,
-                    'memory_size': 512
-                },
-                {
-                    'name': 'data-quality-processor',
-                    'handler': 'lambda_functions.data_quality_processor_handler',
-                    'description': 'Validate and monitor data quality',
-                    'timeout': 180,
-                    'memory_size': 256
-                },
-                {
-                    'name': 'stream-analytics-processor',
-                    'handler': 'lambda_functions.stream_analytics_processor_handler',
-                    'description': 'Real-time analytics on stream data',
-                    'timeout': 240,
-                    'memory_size': 384
-                }
-            ]
+            # All functions share one source file and configuration, so the
+            # package is built once and reused for every deployment
+            zip_content = self.create_deployment_package(
+                'src/infrastructure/lambda_functions.py',
+                'shared'
+            )
             
-            # Deploy each function
-            for func_config in functions_config:
-                try:
-                    # Create deployment package
-                    zip_content = self.create_deployment_package(
-                        'src/infrastructure/lambda_functions.py',
-                        func_config['name']
-                    )
-                    
-                    # Deploy function
-                    function_arn = self.deploy_lambda_function(
-                        function_name=func_config['name'],
-                        handler=func_config['handler'],
-                        role_arn=role_arn,
-                        zip_content=zip_content,
-                        description=func_config['description'],
-                        timeout=func_config['timeout'],
-                        memory_size=func_config['memory_size']
-                    )
-                    
-                    results['functions'][func_config['name']] = function_arn
-                    
-                    # Create event source mapping for main processor
-                    if func_config['name'] == 'kinesis-stream-processor':
-                        # We need the stream ARN - this would be constructed or retrieved
-                        stream_arn = f"arn:aws:kinesis:{settings.aws.region}:*:stream/{settings.aws.kinesis_stream_name}"
-                        
-                        try:
-                            mapping_uuid = self.create_kinesis_event_source_mapping(
-                                function_name=func_config['name'],
-                                stream_arn=stream_arn,
-                                batch_size=100
-                            )
-                            results['event_source_mappings'][func_config['name']] = mapping_uuid
-                        except Exception as e:
-                            error_msg = f"Failed to create event source mapping for {func_config['name']}: {str(e)}"
-                            results['errors'].append(error_msg)
-                            self.logger.error(error_msg)
-                    
-                except Exception as e:
-                    error_msg = f"Failed to deploy function {func_config['name']}: {str(e)}"
-                    results['errors'].append(error_msg)
-                    self.logger.error(error_msg)
+            functions_config = KINESIS_FUNCTIONS_CONFIG
+            
+            # Deploy functions concurrently; each deployment is independent
+            with ThreadPoolExecutor(
+                max_workers=min(len(functions_config), DEPLOY_BATCH_SIZE)
+            ) as executor:
+                futures = {}
+                for batch_start in range(0, len(functions_config), DEPLOY_BATCH_SIZE):
+                    if batch_start:
+                        time.sleep(DEPLOY_BATCH_PAUSE_SECONDS)
+                    for func_config in functions_config[batch_start:batch_start + DEPLOY_BATCH_SIZE]:
+                        future = executor.submit(
+                            self._deploy_one, func_config, role_arn, zip_content
+                        )
+                        futures[future] = func_config['name']
+                
+                for future in as_completed(futures):
+                    try:
+                        outcome = future.result()
+                    except Exception as e:
+                        outcome = e
+                    self._record_deploy_outcome(results, futures[future], outcome)
             
             self.logger.info(
                 "Lambda functions deployment completed",
@@ -410,31 +1126,134 @@ class LambdaDeployer:
         
         return results
     
-    def list_deployed_functions(self) -> List[Dict[str, Any]]:
+    async def deploy_kinesis_processing_functions_async(self) -> Dict[str, Any]:
         """
-        List all deployed Lambda functions.
+        Deploy all Lambda functions for Kinesis stream processing from async code.
+        
+        Each blocking AWS step runs in a worker thread and the function
+        deployments are awaited together with asyncio.gather, so the
+        caller's event loop is never blocked.
         
+        Returns:
+            Deployment results with function ARNs and mapping UUIDs
+        """
+        results = {
+            'functions': {},
+            'event_source_mappings': {},
+            'errors': []
+        }
+        
+        try:
+            # Create execution role
+            role_arn = await asyncio.to_thread(
+                self.create_lambda_execution_role, "KinesisStreamProcessingRole"
+            )
+            
+            zip_content = await asyncio.to_thread(
+                self.create_deployment_package,
+                'src/infrastructure/lambda_functions.py',
+                'shared'
+            )
+            
+            outcomes = await asyncio.gather(
+                *[
+                    asyncio.to_thread(self._deploy_one, func_config, role_arn, zip_content)
+                    for func_config in KINESIS_FUNCTIONS_CONFIG
+                ],
+                return_exceptions=True
+            )
+            
+            for func_config, outcome in zip(KINESIS_FUNCTIONS_CONFIG, outcomes):
+                self._record_deploy_outcome(results, func_config['name'], outcome)
+            
+            self.logger.info(
+                "Lambda functions deployment completed",
+                functions_deployed=len(results['functions']),
+                mappings_created=len(results['event_source_mappings']),
+                errors=len(results['errors'])
+            )
+            
+        except Exception as e:
+            error_msg = f"Lambda deployment failed: {str(e)}"
+            results['errors'].append(error_msg)
+            self.logger.error(error_msg)
+        
+        return results
+    
+    def list_deployed_functions(self, names: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        List deployed Lambda functions.
+        
+        When names are given, only those functions are fetched (concurrently,
+        one get_function call each) and missing ones are skipped. Otherwise
+        every function in the account is listed page by page. Results are
+        cached for FUNCTION_LIST_CACHE_TTL_SECONDS.
+        
+        Args:
+            names: Function names to look up (defaults to all functions)
+            
         Returns:
             List of function information
         """
+        cache_key = tuple(sorted(names)) if names is not None else None
+        cached = self._function_list_cache.get(cache_key)
+        if cached and time.monotonic() - cached[1] < FUNCTION_LIST_CACHE_TTL_SECONDS:
+            return cached[0]
+        
         try:
-            response = self.lambda_client.list_functions()
-            functions = []
-            
-            for func in response['Functions']:
-                functions.append({
-                    'function_name': func['FunctionName'],
-                    'function_arn': func['FunctionArn'],
-                    'runtime': func['Runtime'],
-                    'handler': func['Handler'],
-                    'description': func.get('Description', ''),
-                    'timeout': func['Timeout'],
-                    'memory_size': func['MemorySize'],
-                    'last_modified': func['LastModified']
-                })
+            if names is not None:
+                configurations = self._get_function_configurations(names)
+            else:
+                configurations = []
+                paginator = self.lambda_client.get_paginator('list_functions')
+                for page in paginator.paginate():
+                    configurations.extend(page['Functions'])
+            
+            functions = [self._function_summary(func) for func in configurations]
+            self._function_list_cache[cache_key] = (functions, time.monotonic())
             
             return functions
             
         except Exception as e:
             self.logger.error("Failed to list Lambda functions", error=str(e))
-            return []
\ No newline at end of file
+            return []
+    
+    def _get_function_configurations(self, names: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch function configurations by name concurrently.
+        
+        Args:
+            names: Function names to look up
+            
+        Returns:
+            Configurations of the functions that exist, in the order requested
+        """
+        def get_configuration(function_name: str) -> Optional[Dict[str, Any]]:
+            try:
+                return self.lambda_client.get_function(FunctionName=function_name)['Configuration']
+            except ClientError as e:
+                if e.response['Error']['Code'] == 'ResourceNotFoundException':
+                    return None
+                raise
+        
+        if not names:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(len(names), DEPLOY_BATCH_SIZE)) as executor:
+            configurations = list(executor.map(get_configuration, names))
+        
+        return [config for config in configurations if config is not None]
+    
+    @staticmethod
+    def _function_summary(func: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduce a function configuration to the fields reported by list_deployed_functions."""
+        return {
+            'function_name': func['FunctionName'],
+            'function_arn': func['FunctionArn'],
+            'runtime': func['Runtime'],
+            'handler': func['Handler'],
+            'description': func.get('Description', ''),
+            'timeout': func['Timeout'],
+            'memory_size': func['MemorySize'],
+            'last_modified': func['LastModified']
+        }
\ No newline at end of file
@@ -1,14 +1,37 @@
 """
 AWS Lambda functions for processing Kinesis stream data.
 """
+import asyncio
 import json
-import base64
+import binascii
+import gzip
+import io
+import itertools
+import uuid
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import structlog
 
+# orjson is provided through a Lambda layer when available; the stdlib json
+# module is used otherwise
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def _orjson_dumps(obj: Any, default: Optional[Any] = None, **kwargs) -> str:
+    """Serialize a log event with orjson for structlog's JSONRenderer."""
+    return orjson.dumps(obj, default=default or str).decode()
+
+
 # Configure structured logging for Lambda
 structlog.configure(
     processors=[
@@ -20,7 +43,8 @@ structlog.configure(
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer()
+        structlog.processors.JSONRenderer(serializer=_orjson_dumps) if ORJSON_AVAILABLE
+        else structlog.processors.JSONRenderer()
     ],
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
@@ -30,12 +54,55 @@ structlog.configure(
 
 logger = structlog.get_logger(__name__)
 
+# S3 writes for a batch are issued concurrently. The executor lives at module
+# scope so warm Lambda containers reuse its threads across invocations, and
+# the client pool is sized above the worker count.
+S3_WRITE_WORKERS = 16
+_s3_client_config = Config(max_pool_connections=64)
+_s3_write_executor = ThreadPoolExecutor(max_workers=S3_WRITE_WORKERS, thread_name_prefix='s3-write')
+
+# Batch NDJSON objects are gzipped at the fastest level before upload; Redshift
+# COPY reads them with GZIP and pulls the files listed in each batch manifest
+# in parallel across slices
+S3_GZIP_LEVEL = 1
+
+# JSON bodies above this size are gzipped (Content-Encoding: gzip) before
+# upload, and compressed bodies above the multipart threshold are uploaded in
+# parallel parts
+S3_COMPRESS_MIN_BYTES = 64 * 1024
+S3_MULTIPART_MIN_BYTES = 8 * 1024 * 1024
+_s3_transfer_config = TransferConfig(
+    multipart_threshold=S3_MULTIPART_MIN_BYTES,
+    max_concurrency=8
+)
+
+# Fields every stream record must carry
+REQUIRED_RECORD_FIELDS = frozenset(['source', 'data_type', 'ingestion_timestamp', 'payload'])
+
+
+def _json_loads(data: bytes) -> Any:
+    """Deserialize a UTF-8 JSON document, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_bytes(data: Any) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(data, default=str).encode('utf-8')
+
 
 class StreamProcessor:
     """Base class for processing Kinesis stream records."""
     
     def __init__(self):
-        self.s3_client = boto3.client('s3')
+        self.s3_client = boto3.client('s3', config=_s3_client_config)
         self.logger = structlog.get_logger(self.__class__.__name__)
     
     def decode_kinesis_record(self, kinesis_record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -49,12 +116,11 @@ class StreamProcessor:
             Parsed record data or None if parsing fails
         """
         try:
-            # Decode base64 data
+            # Decode base64 data and parse the JSON bytes directly. a2b_base64
+            # takes the ASCII str from the event as-is, with no intermediate
+            # encode or UTF-8 decode.
             encoded_data = kinesis_record['data']
-            decoded_data = base64.b64decode(encoded_data).decode('utf-8')
-            
-            # Parse JSON
-            record_data = json.loads(decoded_data)
+            record_data = _json_loads(binascii.a2b_base64(encoded_data))
             
             # Add Kinesis metadata
             record_data['kinesis_metadata'] = {
@@ -84,14 +150,16 @@ class StreamProcessor:
         Returns:
             True if record is valid, False otherwise
         """
-        required_fields = ['source', 'data_type', 'ingestion_timestamp', 'payload']
-        
-        for field in required_fields:
-            if field not in record:
-                self.logger.warning(f"Missing required field: {field}", record_id=record.get('record_id', 'unknown'))
-                return False
+        if REQUIRED_RECORD_FIELDS.issubset(record):
+            return True
         
-        return True
+        missing = sorted(REQUIRED_RECORD_FIELDS - record.keys())
+        self.logger.warning(
+            f"Missing required field: {missing[0]}",
+            missing_fields=missing,
+            record_id=record.get('record_id', 'unknown')
+        )
+        return False
     
     def write_to_s3(
         self,
@@ -103,6 +171,11 @@ class StreamProcessor:
         """
         Write data to S3.
         
+        Uncompressed bodies over S3_COMPRESS_MIN_BYTES are gzipped and stored
+        under the same key with Content-Encoding: gzip, so readers that fetch
+        the object directly must check ContentEncoding; bodies over
+        S3_MULTIPART_MIN_BYTES are uploaded as a multipart transfer.
+        
         Args:
             bucket: S3 bucket name
             key: S3 object key
@@ -114,18 +187,34 @@ class StreamProcessor:
         """
         try:
             if isinstance(data, (dict, list)):
-                body = json.dumps(data, default=str)
+                body = _json_dumps_bytes(data)
+            elif isinstance(data, (bytes, bytearray)):
+                body = data
             else:
-                body = str(data)
+                body = str(data).encode('utf-8')
             
-            self.s3_client.put_object(
-                Bucket=bucket,
-                Key=key,
-                Body=body,
-                ContentType=content_type
-            )
+            extra_args = {'ContentType': content_type}
+            if len(body) > S3_COMPRESS_MIN_BYTES and content_type != 'application/gzip':
+                body = gzip.compress(body, compresslevel=S3_GZIP_LEVEL)
+                extra_args['ContentEncoding'] = 'gzip'
+            
+            if len(body) > S3_MULTIPART_MIN_BYTES:
+                self.s3_client.upload_fileobj(
+                    io.BytesIO(body),
+                    bucket,
+                    key,
+                    ExtraArgs=extra_args,
+                    Config=_s3_transfer_config
+                )
+            else:
+                self.s3_client.put_object(
+                    Bucket=bucket,
+                    Key=key,
+                    Body=body,
+                    **extra_args
+                )
             
-            self.logger.info(f"Successfully wrote data to S3", bucket=bucket, key=key)
+            self.logger.debug("Successfully wrote data to S3", bucket=bucket, key=key)
             return True
             
         except ClientError as e:
@@ -135,178 +224,322 @@ class StreamProcessor:
             self.logger.error(f"Unexpected error writing to S3", bucket=bucket, key=key, error=str(e))
             return False
 
+    
+    def write_many_to_s3(self, writes: List[Tuple[str, str, Any, str]]) -> int:
+        """
+        Write several objects to S3 concurrently.
+        
+        Args:
+            writes: (bucket, key, data, content_type) tuples to write
+            
+        Returns:
+            Number of objects written successfully
+        """
+        if not writes:
+            return 0
+        
+        results = _s3_write_executor.map(lambda write: self.write_to_s3(*write), writes)
+        return sum(1 for success in results if success)
+    
+    async def write_many_to_s3_async(self, writes: List[Tuple[str, str, Any, str]]) -> int:
+        """
+        Write several objects to S3 concurrently from a coroutine.
+        
+        The blocking puts run on the shared S3 write executor, so the event
+        loop stays free while they are in flight.
+        
+        Args:
+            writes: (bucket, key, data, content_type) tuples to write
+            
+        Returns:
+            Number of objects written successfully
+        """
+        if not writes:
+            return 0
+        
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(_s3_write_executor, self.write_to_s3, *write) for write in writes),
+            return_exceptions=True
+        )
+        return sum(1 for success in results if success is True)
+
 
 class ConcertDataProcessor(StreamProcessor):
-    """Processor for concert-related data from Kinesis streams."""
+    """
+    Processor for concert-related data from Kinesis streams.
+    
+    Each raw record is written alongside its processed form in the batch
+    NDJSON under processed_bucket, so there is no separate raw bucket.
+    """
     
-    def __init__(self, raw_bucket: str = "concert-data-raw", processed_bucket: str = "concert-data-processed"):
+    def __init__(self, processed_bucket: str = "concert-data-processed"):
         super().__init__()
-        self.raw_bucket = raw_bucket
         self.processed_bucket = processed_bucket
+        
+        # data_type -> (record processor, processed_data group)
+        self._dispatch = {
+            'artists': (self.process_artist_record, 'artists'),
+            'venues': (self.process_venue_record, 'venues'),
+            'concerts': (self.process_concert_record, 'concerts'),
+            'events': (self.process_concert_record, 'concerts'),
+            'ticket_sales': (self.process_ticket_sale_record, 'ticket_sales')
+        }
     
-    def process_artist_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+    def process_artist_record(
+        self,
+        record: Dict[str, Any],
+        processed_timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Process an artist record for data warehouse loading.
         
         Args:
             record: Artist record from stream
+            processed_timestamp: ISO processing timestamp (defaults to now)
             
         Returns:
             Processed record ready for data warehouse
         """
         payload = record['payload']
+        get = payload.get
+        genre = get('genre')
         
         # Normalize artist data
         processed_record = {
-            'artist_id': payload.get('artist_id'),
-            'name': payload.get('name', '').strip(),
-            'genres': payload.get('genre', []) if isinstance(payload.get('genre'), list) else [payload.get('genre', '')],
-            'popularity_score': float(payload.get('popularity_score', 0.0)),
-            'formation_date': payload.get('formation_date'),
-            'members': payload.get('members', []),
-            'spotify_id': payload.get('spotify_id'),
-            'external_urls': payload.get('external_urls', {}),
-            'followers': payload.get('followers', 0),
-            'images': payload.get('images', []),
-            'processed_timestamp': datetime.utcnow().isoformat(),
+            'artist_id': get('artist_id'),
+            'name': get('name', '').strip(),
+            'genres': genre if isinstance(genre, list) else [get('genre', '')],
+            'popularity_score': float(get('popularity_score', 0.0)),
+            'formation_date': get('formation_date'),
+            'members': get('members', []),
+            'spotify_id': get('spotify_id'),
+            'external_urls': get('external_urls', {}),
+            'followers': get('followers', 0),
+            'images': get('images', []),
+            'processed_timestamp': processed_timestamp or datetime.utcnow().isoformat(),
             'source': record['source'],
             'ingestion_timestamp': record['ingestion_timestamp']
         }
         
         return processed_record
     
-    def process_venue_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+    def process_venue_record(
+        self,
+        record: Dict[str, Any],
+        processed_timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Process a venue record for data warehouse loading.
         
         Args:
             record: Venue record from stream
+            processed_timestamp: ISO processing timestamp (defaults to now)
             
         Returns:
             Processed record ready for data warehouse
         """
         payload = record['payload']
+        get = payload.get
+        location = get('location') or {}
+        capacity = get('capacity')
         
         # Normalize venue data
         processed_record = {
-            'venue_id': payload.get('venue_id'),
-            'name': payload.get('name', '').strip(),
+            'venue_id': get('venue_id'),
+            'name': get('name', '').strip(),
             'location': {
-                'address': payload.get('location', {}).get('address', ''),
-                'city': payload.get('location', {}).get('city', ''),
-                'state': payload.get('location', {}).get('state', ''),
-                'country': payload.get('location', {}).get('country', ''),
-                'postal_code': payload.get('location', {}).get('postal_code', ''),
-                'latitude': payload.get('location', {}).get('latitude'),
-                'longitude': payload.get('location', {}).get('longitude')
+                'address': location.get('address', ''),
+                'city': location.get('city', ''),
+                'state': location.get('state', ''),
+                'country': location.get('country', ''),
+                'postal_code': location.get('postal_code', ''),
+                'latitude': location.get('latitude'),
+                'longitude': location.get('longitude')
             },
-            'capacity': int(payload.get('capacity', 0)) if payload.get('capacity') else None,
-            'venue_type': payload.get('venue_type', ''),
-            'amenities': payload.get('amenities', []),
-            'ticketmaster_id': payload.get('ticketmaster_id'),
-            'external_urls': payload.get('external_urls', {}),
-            'processed_timestamp': datetime.utcnow().isoformat(),
+            'capacity': int(capacity) if capacity else None,
+            'venue_type': get('venue_type', ''),
+            'amenities': get('amenities', []),
+            'ticketmaster_id': get('ticketmaster_id'),
+            'external_urls': get('external_urls', {}),
+            'processed_timestamp': processed_timestamp or datetime.utcnow().isoformat(),
             'source': record['source'],
             'ingestion_timestamp': record['ingestion_timestamp']
         }
         
         return processed_record
     
-    def process_concert_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+    def process_concert_record(
+        self,
+        record: Dict[str, Any],
+        processed_timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Process a concert/event record for data warehouse loading.
         
         Args:
             record: Concert record from stream
+            processed_timestamp: ISO processing timestamp (defaults to now)
             
         Returns:
             Processed record ready for data warehouse
         """
         payload = record['payload']
+        get = payload.get
         
         # Normalize concert data
         processed_record = {
-            'concert_id': payload.get('concert_id') or payload.get('event_id'),
-            'artist_id': payload.get('artist_id'),
-            'venue_id': payload.get('venue_id'),
-            'event_date': payload.get('event_date'),
-            'event_time': payload.get('event_time'),
-            'ticket_prices': payload.get('ticket_prices', {}),
-            'total_attendance': payload.get('total_attendance'),
-            'revenue': payload.get('revenue'),
-            'status': payload.get('status', 'scheduled'),
-            'genre': payload.get('genre', ''),
-            'description': payload.get('description', ''),
-            'external_urls': payload.get('external_urls', {}),
-            'ticketmaster_id': payload.get('ticketmaster_id'),
-            'processed_timestamp': datetime.utcnow().isoformat(),
+            'concert_id': get('concert_id') or get('event_id'),
+            'artist_id': get('artist_id'),
+            'venue_id': get('venue_id'),
+            'event_date': get('event_date'),
+            'event_time': get('event_time'),
+            'ticket_prices': get('ticket_prices', {}),
+            'total_attendance': get('total_attendance'),
+            'revenue': get('revenue'),
+            'status': get('status', 'scheduled'),
+            'genre': get('genre', ''),
+            'description': get('description', ''),
+            'external_urls': get('external_urls', {}),
+            'ticketmaster_id': get('ticketmaster_id'),
+            'processed_timestamp': processed_timestamp or datetime.utcnow().isoformat(),
             'source': record['source'],
             'ingestion_timestamp': record['ingestion_timestamp']
         }
         
         return processed_record
     
-    def process_ticket_sale_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+    def process_ticket_sale_record(
+        self,
+        record: Dict[str, Any],
+        processed_timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Process a ticket sale record for data warehouse loading.
         
         Args:
             record: Ticket sale record from stream
+            processed_timestamp: ISO processing timestamp (defaults to now)
             
         Returns:
             Processed record ready for data warehouse
         """
         payload = record['payload']
+        get = payload.get
         
         # Normalize ticket sale data
         processed_record = {
-            'sale_id': payload.get('sale_id'),
-            'concert_id': payload.get('concert_id'),
-            'price_tier': payload.get('price_tier', ''),
-            'quantity': int(payload.get('quantity', 1)),
-            'unit_price': float(payload.get('unit_price', 0.0)),
-            'total_price': float(payload.get('total_price', 0.0)),
-            'purchase_timestamp': payload.get('purchase_timestamp'),
-            'customer_segment': payload.get('customer_segment', ''),
-            'payment_method': payload.get('payment_method', ''),
-            'processed_timestamp': datetime.utcnow().isoformat(),
+            'sale_id': get('sale_id'),
+            'concert_id': get('concert_id'),
+            'price_tier': get('price_tier', ''),
+            'quantity': int(get('quantity', 1)),
+            'unit_price': float(get('unit_price', 0.0)),
+            'total_price': float(get('total_price', 0.0)),
+            'purchase_timestamp': get('purchase_timestamp'),
+            'customer_segment': get('customer_segment', ''),
+            'payment_method': get('payment_method', ''),
+            'processed_timestamp': processed_timestamp or datetime.utcnow().isoformat(),
             'source': record['source'],
             'ingestion_timestamp': record['ingestion_timestamp']
         }
         
         return processed_record
     
-    def process_records(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def process_records(self, records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Process a batch of records from Kinesis stream.
         
         Args:
-            records: List of Kinesis records
+            records: Kinesis records (any iterable, consumed once)
+            
+        Returns:
+            Processing results summary. Its 'batch_item_failures' lists the
+            sequence numbers Kinesis should redeliver: records that failed to
+            decode or process, or the whole batch when the S3 write fails.
+        """
+        results, s3_writes, manifest_writes, sequence_numbers = self._prepare_batch(records)
+        if self.write_many_to_s3(s3_writes) == len(s3_writes):
+            self.write_many_to_s3(manifest_writes)
+        else:
+            self.logger.warning("Skipping COPY manifests for incomplete batch; reporting the batch as failed")
+            results['batch_item_failures'] = sequence_numbers
+        self._log_batch_results(results)
+        
+        return results
+    
+    async def process_records_async(self, records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Process a batch of records from Kinesis stream, awaiting the S3 writes.
+        
+        Args:
+            records: Kinesis records (any iterable, consumed once)
             
         Returns:
-            Processing results summary
+            Processing results summary, with 'batch_item_failures' as for
+            process_records
+        """
+        results, s3_writes, manifest_writes, sequence_numbers = self._prepare_batch(records)
+        if await self.write_many_to_s3_async(s3_writes) == len(s3_writes):
+            await self.write_many_to_s3_async(manifest_writes)
+        else:
+            self.logger.warning("Skipping COPY manifests for incomplete batch; reporting the batch as failed")
+            results['batch_item_failures'] = sequence_numbers
+        self._log_batch_results(results)
+        
+        return results
+    
+    def _prepare_batch(
+        self,
+        records: Iterable[Dict[str, Any]]
+    ) -> Tuple[Dict[str, Any], List[Tuple[str, str, Any, str]], List[Tuple[str, str, Any, str]], List[str]]:
+        """
+        Decode, validate and process a batch of Kinesis records.
+        
+        Records that fail to decode or raise while processing are listed in
+        the results' 'batch_item_failures' for redelivery. Records that decode
+        but fail validation or have an unknown data type would fail the same
+        way on every retry, so they are only counted and logged.
+        
+        Args:
+            records: Kinesis records (any iterable, consumed once)
+            
+        Returns:
+            Processing results summary, the S3 data writes for the batch, the
+            Redshift COPY manifest writes to issue once the data is written,
+            and the sequence numbers of every record in the batch
         """
         results = {
-            'total_records': len(records),
+            'total_records': 0,
             'successful_records': 0,
             'failed_records': 0,
             'records_by_type': {},
-            'errors': []
+            'errors': [],
+            'batch_item_failures': []
         }
+        sequence_numbers = []
         
-        processed_data = {
-            'artists': [],
-            'venues': [],
-            'concerts': [],
-            'ticket_sales': []
-        }
+        # Timestamps are taken once per batch. The batch id keeps keys unique
+        # when concurrent invocations for a shard write in the same second.
+        now = datetime.utcnow()
+        processed_timestamp = now.isoformat()
+        date_prefix = now.strftime('%Y/%m/%d')
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
+        batch_id = uuid.uuid4().hex
+        
+        # Each processed row carries its raw envelope under 'raw', and rows are
+        # written as one NDJSON object per group per batch
+        rows_by_group: Dict[str, List[bytes]] = {}
         
         for kinesis_record in records:
+            results['total_records'] += 1
+            sequence_number = kinesis_record.get('sequenceNumber')
+            sequence_numbers.append(sequence_number)
             try:
                 # Decode Kinesis record
                 record = self.decode_kinesis_record(kinesis_record)
                 if not record:
                     results['failed_records'] += 1
+                    results['batch_item_failures'].append(sequence_number)
                     continue
                 
                 # Validate record structure
@@ -317,45 +550,47 @@ class ConcertDataProcessor(StreamProcessor):
                 # Process based on data type
                 data_type = record['data_type']
                 
-                if data_type == 'artists':
-                    processed_record = self.process_artist_record(record)
-                    processed_data['artists'].append(processed_record)
-                elif data_type == 'venues':
-                    processed_record = self.process_venue_record(record)
-                    processed_data['venues'].append(processed_record)
-                elif data_type in ['concerts', 'events']:
-                    processed_record = self.process_concert_record(record)
-                    processed_data['concerts'].append(processed_record)
-                elif data_type == 'ticket_sales':
-                    processed_record = self.process_ticket_sale_record(record)
-                    processed_data['ticket_sales'].append(processed_record)
-                else:
+                process_fn, group = self._dispatch.get(data_type, (None, None))
+                if process_fn is None:
                     self.logger.warning(f"Unknown data type: {data_type}")
                     results['failed_records'] += 1
                     continue
                 
+                processed_record = process_fn(record, processed_timestamp)
+                
                 # Update counters
                 results['successful_records'] += 1
                 results['records_by_type'][data_type] = results['records_by_type'].get(data_type, 0) + 1
                 
-                # Store raw record in S3
-                raw_key = f"raw/{data_type}/{datetime.utcnow().strftime('%Y/%m/%d')}/{record.get('record_id', 'unknown')}.json"
-                self.write_to_s3(self.raw_bucket, raw_key, record)
+                # Queue the fused row for the batch's NDJSON object
+                rows_by_group.setdefault(group, []).append(
+                    _json_dumps_bytes({'raw': record, **processed_record}) + b'\n'
+                )
                 
             except Exception as e:
                 error_msg = f"Failed to process record: {str(e)}"
                 results['errors'].append(error_msg)
                 results['failed_records'] += 1
+                results['batch_item_failures'].append(sequence_number)
                 self.logger.error(error_msg, record=kinesis_record)
         
-        # Write processed data to S3 by type
-        timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+        # Write the batch data and its COPY manifests to S3 by group
+        s3_writes = []
+        manifest_writes = []
         
-        for data_type, records_list in processed_data.items():
-            if records_list:
-                processed_key = f"processed/{data_type}/{datetime.utcnow().strftime('%Y/%m/%d')}/batch_{timestamp}.json"
-                self.write_to_s3(self.processed_bucket, processed_key, records_list)
+        for group, lines in rows_by_group.items():
+            batch_prefix = f"processed/{group}/{date_prefix}/batch_{timestamp}_{batch_id}"
+            data_key = f"{batch_prefix}.ndjson.gz"
+            body = gzip.compress(b''.join(lines), compresslevel=S3_GZIP_LEVEL)
+            s3_writes.append((self.processed_bucket, data_key, body, 'application/gzip'))
+            
+            manifest = {'entries': [{'url': f"s3://{self.processed_bucket}/{data_key}", 'mandatory': True}]}
+            manifest_writes.append((self.processed_bucket, f"{batch_prefix}.manifest", manifest, 'application/json'))
         
+        return results, s3_writes, manifest_writes, sequence_numbers
+    
+    def _log_batch_results(self, results: Dict[str, Any]):
+        """Log the summary of a processed batch."""
         self.logger.info(
             "Batch processing completed",
             total_records=results['total_records'],
@@ -363,8 +598,19 @@ class ConcertDataProcessor(StreamProcessor):
             failed_records=results['failed_records'],
             records_by_type=results['records_by_type']
         )
-        
-        return results
+
+
+# Processor reused across warm invocations of the same container, so its
+# boto3 client and connection pool are only created on cold start
+_processor: Optional[ConcertDataProcessor] = None
+
+
+def _get_processor() -> ConcertDataProcessor:
+    """Get the container-wide ConcertDataProcessor, creating it on first use."""
+    global _processor
+    if _processor is None:
+        _processor = ConcertDataProcessor()
+    return _processor
 
 
 # Lambda function handlers
@@ -372,6 +618,10 @@ def kinesis_stream_processor_handler(event, context):
     """
     AWS Lambda handler for processing Kinesis stream records.
     
+    The response carries 'batchItemFailures' for the event source mapping's
+    ReportBatchItemFailures setting, so Kinesis redelivers from the first
+    failed record rather than moving past lost data.
+    
     Args:
         event: Lambda event containing Kinesis records
         context: Lambda context object
@@ -382,24 +632,27 @@ def kinesis_stream_processor_handler(event, context):
     logger.info("Kinesis stream processor started", event_source=event.get('eventSource'))
     
     try:
-        # Initialize processor
-        processor = ConcertDataProcessor()
-        
-        # Extract Kinesis records from event
-        kinesis_records = []
-        for record in event.get('Records', []):
-            if record.get('eventSource') == 'aws:kinesis':
-                kinesis_records.append(record['kinesis'])
+        processor = _get_processor()
+        
+        # Extract Kinesis records from event lazily; they are decoded one at
+        # a time as the processor consumes them
+        kinesis_records = (
+            record['kinesis']
+            for record in event.get('Records', [])
+            if record.get('eventSource') == 'aws:kinesis'
+        )
         
-        if not kinesis_records:
+        first_record = next(kinesis_records, None)
+        if first_record is None:
             logger.warning("No Kinesis records found in event")
             return {
                 'statusCode': 200,
-                'body': json.dumps({'message': 'No records to process'})
+                'body': json.dumps({'message': 'No records to process'}),
+                'batchItemFailures': []
             }
         
         # Process records
-        results = processor.process_records(kinesis_records)
+        results = processor.process_records(itertools.chain((first_record,), kinesis_records))
         
         logger.info("Kinesis stream processing completed", results=results)
         
@@ -408,18 +661,27 @@ def kinesis_stream_processor_handler(event, context):
             'body': json.dumps({
                 'message': 'Records processed successfully',
                 'results': results
-            })
+            }),
+            'batchItemFailures': [
+                {'itemIdentifier': sequence_number} for sequence_number in results['batch_item_failures']
+            ]
         }
         
     except Exception as e:
         error_msg = f"Lambda function failed: {str(e)}"
         logger.error(error_msg)
         
+        # Nothing from this batch is known to be written, so all of it is retried
         return {
             'statusCode': 500,
             'body': json.dumps({
                 'error': error_msg
-            })
+            }),
+            'batchItemFailures': [
+                {'itemIdentifier': record.get('kinesis', {}).get('sequenceNumber')}
+                for record in event.get('Records', [])
+                if record.get('eventSource') == 'aws:kinesis'
+            ]
         }
 
 
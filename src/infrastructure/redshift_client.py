@@ -3,53 +3,125 @@ Amazon Redshift client for data warehouse operations.
 Handles connections, schema management, and data loading operations.
 """
 import logging
-from typing import Dict, List, Optional, Any
+import re
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Any, Sequence, Tuple
 import boto3
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
+from psycopg2.pool import ThreadedConnectionPool
 from botocore.exceptions import ClientError
 from ..config.settings import settings
 
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Default upper bound on pooled connections per client
+REDSHIFT_POOL_MAX_CONNECTIONS = 10
+
+
+class CopyLoadError(Exception):
+    """COPY failure carrying the STL_LOAD_ERRORS rows recorded for that COPY."""
+    
+    def __init__(self, message: str, load_errors: List[Dict[str, Any]]):
+        super().__init__(message)
+        self.load_errors = load_errors
+
 
 class RedshiftClient:
     """Client for Amazon Redshift data warehouse operations."""
     
-    def __init__(self):
+    def __init__(self, max_connections: int = REDSHIFT_POOL_MAX_CONNECTIONS):
         """Initialize Redshift client with configuration."""
         self.settings = settings
         self.redshift_client = boto3.client('redshift', region_name=self.settings.aws_region)
         self.redshift_data_client = boto3.client('redshift-data', region_name=self.settings.aws_region)
-        self._connection = None
+        self.max_connections = max_connections
+        self._pool: Optional[ThreadedConnectionPool] = None
+        self._pool_lock = threading.Lock()
+        # Callers block for a free connection instead of getting a PoolError
+        self._pool_slots = threading.BoundedSemaphore(max_connections)
+        # Names of the statements prepared on each pooled connection
+        self._prepared = weakref.WeakKeyDictionary()
     
-    def get_connection(self) -> psycopg2.extensions.connection:
-        """Get or create a connection to Redshift."""
-        if self._connection is None or self._connection.closed:
-            try:
-                self._connection = psycopg2.connect(
-                    host=self.settings.redshift_host,
-                    port=self.settings.redshift_port,
-                    database=self.settings.redshift_database,
-                    user=self.settings.redshift_user,
-                    password=self.settings.redshift_password,
-                    sslmode='require'
-                )
-                logger.info("Successfully connected to Redshift")
-            except psycopg2.Error as e:
-                logger.error(f"Failed to connect to Redshift: {e}")
-                raise
+    def _get_pool(self) -> ThreadedConnectionPool:
+        """Get the connection pool, opening it on first use."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    try:
+                        self._pool = ThreadedConnectionPool(
+                            minconn=1,
+                            maxconn=self.max_connections,
+                            host=self.settings.redshift_host,
+                            port=self.settings.redshift_port,
+                            database=self.settings.redshift_database,
+                            user=self.settings.redshift_user,
+                            password=self.settings.redshift_password,
+                            sslmode='require',
+                            keepalives=1,
+                            keepalives_idle=30
+                        )
+                        logger.info("Successfully connected to Redshift")
+                    except psycopg2.Error as e:
+                        logger.error(f"Failed to connect to Redshift: {e}")
+                        raise
         
-        return self._connection
+        return self._pool
+    
+    def get_connection(self) -> psycopg2.extensions.connection:
+        """Check out a pooled connection; return it with release_connection."""
+        self._pool_slots.acquire()
+        try:
+            pool = self._get_pool()
+            conn = pool.getconn()
+            if conn.closed:
+                pool.putconn(conn, close=True)
+                conn = pool.getconn()
+            return conn
+        except Exception:
+            self._pool_slots.release()
+            raise
+    
+    def release_connection(self, conn: psycopg2.extensions.connection):
+        """Return a connection checked out with get_connection to the pool."""
+        try:
+            if self._pool is not None:
+                self._pool.putconn(conn, close=bool(conn.closed))
+        finally:
+            self._pool_slots.release()
+    
+    @contextmanager
+    def connection(self) -> Iterator[psycopg2.extensions.connection]:
+        """Borrow a pooled connection for the duration of a with block."""
+        conn = self.get_connection()
+        try:
+            yield conn
+        finally:
+            self.release_connection(conn)
     
     def execute_query(self, query: str, params: Optional[tuple] = None) -> List[Dict[str, Any]]:
         """Execute a query and return results."""
-        conn = self.get_connection()
+        with self.connection() as conn:
+            return self._execute_on(conn, query, params)
+    
+    def _execute_on(self, conn: psycopg2.extensions.connection, query: str,
+                    params: Optional[tuple] = None) -> List[Dict[str, Any]]:
+        """Execute a query on a given connection and return results."""
         try:
-            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            with conn.cursor() as cursor:
                 cursor.execute(query, params)
                 if cursor.description:
-                    results = [dict(row) for row in cursor.fetchall()]
+                    # Plain tuples zipped with the column names once, not a dict cursor copied per row
+                    columns = [column[0] for column in cursor.description]
+                    results = [dict(zip(columns, row)) for row in cursor.fetchall()]
                     logger.info(f"Query executed successfully, returned {len(results)} rows")
                     return results
                 else:
@@ -61,6 +133,138 @@ class RedshiftClient:
             logger.error(f"Query execution failed: {e}")
             raise
     
+    def execute_query_arrow(self, query: str, params: Optional[tuple] = None) -> "pa.Table":
+        """Execute a query and return its rows as a columnar Arrow table."""
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for Arrow query results")
+        
+        with self.connection() as conn:
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute(query, params)
+                    columns = [column[0] for column in cursor.description]
+                    rows = cursor.fetchall()
+            except psycopg2.Error as e:
+                conn.rollback()
+                logger.error(f"Query execution failed: {e}")
+                raise
+        
+        values = zip(*rows) if rows else [()] * len(columns)
+        table = pa.Table.from_arrays([pa.array(list(column)) for column in values], names=columns)
+        logger.info(f"Query executed successfully, returned {table.num_rows} rows")
+        return table
+    
+    def execute_in_transaction(self, queries: Sequence[str]):
+        """Execute statements on one connection as a single transaction."""
+        with self.connection() as conn:
+            try:
+                with conn.cursor() as cursor:
+                    for query in queries:
+                        cursor.execute(query)
+                conn.commit()
+                logger.info(f"Transaction of {len(queries)} statements committed")
+            except psycopg2.Error as e:
+                conn.rollback()
+                logger.error(f"Transaction failed: {e}")
+                raise
+    
+    def execute_copy(self, copy_query: str) -> Tuple[int, int]:
+        """
+        Execute a COPY and read its load metrics from the same session.
+        
+        Returns:
+            Rows loaded and files committed by the COPY
+        """
+        with self.connection() as conn:
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute(copy_query)
+                    cursor.execute("""
+                    SELECT pg_last_copy_count(),
+                           (SELECT COUNT(*) FROM stl_load_commits WHERE query = pg_last_copy_id());
+                    """)
+                    rows_loaded, files_loaded = cursor.fetchone()
+                conn.commit()
+                return rows_loaded, files_loaded
+            except psycopg2.Error as e:
+                conn.rollback()
+                logger.error(f"COPY failed: {e}")
+                raise CopyLoadError(str(e), self._last_copy_errors(conn)) from e
+    
+    def _last_copy_errors(self, conn: psycopg2.extensions.connection) -> List[Dict[str, Any]]:
+        """Load errors of the session's most recent COPY, looked up by its query id."""
+        try:
+            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                cursor.execute("""
+                SELECT TRIM(filename) AS filename, line_number, TRIM(colname) AS colname,
+                       TRIM(err_reason) AS err_reason
+                FROM stl_load_errors
+                WHERE query = pg_last_copy_id()
+                ORDER BY line_number
+                LIMIT 10;
+                """)
+                errors = [dict(row) for row in cursor.fetchall()]
+            conn.commit()
+            return errors
+        except psycopg2.Error as e:
+            conn.rollback()
+            logger.error(f"Failed to read COPY load errors: {e}")
+            return []
+    
+    def execute_scalar(self, query: str, params: Optional[tuple] = None) -> Any:
+        """Execute a query and return the first column of the first row, or None."""
+        with self.connection() as conn:
+            return self._execute_scalar_on(conn, query, params)
+    
+    def _execute_scalar_on(self, conn: psycopg2.extensions.connection, query: str,
+                           params: Optional[tuple] = None) -> Any:
+        """Execute a single-value query on a given connection with a plain tuple cursor."""
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(query, params)
+                row = cursor.fetchone()
+                return row[0] if row else None
+        except psycopg2.Error as e:
+            conn.rollback()
+            logger.error(f"Query execution failed: {e}")
+            raise
+    
+    def _execute_prepared(self, name: str, param_types: Sequence[str], statement: str,
+                          params: tuple = (), scalar: bool = False) -> Any:
+        """Execute a statement prepared once per connection, so repeat calls skip planning.
+        
+        Returns the rows as dicts, or only the first value when scalar is set.
+        """
+        with self.connection() as conn:
+            prepared = self._prepared.setdefault(conn, set())
+            if name not in prepared:
+                types = f" ({', '.join(param_types)})" if param_types else ""
+                self._execute_on(conn, f"PREPARE {name}{types} AS {statement};")
+                prepared.add(name)
+            
+            placeholders = f" ({', '.join(['%s'] * len(params))})" if params else ""
+            execute = self._execute_scalar_on if scalar else self._execute_on
+            return execute(conn, f"EXECUTE {name}{placeholders};", params or None)
+    
+    def bulk_insert(self, table_name: str, columns: Sequence[str],
+                    rows: Sequence[Sequence[Any]], page_size: int = 1000) -> int:
+        """Insert many rows with multi-row VALUES statements, page_size rows per round trip."""
+        if not rows:
+            return 0
+        
+        query = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES %s"
+        with self.connection() as conn:
+            try:
+                with conn.cursor() as cursor:
+                    execute_values(cursor, query, rows, page_size=page_size)
+                conn.commit()
+                logger.info(f"Inserted {len(rows)} rows into {table_name}")
+                return len(rows)
+            except psycopg2.Error as e:
+                conn.rollback()
+                logger.error(f"Bulk insert into {table_name} failed: {e}")
+                raise
+    
     def execute_copy_command(self, table_name: str, s3_path: str, 
                            iam_role: str, format_options: str = "JSON 'auto'") -> bool:
         """Execute COPY command to load data from S3."""
@@ -84,6 +288,32 @@ class RedshiftClient:
             logger.error(f"Failed to load data into {table_name}: {e}")
             return False
     
+    def execute_copy_from_manifest(self, table_name: str, manifest_s3_path: str,
+                                   iam_role: str, format_options: str = "JSON 'auto'",
+                                   gzip: bool = True) -> bool:
+        """Execute COPY command to load the files listed in an S3 manifest."""
+        copy_query = f"""
+        COPY {table_name}
+        FROM '{manifest_s3_path}'
+        IAM_ROLE '{iam_role}'
+        MANIFEST
+        FORMAT AS {format_options}
+        {'GZIP' if gzip else ''}
+        TIMEFORMAT 'auto'
+        DATEFORMAT 'auto'
+        TRUNCATECOLUMNS
+        BLANKSASNULL
+        EMPTYASNULL;
+        """
+        
+        try:
+            self.execute_query(copy_query)
+            logger.info(f"Successfully loaded data into {table_name} from manifest {manifest_s3_path}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to load data into {table_name} from manifest: {e}")
+            return False
+    
     def create_schema_if_not_exists(self, schema_name: str) -> bool:
         """Create schema if it doesn't exist."""
         query = f"CREATE SCHEMA IF NOT EXISTS {schema_name};"
@@ -97,31 +327,36 @@ class RedshiftClient:
     
     def table_exists(self, table_name: str, schema_name: str = 'public') -> bool:
         """Check if a table exists."""
-        query = """
-        SELECT COUNT(*) as count
+        statement = """
+        SELECT 1
         FROM information_schema.tables 
-        WHERE table_schema = %s AND table_name = %s;
+        WHERE table_schema = $1 AND table_name = $2
+        LIMIT 1
         """
         try:
-            result = self.execute_query(query, (schema_name, table_name))
-            return result[0]['count'] > 0
+            result = self._execute_prepared(
+                'table_exists', ('varchar', 'varchar'), statement, (schema_name, table_name),
+                scalar=True
+            )
+            return result is not None
         except Exception as e:
             logger.error(f"Failed to check if table exists: {e}")
             return False
     
     def get_table_row_count(self, table_name: str, schema_name: str = 'public') -> int:
         """Get the number of rows in a table."""
-        query = f"SELECT COUNT(*) as count FROM {schema_name}.{table_name};"
+        statement = f"SELECT COUNT(*) FROM {schema_name}.{table_name}"
+        name = re.sub(r'\W', '_', f"row_count_{schema_name}_{table_name}")
         try:
-            result = self.execute_query(query)
-            return result[0]['count']
+            return self._execute_prepared(name, (), statement, scalar=True) or 0
         except Exception as e:
             logger.error(f"Failed to get row count for {table_name}: {e}")
             return 0
     
-    def analyze_table(self, table_name: str, schema_name: str = 'public') -> bool:
-        """Run ANALYZE on a table to update statistics."""
-        query = f"ANALYZE {schema_name}.{table_name};"
+    def analyze_table(self, table_name: str, schema_name: str = 'public',
+                      predicate_columns: bool = False) -> bool:
+        """Run ANALYZE on a table to update statistics, optionally only on predicate columns."""
+        query = f"ANALYZE {schema_name}.{table_name}{' PREDICATE COLUMNS' if predicate_columns else ''};"
         try:
             self.execute_query(query)
             logger.info(f"Successfully analyzed table {schema_name}.{table_name}")
@@ -142,7 +377,9 @@ class RedshiftClient:
             return False
     
     def close_connection(self):
-        """Close the database connection."""
-        if self._connection and not self._connection.closed:
-            self._connection.close()
-            logger.info("Redshift connection closed")
\ No newline at end of file
+        """Close all pooled database connections."""
+        with self._pool_lock:
+            if self._pool is not None and not self._pool.closed:
+                self._pool.closeall()
+                logger.info("Redshift connection closed")
+            self._pool = None
\ No newline at end of file
@@ -2,154 +2,515 @@
 Redshift data loading utilities with optimized COPY commands.
 Handles efficient data loading from S3 to Redshift tables.
 """
+import io
 import logging
-from typing import Dict, List, Optional, Any
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import BinaryIO, Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
+from decimal import Decimal
 import json
-from .redshift_client import RedshiftClient
+import boto3
+from boto3.s3.transfer import TransferConfig
+from .redshift_client import CopyLoadError, RedshiftClient
+from .redshift_schema import TABLE_DISTRIBUTION
+
+# pyarrow is only needed by producers writing Parquet for COPY
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None
+    pq = None
 
 logger = logging.getLogger(__name__)
 
+# Target row group size for Parquet written for COPY, so each slice reads
+# whole row groups
+PARQUET_ROW_GROUP_BYTES = 128 * 1024 * 1024
+
+# Loads between ANALYZE runs on tables whose COPYs skip statistics updates,
+# when post-load ANALYZE is forced
+ANALYZE_EVERY_N_LOADS = 10
+
+# Background threads running ANALYZE after loads
+ANALYZE_WORKERS = 2
+
+# Staged Parquet shards are split per slice but kept above this many rows,
+# and large shards are uploaded in 16MB parts, eight at a time
+PARQUET_MIN_SHARD_ROWS = 10000
+STAGING_UPLOAD_WORKERS = 16
+_STAGING_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True
+)
+
+# Concurrent HeadObject calls when sizing columnar files for a COPY manifest
+MANIFEST_HEAD_WORKERS = 16
+
+
+def write_parquet_for_copy(records: List[Dict[str, Any]], destination: Union[str, BinaryIO],
+                           compression: str = 'zstd', schema: Optional['pa.Schema'] = None) -> int:
+    """
+    Write records as a Parquet file laid out for Redshift COPY.
+    
+    Args:
+        records: Rows keyed by column name
+        destination: File path, URI supported by pyarrow, or binary file object
+        compression: Parquet column compression codec
+        schema: Arrow schema to write; inferred from the records if omitted
+        
+    Returns:
+        Number of rows written
+    """
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required to write Parquet files")
+    
+    table = pa.Table.from_pylist(records, schema=schema)
+    if table.num_rows == 0:
+        pq.write_table(table, destination, compression=compression)
+        return 0
+    
+    # Size row groups by the average in-memory row width
+    bytes_per_row = max(1, table.nbytes // table.num_rows)
+    row_group_size = max(1, PARQUET_ROW_GROUP_BYTES // bytes_per_row)
+    pq.write_table(table, destination, compression=compression, row_group_size=row_group_size)
+    return table.num_rows
+
+
+# Column lists for the table loaders' COPY commands
+_TABLE_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    'artists': (
+        'artist_id',
+        'name',
+        'genre',
+        'popularity_score',
+        'formation_date',
+        'members',
+        'spotify_id',
+        'created_at',
+        'updated_at'
+    ),
+    'venues': (
+        'venue_id',
+        'name',
+        'address',
+        'city',
+        'state',
+        'country',
+        'postal_code',
+        'latitude',
+        'longitude',
+        'capacity',
+        'venue_type',
+        'amenities',
+        'ticketmaster_id',
+        'created_at',
+        'updated_at'
+    ),
+    'concerts': (
+        'concert_id',
+        'artist_id',
+        'venue_id',
+        'event_date',
+        'ticket_prices',
+        'total_attendance',
+        'revenue',
+        'status',
+        'created_at',
+        'updated_at'
+    ),
+    'ticket_sales': (
+        'sale_id',
+        'concert_id',
+        'price_tier',
+        'quantity',
+        'unit_price',
+        'total_amount',
+        'purchase_timestamp',
+        'customer_segment',
+        'created_at',
+        'updated_at'
+    )
+}
+
+
+# Tables holding nested values (members, amenities, ticket_prices) in SUPER columns
+_SUPER_COLUMN_TABLES = frozenset({'artists', 'venues', 'concerts'})
+
+# Tables whose sort key leads with a date or timestamp; staged files for them
+# are partitioned by day
+_TIME_SORTED_TABLES = frozenset({'concerts', 'ticket_sales'})
+
+# COPY codec implied by a text file's suffix when none is given
+_COMPRESSION_SUFFIXES = {'gz': 'GZIP', 'bz2': 'BZIP2', 'zst': 'ZSTD', 'lzo': 'LZOP'}
+
+# Parquet schemas matching each table's DDL, so staged files carry the
+# column types COPY expects whatever values the first rows happen to hold;
+# SUPER columns are written as nested types for SERIALIZETOJSON
+_PARQUET_SCHEMAS: Dict[str, 'pa.Schema'] = {
+    'artists': pa.schema([
+        ('artist_id', pa.string()),
+        ('name', pa.string()),
+        ('genre', pa.string()),
+        ('popularity_score', pa.decimal128(5, 2)),
+        ('formation_date', pa.date32()),
+        ('members', pa.list_(pa.string())),
+        ('spotify_id', pa.string()),
+        ('created_at', pa.timestamp('us')),
+        ('updated_at', pa.timestamp('us')),
+    ]),
+    'venues': pa.schema([
+        ('venue_id', pa.string()),
+        ('name', pa.string()),
+        ('address', pa.string()),
+        ('city', pa.string()),
+        ('state', pa.string()),
+        ('country', pa.string()),
+        ('postal_code', pa.string()),
+        ('latitude', pa.decimal128(10, 8)),
+        ('longitude', pa.decimal128(11, 8)),
+        ('capacity', pa.int32()),
+        ('venue_type', pa.string()),
+        ('amenities', pa.list_(pa.string())),
+        ('ticketmaster_id', pa.string()),
+        ('created_at', pa.timestamp('us')),
+        ('updated_at', pa.timestamp('us')),
+    ]),
+    'concerts': pa.schema([
+        ('concert_id', pa.string()),
+        ('artist_id', pa.string()),
+        ('venue_id', pa.string()),
+        ('event_date', pa.timestamp('us')),
+        ('ticket_prices', pa.map_(pa.string(), pa.float64())),
+        ('total_attendance', pa.int32()),
+        ('revenue', pa.decimal128(12, 2)),
+        ('status', pa.string()),
+        ('created_at', pa.timestamp('us')),
+        ('updated_at', pa.timestamp('us')),
+    ]),
+    'ticket_sales': pa.schema([
+        ('sale_id', pa.string()),
+        ('concert_id', pa.string()),
+        ('price_tier', pa.string()),
+        ('quantity', pa.int32()),
+        ('unit_price', pa.decimal128(8, 2)),
+        ('total_amount', pa.decimal128(10, 2)),
+        ('purchase_timestamp', pa.timestamp('us')),
+        ('customer_segment', pa.string()),
+        ('created_at', pa.timestamp('us')),
+        ('updated_at', pa.timestamp('us')),
+    ]),
+} if PYARROW_AVAILABLE else {}
+
+
+def _to_decimal(value: Any, scale: int) -> Any:
+    """A numeric value as a Decimal rounded to a column's scale; Arrow will not take floats for DECIMAL."""
+    if value is None or isinstance(value, Decimal):
+        return value
+    return Decimal(str(value)).quantize(Decimal(1).scaleb(-scale))
+
+
+@dataclass(slots=True, frozen=True)
+class TableRef:
+    """A table in a schema, with its qualified name built once."""
+    schema: str
+    name: str
+    fqn: str = field(init=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'fqn', f"{self.schema}.{self.name}")
+
 
 class RedshiftDataLoader:
     """Handles data loading operations from S3 to Redshift."""
     
-    def __init__(self, client: RedshiftClient, iam_role: str):
-        """Initialize with Redshift client and IAM role for COPY operations."""
+    def __init__(self, client: RedshiftClient, iam_role: str, force_analyze: bool = False,
+                 max_errors: int = 100):
+        """
+        Initialize with Redshift client and IAM role for COPY operations.
+        
+        Statistics are left to Redshift's automatic ANALYZE and the scheduled
+        optimize pass; force_analyze also runs ANALYZE after loads. Text
+        format COPYs skip up to max_errors bad rows; pass 0 to fail on the
+        first one.
+        """
         self.client = client
         self.iam_role = iam_role
         self.schema_name = 'concert_dw'
+        self.force_analyze = force_analyze
+        self.max_errors = max_errors
+        self._s3_client = None
+        self._slice_count: Optional[int] = None
+        # Tables known to be encoded and non-empty, and loads since each table's last ANALYZE
+        self._established_tables = set()
+        self._loads_since_analyze: Dict[str, int] = {}
+        # ANALYZE runs behind the caller; a table's next load waits for its pending run
+        self._analyze_executor = ThreadPoolExecutor(max_workers=ANALYZE_WORKERS,
+                                                    thread_name_prefix='redshift-analyze')
+        self._pending_analyze: Dict[str, Future] = {}
+        # Static part of each table loader's COPY, filled per load with the source and options
+        self._copy_templates = {
+            table: (TableRef(self.schema_name, table), self._build_copy_template(table, columns))
+            for table, columns in _TABLE_COLUMNS.items()
+        }
     
-    def load_artists_data(self, s3_path: str) -> bool:
-        """Load artists data from S3 using optimized COPY command."""
-        table_name = f"{self.schema_name}.artists"
-        
-        copy_query = f"""
-        COPY {table_name} (
-            artist_id,
-            name,
-            genre,
-            popularity_score,
-            formation_date,
-            members,
-            spotify_id,
-            created_at,
-            updated_at
+    def _build_copy_template(self, table: str, columns: Tuple[str, ...]) -> str:
+        """Build a table's COPY statement with placeholders for the per-load parts."""
+        column_list = ",\n            ".join(columns)
+        return f"""
+        COPY {self.schema_name}.{table} (
+            {column_list}
         )
-        FROM '{s3_path}'
+        FROM '{{source}}'
         IAM_ROLE '{self.iam_role}'
-        FORMAT AS JSON 'auto'
-        TIMEFORMAT 'auto'
-        DATEFORMAT 'auto'
-        TRUNCATECOLUMNS
-        BLANKSASNULL
-        EMPTYASNULL
-        MAXERROR 100;
+        {{manifest_option}}
+        {{format_options}}
+        {{update_options}};
         """
+    
+    @property
+    def s3_client(self):
+        """S3 client for writing COPY manifests, created on first use."""
+        if self._s3_client is None:
+            self._s3_client = boto3.client('s3')
+        return self._s3_client
+    
+    def get_slice_count(self) -> int:
+        """Number of slices in the cluster; COPY parallelizes best over a multiple of this many files."""
+        if self._slice_count is None:
+            self._slice_count = self.client.execute_scalar("SELECT COUNT(*) FROM stv_slices;") or 1
+        return self._slice_count
+    
+    def _copy_update_options(self, table_name: str) -> str:
+        """Skip COPY's compression analysis and stats pass once a table is encoded and non-empty."""
+        if table_name not in self._established_tables:
+            schema_name, _, table = table_name.rpartition('.')
+            try:
+                result = self.client.execute_query(
+                    'SELECT encoded, tbl_rows FROM svv_table_info WHERE "schema" = %s AND "table" = %s;',
+                    (schema_name or self.schema_name, table)
+                )
+            except Exception as e:
+                logger.warning(f"Failed to read table info for {table_name}: {e}")
+                return ''
+            if not result or not result[0]['tbl_rows'] or not result[0]['encoded'].startswith('Y'):
+                return ''
+            self._established_tables.add(table_name)
         
-        return self._execute_copy_with_monitoring(table_name, copy_query, s3_path)
+        return "COMPUPDATE OFF STATUPDATE OFF"
+    
+    def _copy_source(self, table_name: str, s3_path: Union[str, List[str]],
+                     file_format: str) -> Tuple[str, str]:
+        """Resolve a COPY source: a prefix as-is, or a list of files via a generated manifest."""
+        if isinstance(s3_path, str):
+            return s3_path, ''
+        return self.write_copy_manifest(table_name, s3_path, file_format), 'MANIFEST'
     
-    def load_venues_data(self, s3_path: str) -> bool:
-        """Load venues data from S3 using optimized COPY command."""
-        table_name = f"{self.schema_name}.venues"
+    def write_copy_manifest(self, table_name: str, s3_paths: List[str],
+                            file_format: str = 'PARQUET') -> str:
+        """
+        Write a COPY manifest listing the given files next to the first of them.
         
-        copy_query = f"""
-        COPY {table_name} (
-            venue_id,
-            name,
-            address,
-            city,
-            state,
-            country,
-            postal_code,
-            latitude,
-            longitude,
-            capacity,
-            venue_type,
-            amenities,
-            ticketmaster_id,
-            created_at,
-            updated_at
-        )
-        FROM '{s3_path}'
-        IAM_ROLE '{self.iam_role}'
-        FORMAT AS JSON 'auto'
-        TIMEFORMAT 'auto'
-        DATEFORMAT 'auto'
-        TRUNCATECOLUMNS
-        BLANKSASNULL
-        EMPTYASNULL
-        MAXERROR 100;
+        Args:
+            table_name: Target table, used to name the manifest
+            s3_paths: s3:// URLs of the files to load
+            file_format: COPY file format; columnar manifests carry each file's content_length
+            
+        Returns:
+            s3:// URL of the manifest
         """
+        if not s3_paths:
+            raise ValueError("At least one S3 path is required for a COPY manifest")
         
-        return self._execute_copy_with_monitoring(table_name, copy_query, s3_path)
-    
-    def load_concerts_data(self, s3_path: str) -> bool:
-        """Load concerts data from S3 using optimized COPY command."""
-        table_name = f"{self.schema_name}.concerts"
+        entries = [{'url': path, 'mandatory': True} for path in s3_paths]
+        if file_format.upper() in ('PARQUET', 'ORC'):
+            with ThreadPoolExecutor(max_workers=MANIFEST_HEAD_WORKERS) as executor:
+                sizes = executor.map(self._object_size, s3_paths)
+                for entry, size in zip(entries, sizes):
+                    entry['meta'] = {'content_length': size}
         
-        copy_query = f"""
-        COPY {table_name} (
-            concert_id,
-            artist_id,
-            venue_id,
-            event_date,
-            ticket_prices,
-            total_attendance,
-            revenue,
-            status,
-            created_at,
-            updated_at
+        slices = self.get_slice_count()
+        if len(s3_paths) % slices:
+            logger.info(f"COPY into {table_name} lists {len(s3_paths)} files, "
+                        f"not a multiple of the {slices} cluster slices")
+        
+        bucket = s3_paths[0][len('s3://'):].split('/', 1)[0]
+        key = (f"manifests/{table_name}/"
+               f"{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}.manifest")
+        self.s3_client.put_object(
+            Bucket=bucket,
+            Key=key,
+            Body=json.dumps({'entries': entries}).encode('utf-8'),
+            ContentType='application/json'
         )
-        FROM '{s3_path}'
-        IAM_ROLE '{self.iam_role}'
-        FORMAT AS JSON 'auto'
-        TIMEFORMAT 'auto'
-        DATEFORMAT 'auto'
-        TRUNCATECOLUMNS
-        BLANKSASNULL
-        EMPTYASNULL
-        MAXERROR 100;
+        return f"s3://{bucket}/{key}"
+    
+    def prepare_s3_payload(self, records: List[Dict[str, Any]], table_key: str, s3_prefix: str) -> List[str]:
         """
+        Write records for a table as typed Parquet shards under an S3 prefix, for load_*_data(file_format='PARQUET').
         
-        return self._execute_copy_with_monitoring(table_name, copy_query, s3_path)
-    
-    def load_ticket_sales_data(self, s3_path: str) -> bool:
-        """Load ticket sales data from S3 using optimized COPY command."""
-        table_name = f"{self.schema_name}.ticket_sales"
+        Columns are typed from the table's DDL, so values must already be
+        the matching Python types (datetime, date, numbers, lists for SUPER
+        arrays). Rows are ordered by the table's sort key, and tables sorted
+        by time get one date=YYYY-MM-DD partition per day, so a COPY of the returned
+        list leaves the table close to sorted. Each partition is split into up
+        to one shard per cluster slice; shards are uploaded concurrently.
         
-        copy_query = f"""
-        COPY {table_name} (
-            sale_id,
-            concert_id,
-            price_tier,
-            quantity,
-            unit_price,
-            total_amount,
-            purchase_timestamp,
-            customer_segment,
-            created_at,
-            updated_at
+        Args:
+            records: Rows for the table, keyed by column name
+            table_key: Table name as used by the loaders, e.g. 'venues'
+            s3_prefix: s3:// prefix to write the shards under
+            
+        Returns:
+            s3:// URLs of the written shards, in sort key order
+        """
+        if not records:
+            return []
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required to write Parquet files")
+        
+        schema = _PARQUET_SCHEMAS[table_key]
+        decimal_scales = {field.name: field.type.scale for field in schema if pa.types.is_decimal(field.type)}
+        rows = [{col: record.get(col) for col in schema.names} for record in records]
+        for row in rows:
+            for col, scale in decimal_scales.items():
+                row[col] = _to_decimal(row[col], scale)
+        
+        sortkey = TABLE_DISTRIBUTION.get(table_key, (None, ()))[1]
+        if sortkey:
+            rows.sort(key=lambda row: tuple((row[col] is None, row[col]) for col in sortkey))
+        
+        partitions: Dict[str, List[Dict[str, Any]]] = {}
+        if table_key in _TIME_SORTED_TABLES:
+            for row in rows:
+                day = row[sortkey[0]]
+                partitions.setdefault(f"date={str(day)[:10] if day else 'unknown'}/", []).append(row)
+        else:
+            partitions[''] = rows
+        
+        bucket, _, prefix = s3_prefix[len('s3://'):].partition('/')
+        base_key = (f"{prefix.rstrip('/')}/"
+                    f"{table_key}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}").lstrip('/')
+        
+        slices = self.get_slice_count()
+        shards = []
+        for partition, partition_rows in partitions.items():
+            shard_count = max(1, min(slices, len(partition_rows) // PARQUET_MIN_SHARD_ROWS))
+            shard_size = -(-len(partition_rows) // shard_count) if partition_rows else 0
+            for index in range(shard_count):
+                shards.append((f"{base_key}/{partition}part-{index:04d}.parquet",
+                               partition_rows[index * shard_size:(index + 1) * shard_size]))
+        
+        def upload_shard(shard: Tuple[str, List[Dict[str, Any]]]) -> str:
+            key, shard_rows = shard
+            buffer = io.BytesIO()
+            write_parquet_for_copy(shard_rows, buffer, schema=schema)
+            buffer.seek(0)
+            self.s3_client.upload_fileobj(
+                buffer, bucket, key,
+                ExtraArgs={'ContentType': 'application/vnd.apache.parquet'},
+                Config=_STAGING_TRANSFER_CONFIG
+            )
+            return f"s3://{bucket}/{key}"
+        
+        with ThreadPoolExecutor(max_workers=min(len(shards), STAGING_UPLOAD_WORKERS)) as executor:
+            return list(executor.map(upload_shard, shards))
+    
+    def _object_size(self, s3_path: str) -> int:
+        """Size in bytes of an S3 object given by s3:// URL."""
+        bucket, key = s3_path[len('s3://'):].split('/', 1)
+        return self.s3_client.head_object(Bucket=bucket, Key=key)['ContentLength']
+    
+    def load_artists_data(self, s3_path: Union[str, List[str]], file_format: str = 'JSON',
+                          compression: Optional[str] = None) -> bool:
+        """Load artists data from an S3 prefix, or from a list of files in one COPY."""
+        return self._load_table('artists', s3_path, file_format, compression)
+    
+    def load_venues_data(self, s3_path: Union[str, List[str]], file_format: str = 'JSON',
+                         compression: Optional[str] = None) -> bool:
+        """Load venues data from an S3 prefix, or from a list of files in one COPY."""
+        return self._load_table('venues', s3_path, file_format, compression)
+    
+    def load_concerts_data(self, s3_path: Union[str, List[str]], file_format: str = 'JSON',
+                           compression: Optional[str] = None) -> bool:
+        """Load concerts data from an S3 prefix, or from a list of files in one COPY."""
+        return self._load_table('concerts', s3_path, file_format, compression)
+    
+    def load_ticket_sales_data(self, s3_path: Union[str, List[str]], file_format: str = 'JSON',
+                               compression: Optional[str] = None) -> bool:
+        """Load ticket sales data from an S3 prefix, or from a list of files in one COPY."""
+        return self._load_table('ticket_sales', s3_path, file_format, compression)
+    
+    def _load_table(self, table: str, s3_path: Union[str, List[str]], file_format: str,
+                    compression: Optional[str]) -> bool:
+        """Fill a table's prebuilt COPY template and run it."""
+        table_ref, template = self._copy_templates[table]
+        compression = compression or self._infer_compression(s3_path)
+        source, manifest_option = self._copy_source(table_ref.fqn, s3_path, file_format)
+        copy_query = template.format(
+            source=source,
+            manifest_option=manifest_option,
+            format_options=self._copy_format_options(file_format, table in _SUPER_COLUMN_TABLES,
+                                                     compression, self.max_errors),
+            update_options=self._copy_update_options(table_ref.fqn)
         )
-        FROM '{s3_path}'
-        IAM_ROLE '{self.iam_role}'
-        FORMAT AS JSON 'auto'
-        TIMEFORMAT 'auto'
-        DATEFORMAT 'auto'
-        TRUNCATECOLUMNS
-        BLANKSASNULL
-        EMPTYASNULL
-        MAXERROR 100;
+        
+        return self._execute_copy_with_monitoring(table_ref, copy_query, source)
+    
+    @staticmethod
+    def _copy_format_options(file_format: str, has_super_columns: bool = False,
+                             compression: Optional[str] = None, max_errors: int = 100) -> str:
         """
+        Build the COPY format clause; columnar formats reject the text conversion options.
+        
+        compression applies to text formats only; Parquet and ORC compress
+        internally.
         
-        return self._execute_copy_with_monitoring(table_name, copy_query, s3_path)
+        Tables with SUPER columns take nested Parquet/ORC values as JSON and
+        skip TRUNCATECOLUMNS, which would cut serialized JSON short.
+        """
+        file_format = file_format.upper()
+        if file_format in ('PARQUET', 'ORC'):
+            return f"FORMAT AS {file_format} SERIALIZETOJSON" if has_super_columns else f"FORMAT AS {file_format}"
+        if file_format == 'JSON':
+            options = ["FORMAT AS JSON 'auto'", RedshiftDataLoader._compression_option(compression),
+                       "TIMEFORMAT 'auto'", "DATEFORMAT 'auto'"]
+            if not has_super_columns:
+                options.append("TRUNCATECOLUMNS")
+            options += ["BLANKSASNULL", "EMPTYASNULL", f"MAXERROR {max_errors}"]
+            return "\n        ".join(option for option in options if option)
+        raise ValueError(f"Unsupported COPY file format: {file_format}")
+    
+    @staticmethod
+    def _infer_compression(s3_path: Union[str, List[str]]) -> Optional[str]:
+        """Codec implied by a file's suffix (the first file of a list); prefixes and plain files have none."""
+        if not isinstance(s3_path, str):
+            s3_path = s3_path[0] if s3_path else ''
+        return _COMPRESSION_SUFFIXES.get(s3_path.rsplit('.', 1)[-1].lower()) if '.' in s3_path else None
+    
+    @staticmethod
+    def _compression_option(compression: Optional[str]) -> str:
+        """COPY option for compressed text input, or an empty string for plain files."""
+        if not compression:
+            return ''
+        if compression.upper() not in ('GZIP', 'BZIP2', 'ZSTD', 'LZOP'):
+            raise ValueError(f"Unsupported COPY compression: {compression}")
+        return compression.upper()
     
     def load_csv_data(self, table_name: str, s3_path: str, 
                      column_list: Optional[List[str]] = None,
                      delimiter: str = ',', 
-                     has_header: bool = True) -> bool:
+                     has_header: bool = True,
+                     compression: Optional[str] = None) -> bool:
         """Load CSV data from S3 with flexible configuration."""
         full_table_name = f"{self.schema_name}.{table_name}"
+        compression = compression or self._infer_compression(s3_path)
         
         # Build column specification
         columns_spec = ""
@@ -166,18 +527,27 @@ class RedshiftDataLoader:
         FROM '{s3_path}'
         IAM_ROLE '{self.iam_role}'
         FORMAT AS {format_options}
+        {self._compression_option(compression)}
         TIMEFORMAT 'auto'
         DATEFORMAT 'auto'
         TRUNCATECOLUMNS
         BLANKSASNULL
         EMPTYASNULL
-        MAXERROR 100;
+        MAXERROR {self.max_errors}
+        {self._copy_update_options(full_table_name)};
         """
         
-        return self._execute_copy_with_monitoring(full_table_name, copy_query, s3_path)
+        return self._execute_copy_with_monitoring(TableRef(self.schema_name, table_name), copy_query, s3_path)
     
-    def load_manifest_data(self, table_name: str, manifest_s3_path: str) -> bool:
-        """Load data using S3 manifest file for multiple files."""
+    def load_manifest_data(self, table_name: str, manifest_s3_path: str,
+                           compression: Optional[str] = None) -> bool:
+        """
+        Load data using S3 manifest file for multiple files.
+        
+        The manifest's own name says nothing about the files it lists, so
+        compressed entries need compression passed explicitly, e.g. 'gzip'
+        for the stream processor's .ndjson.gz batches.
+        """
         full_table_name = f"{self.schema_name}.{table_name}"
         
         copy_query = f"""
@@ -186,58 +556,93 @@ class RedshiftDataLoader:
         IAM_ROLE '{self.iam_role}'
         FORMAT AS JSON 'auto'
         MANIFEST
+        {self._compression_option(compression)}
         TIMEFORMAT 'auto'
         DATEFORMAT 'auto'
         TRUNCATECOLUMNS
         BLANKSASNULL
         EMPTYASNULL
-        MAXERROR 100;
+        MAXERROR {self.max_errors}
+        {self._copy_update_options(full_table_name)};
         """
         
-        return self._execute_copy_with_monitoring(full_table_name, copy_query, manifest_s3_path)
+        return self._execute_copy_with_monitoring(TableRef(self.schema_name, table_name), copy_query,
+                                                  manifest_s3_path)
     
     def upsert_data(self, table_name: str, s3_path: str, 
-                   primary_keys: List[str], update_columns: List[str]) -> bool:
-        """Perform upsert operation using staging table."""
-        staging_table = f"{self.schema_name}.{table_name}_staging"
+                   primary_keys: List[str], update_columns: List[str],
+                   rebuild: bool = False, compression: Optional[str] = None) -> bool:
+        """
+        Perform upsert operation using staging table.
+        
+        Rows are merged in place with MERGE. With rebuild set, the merged
+        result is instead bulk-inserted into a fresh copy of the table that is
+        swapped in by rename, leaving no deleted rows behind for VACUUM.
+        
+        CREATE TABLE LIKE copies neither constraints nor grants, and the old
+        table cannot be dropped while views or foreign keys depend on it, so
+        rebuild only applies to tables without any of these; others (the
+        warehouse tables among them) are merged in place instead.
+        """
+        staging_table = f"{table_name}_staging"
         main_table = f"{self.schema_name}.{table_name}"
+        compression = compression or self._infer_compression(s3_path)
+        if rebuild and self._has_dependents(table_name):
+            logger.warning(f"{main_table} has constraints, grants or dependent views; merging in place")
+            rebuild = False
         
         try:
-            # Create staging table
-            create_staging_query = f"""
-            CREATE TEMP TABLE {staging_table} (LIKE {main_table});
-            """
-            self.client.execute_query(create_staging_query)
-            
-            # Load data into staging table
-            copy_query = f"""
+            # Load data into a staging table shaped like the main table
+            statements = [
+                self._create_staging_table_statement(table_name, staging_table, main_table),
+                f"""
             COPY {staging_table}
             FROM '{s3_path}'
             IAM_ROLE '{self.iam_role}'
             FORMAT AS JSON 'auto'
+            {self._compression_option(compression)}
             TIMEFORMAT 'auto'
             DATEFORMAT 'auto'
             TRUNCATECOLUMNS
             BLANKSASNULL
-            EMPTYASNULL;
+            EMPTYASNULL
+            {self._copy_update_options(main_table)};
             """
-            self.client.execute_query(copy_query)
+            ]
             
-            # Delete existing records that will be updated
             pk_conditions = " AND ".join([f"main.{pk} = staging.{pk}" for pk in primary_keys])
-            delete_query = f"""
-            DELETE FROM {main_table}
+            if rebuild:
+                new_table = f"{table_name}_rebuild"
+                old_table = f"{table_name}_previous"
+                statements += [
+                    f"CREATE TABLE {self.schema_name}.{new_table} (LIKE {main_table});",
+                    # Bulk insert into the empty table sorts it on the sort key
+                    f"""
+            INSERT INTO {self.schema_name}.{new_table}
+            SELECT * FROM {main_table} main
+            WHERE NOT EXISTS (SELECT 1 FROM {staging_table} staging WHERE {pk_conditions})
+            UNION ALL
+            SELECT * FROM {staging_table};
+            """,
+                    f"ALTER TABLE {main_table} RENAME TO {old_table};",
+                    f"ALTER TABLE {self.schema_name}.{new_table} RENAME TO {table_name};",
+                    f"DROP TABLE {self.schema_name}.{old_table};"
+                ]
+            else:
+                columns = self._table_columns(table_name)
+                set_columns = update_columns or primary_keys[:1]
+                set_clause = ", ".join([f"{col} = staging.{col}" for col in set_columns])
+                statements.append(f"""
+            MERGE INTO {main_table} main
             USING {staging_table} staging
-            WHERE {pk_conditions};
-            """
-            self.client.execute_query(delete_query)
+            ON {pk_conditions}
+            WHEN MATCHED THEN UPDATE SET {set_clause}
+            WHEN NOT MATCHED THEN INSERT ({', '.join(columns)})
+            VALUES ({', '.join(f'staging.{col}' for col in columns)});
+            """)
+            statements.append(f"DROP TABLE {staging_table};")
             
-            # Insert all records from staging
-            insert_query = f"""
-            INSERT INTO {main_table}
-            SELECT * FROM {staging_table};
-            """
-            self.client.execute_query(insert_query)
+            self.client.execute_in_transaction(statements)
             
             logger.info(f"Successfully upserted data into {main_table}")
             return True
@@ -246,121 +651,201 @@ class RedshiftDataLoader:
             logger.error(f"Failed to upsert data into {table_name}: {e}")
             return False
     
-    def _execute_copy_with_monitoring(self, table_name: str, copy_query: str, s3_path: str) -> bool:
+    def _has_dependents(self, table_name: str) -> bool:
+        """Whether a table has constraints, grants, or views depending on it, which a rebuild would lose or break."""
+        return bool(self.client.execute_scalar(
+            """
+            SELECT EXISTS (
+                SELECT 1
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = %s AND c.relname = %s
+                  AND (c.relacl IS NOT NULL
+                       OR EXISTS (SELECT 1 FROM pg_constraint con
+                                  WHERE con.conrelid = c.oid OR con.confrelid = c.oid)
+                       OR EXISTS (SELECT 1 FROM pg_depend d
+                                  JOIN pg_rewrite r ON r.oid = d.objid
+                                  WHERE d.refobjid = c.oid AND r.ev_class <> c.oid))
+            );
+            """,
+            (self.schema_name, table_name)
+        ))
+    
+    @staticmethod
+    def _create_staging_table_statement(table_name: str, staging_table: str, main_table: str) -> str:
+        """CREATE TEMP for a staging table distributed and sorted like its target, so the merge join stays local."""
+        distribution = TABLE_DISTRIBUTION.get(table_name)
+        if distribution is None:
+            return f"CREATE TEMP TABLE {staging_table} (LIKE {main_table}) BACKUP NO;"
+        
+        distkey, sortkey = distribution
+        dist_clause = f"DISTKEY ({distkey})" if distkey else "DISTSTYLE EVEN"
+        return (f"CREATE TEMP TABLE {staging_table} (LIKE {main_table}) BACKUP NO "
+                f"{dist_clause} SORTKEY ({', '.join(sortkey)});")
+    
+    def _table_columns(self, table_name: str) -> List[str]:
+        """Column names of a table in the loader's schema, in table order."""
+        rows = self.client.execute_query(
+            """
+            SELECT column_name
+            FROM information_schema.columns
+            WHERE table_schema = %s AND table_name = %s
+            ORDER BY ordinal_position;
+            """,
+            (self.schema_name, table_name)
+        )
+        return [row['column_name'] for row in rows]
+    
+    def _execute_copy_with_monitoring(self, table_ref: TableRef, copy_query: str, s3_path: str) -> bool:
         """Execute COPY command with monitoring and error handling."""
         start_time = datetime.utcnow()
+        table_name = table_ref.fqn
+        self._wait_for_analyze(table_name)
         
         try:
-            # Get initial row count
-            initial_count = self.client.get_table_row_count(
-                table_name.split('.')[-1], 
-                self.schema_name
-            )
-            
-            # Execute COPY command
-            self.client.execute_query(copy_query)
-            
-            # Get final row count
-            final_count = self.client.get_table_row_count(
-                table_name.split('.')[-1], 
-                self.schema_name
-            )
-            
-            # Calculate metrics
-            rows_loaded = final_count - initial_count
+            # Execute COPY and read its row and file counts from the session
+            rows_loaded, files_loaded = self.client.execute_copy(copy_query)
             duration = (datetime.utcnow() - start_time).total_seconds()
             
-            logger.info(f"Successfully loaded {rows_loaded} rows into {table_name} "
+            logger.info(f"Successfully loaded {rows_loaded} rows from {files_loaded} files into {table_name} "
                        f"from {s3_path} in {duration:.2f} seconds")
             
-            # Run ANALYZE to update statistics
-            self.client.analyze_table(table_name.split('.')[-1], self.schema_name)
+            if self.force_analyze:
+                # COPY defers statistics on established tables, so ANALYZE every few loads
+                loads = self._loads_since_analyze.get(table_name, 0) + 1
+                if loads >= ANALYZE_EVERY_N_LOADS or table_name not in self._established_tables:
+                    self._pending_analyze[table_name] = self._analyze_executor.submit(
+                        self.client.analyze_table, table_ref.name, table_ref.schema
+                    )
+                    loads = 0
+                self._loads_since_analyze[table_name] = loads
             
             return True
             
+        except CopyLoadError as e:
+            logger.error(f"Failed to load data into {table_name} from {s3_path}: {e}")
+            self._log_copy_errors(e.load_errors)
+            return False
         except Exception as e:
             logger.error(f"Failed to load data into {table_name} from {s3_path}: {e}")
-            
-            # Check for COPY errors
-            self._check_copy_errors()
             return False
     
-    def _check_copy_errors(self):
-        """Check STL_LOAD_ERRORS for recent COPY command errors."""
-        error_query = """
-        SELECT 
-            starttime,
-            filename,
-            line_number,
-            colname,
-            type,
-            position,
-            raw_line,
-            err_reason
-        FROM stl_load_errors 
-        WHERE starttime >= DATEADD(minute, -10, GETDATE())
-        ORDER BY starttime DESC
-        LIMIT 10;
+    def _wait_for_analyze(self, table_name: str):
+        """Wait for a table's pending background ANALYZE, if any."""
+        future = self._pending_analyze.pop(table_name, None)
+        if future is not None:
+            future.result()
+    
+    def wait_for_pending_analyze(self):
+        """Wait for all background ANALYZE runs started by earlier loads."""
+        for table_name in list(self._pending_analyze):
+            self._wait_for_analyze(table_name)
+    
+    def _log_copy_errors(self, load_errors: List[Dict[str, Any]]):
+        """Log the STL_LOAD_ERRORS rows recorded for a failed COPY."""
+        if load_errors:
+            logger.error("COPY errors found:")
+            for error in load_errors:
+                logger.error(f"  File: {error['filename']}, Line: {error['line_number']}, "
+                           f"Column: {error['colname']}, Reason: {error['err_reason']}")
+    
+    def get_load_statistics(self, table_name: str, include_timestamps: bool = False) -> Dict[str, Any]:
         """
+        Get loading statistics for a table.
         
-        try:
-            errors = self.client.execute_query(error_query)
-            if errors:
-                logger.error("Recent COPY errors found:")
-                for error in errors:
-                    logger.error(f"  File: {error['filename']}, Line: {error['line_number']}, "
-                               f"Column: {error['colname']}, Reason: {error['err_reason']}")
-        except Exception as e:
-            logger.error(f"Failed to check COPY errors: {e}")
-    
-    def get_load_statistics(self, table_name: str) -> Dict[str, Any]:
-        """Get loading statistics for a table."""
-        stats_query = f"""
-        SELECT 
-            COUNT(*) as total_rows,
-            MIN(created_at) as earliest_record,
-            MAX(created_at) as latest_record,
-            MAX(updated_at) as last_updated
-        FROM {self.schema_name}.{table_name};
+        total_rows is the catalog's row estimate. created_at/updated_at are
+        not sort key columns, so their MIN/MAX need a full scan and are only
+        read when include_timestamps is set; otherwise they are None.
         """
+        rows_query = """
+        SELECT estimated_visible_rows AS total_rows
+        FROM svv_table_info
+        WHERE "schema" = %s AND "table" = %s;
+        """
+        stats = {'total_rows': 0, 'earliest_record': None, 'latest_record': None, 'last_updated': None}
         
         try:
-            result = self.client.execute_query(stats_query)
+            result = self.client.execute_query(rows_query, (self.schema_name, table_name))
             if result:
-                return result[0]
-            return {}
+                stats['total_rows'] = result[0]['total_rows']
+            
+            if include_timestamps:
+                timestamps_query = f"""
+                SELECT 
+                    MIN(created_at) as earliest_record,
+                    MAX(created_at) as latest_record,
+                    MAX(updated_at) as last_updated
+                FROM {self.schema_name}.{table_name};
+                """
+                result = self.client.execute_query(timestamps_query)
+                if result:
+                    stats.update(result[0])
+            
+            return stats
         except Exception as e:
             logger.error(f"Failed to get load statistics for {table_name}: {e}")
             return {}
     
     def validate_data_integrity(self) -> Dict[str, Any]:
-        """Validate data integrity across all tables."""
+        """
+        Validate data integrity across all tables.
+        
+        Orphan counts and each table's latest update come from one query;
+        row counts are the catalog's estimates rather than table scans.
+        """
         validation_results = {}
+        tables = ['artists', 'venues', 'concerts', 'ticket_sales']
         
-        # Check for orphaned records
-        orphaned_concerts_query = f"""
-        SELECT COUNT(*) as orphaned_concerts
-        FROM {self.schema_name}.concerts c
-        LEFT JOIN {self.schema_name}.artists a ON c.artist_id = a.artist_id
-        LEFT JOIN {self.schema_name}.venues v ON c.venue_id = v.venue_id
-        WHERE a.artist_id IS NULL OR v.venue_id IS NULL;
+        last_updated_union = "\n            UNION ALL\n            ".join(
+            f"SELECT '{table}' AS table_name, MAX(updated_at) AS last_updated FROM {self.schema_name}.{table}"
+            for table in tables
+        )
+        integrity_query = f"""
+        WITH orphaned_concerts AS (
+            SELECT COUNT(*) AS orphaned_concerts
+            FROM {self.schema_name}.concerts c
+            LEFT JOIN {self.schema_name}.artists a ON c.artist_id = a.artist_id
+            LEFT JOIN {self.schema_name}.venues v ON c.venue_id = v.venue_id
+            WHERE a.artist_id IS NULL OR v.venue_id IS NULL
+        ),
+        orphaned_sales AS (
+            SELECT COUNT(*) AS orphaned_sales
+            FROM {self.schema_name}.ticket_sales ts
+            LEFT JOIN {self.schema_name}.concerts c ON ts.concert_id = c.concert_id
+            WHERE c.concert_id IS NULL
+        ),
+        last_updated AS (
+            {last_updated_union}
+        )
+        SELECT lu.table_name, lu.last_updated, oc.orphaned_concerts, os.orphaned_sales
+        FROM last_updated lu
+        CROSS JOIN orphaned_concerts oc
+        CROSS JOIN orphaned_sales os;
         """
         
-        orphaned_sales_query = f"""
-        SELECT COUNT(*) as orphaned_sales
-        FROM {self.schema_name}.ticket_sales ts
-        LEFT JOIN {self.schema_name}.concerts c ON ts.concert_id = c.concert_id
-        WHERE c.concert_id IS NULL;
+        # System views run on the leader node, so estimates are read separately
+        row_estimates_query = """
+        SELECT "table" AS table_name, estimated_visible_rows AS total_rows
+        FROM svv_table_info
+        WHERE "schema" = %s;
         """
         
         try:
-            validation_results['orphaned_concerts'] = self.client.execute_query(orphaned_concerts_query)[0]['orphaned_concerts']
-            validation_results['orphaned_sales'] = self.client.execute_query(orphaned_sales_query)[0]['orphaned_sales']
+            rows = self.client.execute_query(integrity_query)
+            estimates = {
+                row['table_name']: row['total_rows']
+                for row in self.client.execute_query(row_estimates_query, (self.schema_name,))
+            }
+            
+            validation_results['orphaned_concerts'] = rows[0]['orphaned_concerts']
+            validation_results['orphaned_sales'] = rows[0]['orphaned_sales']
             
             # Check data quality metrics
-            for table in ['artists', 'venues', 'concerts', 'ticket_sales']:
-                stats = self.get_load_statistics(table)
-                validation_results[f'{table}_stats'] = stats
+            for row in rows:
+                validation_results[f"{row['table_name']}_stats"] = {
+                    'total_rows': estimates.get(row['table_name'], 0),
+                    'last_updated': row['last_updated']
+                }
             
             return validation_results
             
@@ -3,11 +3,49 @@ Redshift data warehouse schema definitions.
 Defines table structures with appropriate distribution keys and sort keys for optimal performance.
 """
 import logging
-from typing import Dict, List
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from .redshift_client import RedshiftClient
 
 logger = logging.getLogger(__name__)
 
+# Tables grouped by foreign key dependencies: dimension tables, then the
+# tables referencing only them, then the tables referencing concerts
+TABLE_CREATION_LAYERS = (
+    ('artists', 'venues'),
+    ('concerts', 'venue_popularity', 'artist_performance'),
+    ('ticket_sales', 'daily_sales_summary'),
+)
+DDL_WORKERS = 4
+
+# Distribution key (None for DISTSTYLE EVEN) and sort key columns of each
+# table, matching the DDL below; used to lay out staging tables like their targets
+TABLE_DISTRIBUTION: Dict[str, Tuple[Optional[str], Tuple[str, ...]]] = {
+    'artists': (None, ('name', 'popularity_score')),
+    'venues': (None, ('city', 'capacity')),
+    'concerts': ('artist_id', ('event_date', 'artist_id')),
+    'ticket_sales': ('concert_id', ('purchase_timestamp', 'concert_id')),
+    'venue_popularity': (None, ('calculated_on', 'popularity_rank')),
+    'artist_performance': (None, ('calculated_on', 'revenue_generated')),
+    'daily_sales_summary': ('artist_id', ('summary_date', 'total_revenue')),
+}
+
+# Catalog checks for migrating analytics tables created before calculated_on
+# became their leading sort key column
+_COLUMN_EXISTS_QUERY = """
+SELECT 1
+FROM information_schema.columns
+WHERE table_schema = %s AND table_name = %s AND column_name = %s
+"""
+_LEADING_SORT_KEY_QUERY = """
+SELECT a.attname
+FROM pg_catalog.pg_attribute a
+JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+WHERE n.nspname = %s AND c.relname = %s AND a.attsortkeyord = 1
+"""
+
 
 class RedshiftSchemaManager:
     """Manages Redshift schema creation and maintenance."""
@@ -23,32 +61,16 @@ class RedshiftSchemaManager:
             # Create schema first
             self.client.create_schema_if_not_exists(self.schema_name)
             
-            # Create tables in dependency order
+            # Create tables layer by layer; tables within a layer only reference
+            # tables in earlier layers, so they are created concurrently on
+            # separate pooled connections
             tables_created = []
-            
-            # Dimension tables first
-            if self._create_artists_table():
-                tables_created.append('artists')
-            
-            if self._create_venues_table():
-                tables_created.append('venues')
-            
-            # Fact tables
-            if self._create_concerts_table():
-                tables_created.append('concerts')
-            
-            if self._create_ticket_sales_table():
-                tables_created.append('ticket_sales')
-            
-            # Analytics tables
-            if self._create_venue_popularity_table():
-                tables_created.append('venue_popularity')
-            
-            if self._create_artist_performance_table():
-                tables_created.append('artist_performance')
-            
-            if self._create_daily_sales_summary_table():
-                tables_created.append('daily_sales_summary')
+            with ThreadPoolExecutor(max_workers=DDL_WORKERS) as executor:
+                for layer in TABLE_CREATION_LAYERS:
+                    created = executor.map(
+                        lambda table: getattr(self, f"_create_{table}_table")(), layer
+                    )
+                    tables_created.extend(table for table, ok in zip(layer, created) if ok)
             
             logger.info(f"Successfully created tables: {', '.join(tables_created)}")
             return len(tables_created) > 0
@@ -72,7 +94,7 @@ class RedshiftSchemaManager:
             genre VARCHAR(500),
             popularity_score DECIMAL(5,2) DEFAULT 0.0,
             formation_date DATE,
-            members VARCHAR(1000),
+            members SUPER,
             spotify_id VARCHAR(50),
             created_at TIMESTAMP NOT NULL,
             updated_at TIMESTAMP NOT NULL,
@@ -111,7 +133,7 @@ class RedshiftSchemaManager:
             longitude DECIMAL(11,8),
             capacity INTEGER NOT NULL,
             venue_type VARCHAR(50) NOT NULL,
-            amenities VARCHAR(1000),
+            amenities SUPER,
             ticketmaster_id VARCHAR(50),
             created_at TIMESTAMP NOT NULL,
             updated_at TIMESTAMP NOT NULL,
@@ -143,7 +165,7 @@ class RedshiftSchemaManager:
             artist_id VARCHAR(50) NOT NULL,
             venue_id VARCHAR(50) NOT NULL,
             event_date TIMESTAMP NOT NULL,
-            ticket_prices VARCHAR(2000),
+            ticket_prices SUPER,
             total_attendance INTEGER,
             revenue DECIMAL(12,2),
             status VARCHAR(20) DEFAULT 'scheduled',
@@ -206,7 +228,7 @@ class RedshiftSchemaManager:
         
         if self.client.table_exists('venue_popularity', self.schema_name):
             logger.info(f"Table {table_name} already exists")
-            return True
+            return self._migrate_calculated_on('venue_popularity')
         
         create_query = f"""
         CREATE TABLE {table_name} (
@@ -217,11 +239,12 @@ class RedshiftSchemaManager:
             booking_frequency DECIMAL(8,2),
             total_events INTEGER,
             calculated_at TIMESTAMP NOT NULL,
+            calculated_on DATE NOT NULL DEFAULT CURRENT_DATE,
             PRIMARY KEY (venue_id, calculated_at),
             FOREIGN KEY (venue_id) REFERENCES {self.schema_name}.venues(venue_id)
         )
         DISTSTYLE EVEN
-        SORTKEY (calculated_at DESC, popularity_rank);
+        SORTKEY (calculated_on, popularity_rank);
         """
         
         try:
@@ -238,7 +261,7 @@ class RedshiftSchemaManager:
         
         if self.client.table_exists('artist_performance', self.schema_name):
             logger.info(f"Table {table_name} already exists")
-            return True
+            return self._migrate_calculated_on('artist_performance')
         
         create_query = f"""
         CREATE TABLE {table_name} (
@@ -249,11 +272,12 @@ class RedshiftSchemaManager:
             fan_engagement_score DECIMAL(5,2) DEFAULT 0.0,
             growth_trend VARCHAR(20) DEFAULT 'stable',
             calculated_at TIMESTAMP NOT NULL,
+            calculated_on DATE NOT NULL DEFAULT CURRENT_DATE,
             PRIMARY KEY (artist_id, calculated_at),
             FOREIGN KEY (artist_id) REFERENCES {self.schema_name}.artists(artist_id)
         )
         DISTSTYLE EVEN
-        SORTKEY (calculated_at DESC, revenue_generated DESC);
+        SORTKEY (calculated_on, revenue_generated DESC);
         """
         
         try:
@@ -264,6 +288,32 @@ class RedshiftSchemaManager:
             logger.error(f"Failed to create table {table_name}: {e}")
             return False
     
+    def _migrate_calculated_on(self, table: str) -> bool:
+        """Add calculated_on to an analytics table created before it and make it the leading sort key.
+        
+        The column is backfilled from calculated_at; without it the analytics
+        procedures and views fail on existing warehouses.
+        """
+        table_name = f"{self.schema_name}.{table}"
+        
+        try:
+            if not self.client.execute_scalar(_COLUMN_EXISTS_QUERY, (self.schema_name, table, 'calculated_on')):
+                self.client.execute_in_transaction([
+                    f"ALTER TABLE {table_name} ADD COLUMN calculated_on DATE NOT NULL DEFAULT CURRENT_DATE;",
+                    f"UPDATE {table_name} SET calculated_on = calculated_at::DATE;"
+                ])
+                logger.info(f"Added calculated_on to {table_name}")
+            
+            if self.client.execute_scalar(_LEADING_SORT_KEY_QUERY, (self.schema_name, table)) != 'calculated_on':
+                sort_key = ', '.join(TABLE_DISTRIBUTION[table][1])
+                self.client.execute_query(f"ALTER TABLE {table_name} ALTER SORTKEY ({sort_key});")
+                logger.info(f"Changed sort key of {table_name} to ({sort_key})")
+            
+            return True
+        except Exception as e:
+            logger.error(f"Failed to migrate table {table_name}: {e}")
+            return False
+    
     def _create_daily_sales_summary_table(self) -> bool:
         """Create daily sales summary table for fast aggregations."""
         table_name = f"{self.schema_name}.daily_sales_summary"
@@ -326,35 +376,35 @@ class RedshiftSchemaManager:
     
     def get_table_info(self) -> Dict[str, Dict]:
         """Get information about all tables in the schema."""
-        query = f"""
+        # Catalog tables scoped by namespace avoid scanning every schema's columns
+        query = """
         SELECT 
-            table_name,
-            column_name,
-            data_type,
-            is_nullable,
-            column_default
-        FROM information_schema.columns 
-        WHERE table_schema = '{self.schema_name}'
-        ORDER BY table_name, ordinal_position;
+            c.relname AS table_name,
+            a.attname AS column_name,
+            format_type(a.atttypid, a.atttypmod) AS data_type,
+            NOT a.attnotnull AS is_nullable,
+            pg_get_expr(ad.adbin, ad.adrelid) AS column_default
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        JOIN pg_attribute a ON a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+        LEFT JOIN pg_attrdef ad ON ad.adrelid = c.oid AND ad.adnum = a.attnum
+        WHERE n.nspname = %s AND c.relkind IN ('r', 'v')
+        ORDER BY c.relname, a.attnum;
         """
         
         try:
-            results = self.client.execute_query(query)
-            tables_info = {}
+            results = self.client.execute_query(query, (self.schema_name,))
+            tables_info = defaultdict(lambda: {'columns': []})
             
             for row in results:
-                table_name = row['table_name']
-                if table_name not in tables_info:
-                    tables_info[table_name] = {'columns': []}
-                
-                tables_info[table_name]['columns'].append({
+                tables_info[row['table_name']]['columns'].append({
                     'name': row['column_name'],
                     'type': row['data_type'],
-                    'nullable': row['is_nullable'] == 'YES',
+                    'nullable': bool(row['is_nullable']),
                     'default': row['column_default']
                 })
             
-            return tables_info
+            return dict(tables_info)
             
         except Exception as e:
             logger.error(f"Failed to get table info: {e}")
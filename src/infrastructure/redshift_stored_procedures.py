@@ -3,44 +3,87 @@ Redshift stored procedures for data aggregation and analytics.
 Contains procedures for calculating venue popularity, artist performance, and other analytics.
 """
 import logging
-from typing import Dict, List, Optional, Any
+import time
+from typing import Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime, timedelta
 from .redshift_client import RedshiftClient
 
 logger = logging.getLogger(__name__)
 
+# How long analytics query results are served from memory, and how many are kept
+QUERY_CACHE_TTL_SECONDS = 60
+QUERY_CACHE_MAX_ENTRIES = 128
+
+# Growth trends get_artist_trends can filter on; anything else returns all
+TREND_FILTERS = ('growing', 'declining', 'stable')
+
+# Revenue analytics periods and their lengths, for the period end date
+REVENUE_PERIODS = {
+    'day': '1 day',
+    'week': '1 week',
+    'month': '1 month',
+    'quarter': '3 months',
+    'year': '1 year',
+}
+
 
 class RedshiftStoredProcedures:
     """Manages stored procedures for analytics and data aggregation."""
     
-    def __init__(self, client: RedshiftClient):
+    def __init__(self, client: RedshiftClient, cache_ttl_seconds: float = QUERY_CACHE_TTL_SECONDS):
         """Initialize with Redshift client."""
         self.client = client
         self.schema_name = 'concert_dw'
+        self.cache_ttl_seconds = cache_ttl_seconds
+        # (query, params, as_arrow) -> (expiry on the monotonic clock, rows)
+        self._query_cache: Dict[Tuple[str, tuple, bool], Tuple[float, Any]] = {}
+    
+    def _cached_query(self, query: str, params: tuple,
+                      as_arrow: bool = False) -> Union[List[Dict[str, Any]], Any]:
+        """
+        Run an analytics query, reusing results younger than the cache TTL.
+        
+        Returns a list of row dicts, or an immutable pyarrow Table when as_arrow is set.
+        """
+        key = (query, params, as_arrow)
+        now = time.monotonic()
+        cached = self._query_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1] if as_arrow else list(cached[1])
+        
+        execute = self.client.execute_query_arrow if as_arrow else self.client.execute_query
+        rows = execute(query, params)
+        self._query_cache.pop(key, None)
+        if len(self._query_cache) >= QUERY_CACHE_MAX_ENTRIES:
+            # Dicts keep insertion order, so the first entry is the oldest
+            del self._query_cache[next(iter(self._query_cache))]
+        self._query_cache[key] = (now + self.cache_ttl_seconds, rows)
+        return rows if as_arrow else list(rows)
+    
+    def clear_query_cache(self) -> None:
+        """Drop cached analytics results, e.g. after recalculating them."""
+        self._query_cache.clear()
     
     def create_all_procedures(self) -> bool:
         """Create all stored procedures."""
-        procedures_created = []
-        
         try:
-            if self._create_calculate_venue_popularity_procedure():
-                procedures_created.append('calculate_venue_popularity')
-            
-            if self._create_calculate_artist_performance_procedure():
-                procedures_created.append('calculate_artist_performance')
-            
-            if self._create_generate_daily_sales_summary_procedure():
-                procedures_created.append('generate_daily_sales_summary')
-            
-            if self._create_get_top_venues_procedure():
-                procedures_created.append('get_top_venues')
+            # The aggregation procedures read from these views, so they go first
+            for create_view in (self._create_venue_metrics_mv,
+                                self._create_artist_metrics_mv,
+                                self._create_artist_ticket_sales_mv):
+                if not create_view():
+                    return False
             
-            if self._create_get_artist_trends_procedure():
-                procedures_created.append('get_artist_trends')
-            
-            if self._create_get_revenue_analytics_procedure():
-                procedures_created.append('get_revenue_analytics')
+            ddl = [
+                self._calculate_venue_popularity_ddl(),
+                self._calculate_artist_performance_ddl(),
+                self._generate_daily_sales_summary_ddl(),
+                self._artist_trends_view_ddl(),
+            ]
+            # One multi-statement payload: a single round trip and commit
+            self.client.execute_in_transaction(["\n".join(ddl)])
             
+            procedures_created = self._list_procedures()
             logger.info(f"Successfully created procedures: {', '.join(procedures_created)}")
             return len(procedures_created) > 0
             
@@ -48,8 +91,90 @@ class RedshiftStoredProcedures:
             logger.error(f"Failed to create stored procedures: {e}")
             return False
     
-    def _create_calculate_venue_popularity_procedure(self) -> bool:
-        """Create procedure to calculate venue popularity metrics."""
+    def _list_procedures(self) -> List[str]:
+        """List the procedures and functions defined in the schema."""
+        rows = self.client.execute_query("""
+            SELECT p.proname
+            FROM pg_catalog.pg_proc p
+            JOIN pg_catalog.pg_namespace n ON n.oid = p.pronamespace
+            WHERE n.nspname = %s
+            ORDER BY p.proname;
+        """, (self.schema_name,))
+        return [row['proname'] for row in rows]
+    
+    def _create_materialized_view(self, view_name: str, select_query: str) -> bool:
+        """(Re)create an auto-refreshed materialized view over the given query."""
+        try:
+            self.client.execute_query(f"DROP MATERIALIZED VIEW IF EXISTS {view_name};")
+            self.client.execute_query(
+                f"CREATE MATERIALIZED VIEW {view_name} AUTO REFRESH YES AS {select_query};"
+            )
+            logger.info(f"Successfully created materialized view {view_name}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to create materialized view {view_name}: {e}")
+            return False
+    
+    def _create_venue_metrics_mv(self) -> bool:
+        """Create the daily per-venue concert aggregates behind venue popularity.
+        
+        Materialized views cannot reference CURRENT_DATE, so the view keeps
+        additive per-day sums and counts; the procedure applies the rolling
+        window and derives the averages from them.
+        """
+        return self._create_materialized_view(f"{self.schema_name}.mv_venue_metrics", f"""
+            SELECT 
+                c.venue_id,
+                TRUNC(c.event_date) as event_day,
+                COUNT(c.concert_id) as total_events,
+                SUM(CASE 
+                    WHEN c.total_attendance IS NOT NULL AND v.capacity > 0 
+                    THEN (c.total_attendance::DECIMAL / v.capacity) * 100 
+                    ELSE NULL 
+                END) as attendance_rate_sum,
+                COUNT(CASE 
+                    WHEN c.total_attendance IS NOT NULL AND v.capacity > 0 THEN 1 
+                END) as attendance_rate_count,
+                SUM(c.revenue) as revenue_sum,
+                COUNT(c.revenue) as revenue_count,
+                MIN(c.event_date) as first_event_date,
+                MAX(c.event_date) as last_event_date
+            FROM {self.schema_name}.concerts c
+            JOIN {self.schema_name}.venues v ON v.venue_id = c.venue_id
+            WHERE c.status = 'completed'
+            GROUP BY c.venue_id, TRUNC(c.event_date)
+        """)
+    
+    def _create_artist_metrics_mv(self) -> bool:
+        """Create the daily per-artist concert aggregates behind artist performance."""
+        return self._create_materialized_view(f"{self.schema_name}.mv_artist_metrics", f"""
+            SELECT 
+                c.artist_id,
+                TRUNC(c.event_date) as event_day,
+                COUNT(c.concert_id) as total_concerts,
+                SUM(c.total_attendance) as attendance_sum,
+                COUNT(c.total_attendance) as attendance_count,
+                SUM(c.revenue) as revenue_sum
+            FROM {self.schema_name}.concerts c
+            WHERE c.status = 'completed'
+            GROUP BY c.artist_id, TRUNC(c.event_date)
+        """)
+    
+    def _create_artist_ticket_sales_mv(self) -> bool:
+        """Create the daily per-artist ticket sale value aggregates."""
+        return self._create_materialized_view(f"{self.schema_name}.mv_ticket_sales_metrics", f"""
+            SELECT 
+                c.artist_id,
+                TRUNC(c.event_date) as event_day,
+                SUM(ts.quantity * ts.unit_price) as sale_value_sum,
+                COUNT(ts.sale_id) as sale_count
+            FROM {self.schema_name}.concerts c
+            JOIN {self.schema_name}.ticket_sales ts ON c.concert_id = ts.concert_id
+            GROUP BY c.artist_id, TRUNC(c.event_date)
+        """)
+    
+    def _calculate_venue_popularity_ddl(self) -> str:
+        """Build the DDL for the procedure to calculate venue popularity metrics."""
         procedure_name = f"{self.schema_name}.calculate_venue_popularity"
         
         create_procedure = f"""
@@ -57,9 +182,12 @@ class RedshiftStoredProcedures:
         LANGUAGE plpgsql
         AS $$
         BEGIN
+            -- Fold recent concert changes into the aggregates (incremental where possible)
+            REFRESH MATERIALIZED VIEW {self.schema_name}.mv_venue_metrics;
+            
             -- Delete existing records for today
             DELETE FROM {self.schema_name}.venue_popularity 
-            WHERE DATE(calculated_at) = CURRENT_DATE;
+            WHERE calculated_on = CURRENT_DATE;
             
             -- Calculate and insert new venue popularity metrics
             INSERT INTO {self.schema_name}.venue_popularity (
@@ -69,68 +197,49 @@ class RedshiftStoredProcedures:
                 revenue_per_event,
                 booking_frequency,
                 total_events,
-                calculated_at
+                calculated_at,
+                calculated_on
             )
             WITH venue_metrics AS (
                 SELECT 
-                    v.venue_id,
-                    v.name,
-                    v.capacity,
-                    COUNT(c.concert_id) as total_events,
-                    AVG(CASE 
-                        WHEN c.total_attendance IS NOT NULL AND v.capacity > 0 
-                        THEN (c.total_attendance::DECIMAL / v.capacity) * 100 
-                        ELSE NULL 
-                    END) as avg_attendance_rate,
-                    AVG(c.revenue) as avg_revenue_per_event,
-                    COUNT(c.concert_id)::DECIMAL / 
-                        NULLIF(EXTRACT(days FROM (MAX(c.event_date) - MIN(c.event_date))), 0) * 30 
-                        as booking_frequency_per_month
-                FROM {self.schema_name}.venues v
-                LEFT JOIN {self.schema_name}.concerts c ON v.venue_id = c.venue_id
-                    AND c.status = 'completed'
-                    AND c.event_date >= CURRENT_DATE - INTERVAL '2 years'
-                GROUP BY v.venue_id, v.name, v.capacity
-                HAVING COUNT(c.concert_id) > 0
-            ),
-            ranked_venues AS (
-                SELECT 
-                    *,
-                    ROW_NUMBER() OVER (
-                        ORDER BY 
-                            COALESCE(avg_attendance_rate, 0) * 0.4 + 
-                            COALESCE(avg_revenue_per_event, 0) / 100000 * 0.3 + 
-                            COALESCE(booking_frequency_per_month, 0) * 0.3 DESC
-                    ) as popularity_rank
-                FROM venue_metrics
+                    venue_id,
+                    SUM(total_events) as total_events,
+                    SUM(attendance_rate_sum) / NULLIF(SUM(attendance_rate_count), 0) 
+                        as avg_attendance_rate,
+                    SUM(revenue_sum) / NULLIF(SUM(revenue_count), 0) as avg_revenue_per_event,
+                    SUM(total_events)::DECIMAL / 
+                        NULLIF(EXTRACT(days FROM (MAX(last_event_date) - MIN(first_event_date))), 0) * 30 
+                        as booking_frequency_per_month,
+                    -- Redshift resolves the metric aliases above within this select list
+                    COALESCE(avg_attendance_rate, 0) * 0.4 + 
+                        COALESCE(avg_revenue_per_event, 0) / 100000 * 0.3 + 
+                        COALESCE(booking_frequency_per_month, 0) * 0.3 as score
+                FROM {self.schema_name}.mv_venue_metrics
+                WHERE event_day >= CURRENT_DATE - INTERVAL '2 years'
+                GROUP BY venue_id
             )
+            -- Rank in the final projection: one window pass over the scores
             SELECT 
                 venue_id,
-                popularity_rank,
+                ROW_NUMBER() OVER (ORDER BY score DESC),
                 ROUND(COALESCE(avg_attendance_rate, 0), 2),
                 ROUND(COALESCE(avg_revenue_per_event, 0), 2),
                 ROUND(COALESCE(booking_frequency_per_month, 0), 2),
                 total_events,
-                CURRENT_TIMESTAMP
-            FROM ranked_venues;
+                CURRENT_TIMESTAMP,
+                CURRENT_DATE
+            FROM venue_metrics;
             
             -- Log the operation
             RAISE NOTICE 'Venue popularity calculation completed for % venues', 
-                (SELECT COUNT(*) FROM {self.schema_name}.venue_popularity WHERE DATE(calculated_at) = CURRENT_DATE);
+                (SELECT COUNT(*) FROM {self.schema_name}.venue_popularity WHERE calculated_on = CURRENT_DATE);
         END;
         $$;
         """
-        
-        try:
-            self.client.execute_query(create_procedure)
-            logger.info(f"Successfully created procedure {procedure_name}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to create procedure {procedure_name}: {e}")
-            return False
+        return create_procedure
     
-    def _create_calculate_artist_performance_procedure(self) -> bool:
-        """Create procedure to calculate artist performance metrics."""
+    def _calculate_artist_performance_ddl(self) -> str:
+        """Build the DDL for the procedure to calculate artist performance metrics."""
         procedure_name = f"{self.schema_name}.calculate_artist_performance"
         
         create_procedure = f"""
@@ -138,9 +247,13 @@ class RedshiftStoredProcedures:
         LANGUAGE plpgsql
         AS $$
         BEGIN
+            -- Fold recent concert and sales changes into the aggregates
+            REFRESH MATERIALIZED VIEW {self.schema_name}.mv_artist_metrics;
+            REFRESH MATERIALIZED VIEW {self.schema_name}.mv_ticket_sales_metrics;
+            
             -- Delete existing records for today
             DELETE FROM {self.schema_name}.artist_performance 
-            WHERE DATE(calculated_at) = CURRENT_DATE;
+            WHERE calculated_on = CURRENT_DATE;
             
             -- Calculate and insert new artist performance metrics
             INSERT INTO {self.schema_name}.artist_performance (
@@ -150,77 +263,71 @@ class RedshiftStoredProcedures:
                 revenue_generated,
                 fan_engagement_score,
                 growth_trend,
-                calculated_at
+                calculated_at,
+                calculated_on
             )
             WITH artist_metrics AS (
                 SELECT 
                     a.artist_id,
                     a.name,
                     a.popularity_score,
-                    COUNT(c.concert_id) as total_concerts,
-                    AVG(c.total_attendance) as avg_attendance,
-                    SUM(c.revenue) as total_revenue,
+                    SUM(m.total_concerts) as total_concerts,
+                    SUM(m.attendance_sum)::DECIMAL / NULLIF(SUM(m.attendance_count), 0) as avg_attendance,
+                    SUM(m.revenue_sum) as total_revenue,
                     -- Calculate growth trend based on recent vs older concerts
+                    SUM(CASE WHEN m.event_day >= CURRENT_DATE - INTERVAL '6 months' 
+                             THEN m.total_concerts ELSE 0 END) as recent_concerts,
+                    SUM(CASE WHEN m.event_day < CURRENT_DATE - INTERVAL '6 months' 
+                                  AND m.event_day >= CURRENT_DATE - INTERVAL '1 year' 
+                             THEN m.total_concerts ELSE 0 END) as prior_concerts,
                     CASE 
-                        WHEN COUNT(CASE WHEN c.event_date >= CURRENT_DATE - INTERVAL '6 months' THEN 1 END) > 
-                             COUNT(CASE WHEN c.event_date < CURRENT_DATE - INTERVAL '6 months' 
-                                        AND c.event_date >= CURRENT_DATE - INTERVAL '1 year' THEN 1 END)
-                        THEN 'growing'
-                        WHEN COUNT(CASE WHEN c.event_date >= CURRENT_DATE - INTERVAL '6 months' THEN 1 END) < 
-                             COUNT(CASE WHEN c.event_date < CURRENT_DATE - INTERVAL '6 months' 
-                                        AND c.event_date >= CURRENT_DATE - INTERVAL '1 year' THEN 1 END)
-                        THEN 'declining'
+                        WHEN recent_concerts > prior_concerts THEN 'growing'
+                        WHEN recent_concerts < prior_concerts THEN 'declining'
                         ELSE 'stable'
-                    END as growth_trend
+                    END as growth_trend,
+                    -- Scored once per artist, from the metric aliases above
+                    ROUND(
+                        COALESCE(a.popularity_score, 0) * 0.3 + 
+                        LEAST(COALESCE(avg_attendance, 0) / 10000, 10) * 0.4 + 
+                        LEAST(COALESCE(total_revenue, 0) / 1000000, 10) * 0.3, 
+                        2
+                    ) as fan_engagement_score
                 FROM {self.schema_name}.artists a
-                LEFT JOIN {self.schema_name}.concerts c ON a.artist_id = c.artist_id
-                    AND c.status = 'completed'
-                    AND c.event_date >= CURRENT_DATE - INTERVAL '2 years'
+                JOIN {self.schema_name}.mv_artist_metrics m ON a.artist_id = m.artist_id
+                WHERE m.event_day >= CURRENT_DATE - INTERVAL '2 years'
                 GROUP BY a.artist_id, a.name, a.popularity_score
             ),
             ticket_sales_metrics AS (
                 SELECT 
-                    c.artist_id,
-                    AVG(ts.quantity * ts.unit_price) as avg_ticket_sale_value
-                FROM {self.schema_name}.concerts c
-                JOIN {self.schema_name}.ticket_sales ts ON c.concert_id = ts.concert_id
-                WHERE c.event_date >= CURRENT_DATE - INTERVAL '2 years'
-                GROUP BY c.artist_id
+                    artist_id,
+                    SUM(sale_value_sum) / NULLIF(SUM(sale_count), 0) as avg_ticket_sale_value
+                FROM {self.schema_name}.mv_ticket_sales_metrics
+                WHERE event_day >= CURRENT_DATE - INTERVAL '2 years'
+                GROUP BY artist_id
             )
             SELECT 
                 am.artist_id,
                 COALESCE(am.total_concerts, 0),
                 ROUND(COALESCE(tsm.avg_ticket_sale_value, 0), 2),
                 ROUND(COALESCE(am.total_revenue, 0), 2),
-                ROUND(
-                    COALESCE(am.popularity_score, 0) * 0.3 + 
-                    LEAST(COALESCE(am.avg_attendance, 0) / 10000, 10) * 0.4 + 
-                    LEAST(COALESCE(am.total_revenue, 0) / 1000000, 10) * 0.3, 
-                    2
-                ) as fan_engagement_score,
+                am.fan_engagement_score,
                 am.growth_trend,
-                CURRENT_TIMESTAMP
+                CURRENT_TIMESTAMP,
+                CURRENT_DATE
             FROM artist_metrics am
             LEFT JOIN ticket_sales_metrics tsm ON am.artist_id = tsm.artist_id
             WHERE am.total_concerts > 0;
             
             -- Log the operation
             RAISE NOTICE 'Artist performance calculation completed for % artists', 
-                (SELECT COUNT(*) FROM {self.schema_name}.artist_performance WHERE DATE(calculated_at) = CURRENT_DATE);
+                (SELECT COUNT(*) FROM {self.schema_name}.artist_performance WHERE calculated_on = CURRENT_DATE);
         END;
         $$;
         """
-        
-        try:
-            self.client.execute_query(create_procedure)
-            logger.info(f"Successfully created procedure {procedure_name}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to create procedure {procedure_name}: {e}")
-            return False
+        return create_procedure
     
-    def _create_generate_daily_sales_summary_procedure(self) -> bool:
-        """Create procedure to generate daily sales summaries."""
+    def _generate_daily_sales_summary_ddl(self) -> str:
+        """Build the DDL for the procedure to generate daily sales summaries."""
         procedure_name = f"{self.schema_name}.generate_daily_sales_summary"
         
         create_procedure = f"""
@@ -233,12 +340,35 @@ class RedshiftStoredProcedures:
             -- Use provided date or default to yesterday
             process_date := COALESCE(target_date, CURRENT_DATE - 1);
             
-            -- Delete existing records for the target date
-            DELETE FROM {self.schema_name}.daily_sales_summary 
-            WHERE summary_date = process_date;
-            
-            -- Generate daily sales summary
-            INSERT INTO {self.schema_name}.daily_sales_summary (
+            -- Upsert the day's summaries in one pass instead of DELETE then INSERT
+            MERGE INTO {self.schema_name}.daily_sales_summary summary
+            USING (
+                SELECT 
+                    process_date as summary_date,
+                    c.artist_id,
+                    c.venue_id,
+                    c.concert_id,
+                    SUM(ts.quantity) as total_tickets_sold,
+                    SUM(ts.quantity * ts.unit_price) as total_revenue,
+                    -- Per ticket rather than per sale row, from the two sums above
+                    total_revenue / NULLIF(total_tickets_sold, 0) as avg_ticket_price,
+                    COUNT(DISTINCT ts.sale_id) as unique_customers
+                FROM {self.schema_name}.concerts c
+                JOIN {self.schema_name}.ticket_sales ts ON c.concert_id = ts.concert_id
+                WHERE DATE(ts.purchase_timestamp) = process_date
+                GROUP BY c.artist_id, c.venue_id, c.concert_id
+            ) AS new_summary
+            ON summary.summary_date = new_summary.summary_date
+                AND summary.concert_id = new_summary.concert_id
+            WHEN MATCHED THEN UPDATE SET
+                artist_id = new_summary.artist_id,
+                venue_id = new_summary.venue_id,
+                total_tickets_sold = new_summary.total_tickets_sold,
+                total_revenue = new_summary.total_revenue,
+                avg_ticket_price = new_summary.avg_ticket_price,
+                unique_customers = new_summary.unique_customers,
+                created_at = CURRENT_TIMESTAMP
+            WHEN NOT MATCHED THEN INSERT (
                 summary_date,
                 artist_id,
                 venue_id,
@@ -248,21 +378,17 @@ class RedshiftStoredProcedures:
                 avg_ticket_price,
                 unique_customers,
                 created_at
-            )
-            SELECT 
-                process_date,
-                c.artist_id,
-                c.venue_id,
-                c.concert_id,
-                SUM(ts.quantity) as total_tickets_sold,
-                SUM(ts.quantity * ts.unit_price) as total_revenue,
-                AVG(ts.unit_price) as avg_ticket_price,
-                COUNT(DISTINCT ts.sale_id) as unique_customers,
+            ) VALUES (
+                new_summary.summary_date,
+                new_summary.artist_id,
+                new_summary.venue_id,
+                new_summary.concert_id,
+                new_summary.total_tickets_sold,
+                new_summary.total_revenue,
+                new_summary.avg_ticket_price,
+                new_summary.unique_customers,
                 CURRENT_TIMESTAMP
-            FROM {self.schema_name}.concerts c
-            JOIN {self.schema_name}.ticket_sales ts ON c.concert_id = ts.concert_id
-            WHERE DATE(ts.purchase_timestamp) = process_date
-            GROUP BY process_date, c.artist_id, c.venue_id, c.concert_id;
+            );
             
             -- Log the operation
             RAISE NOTICE 'Daily sales summary generated for % with % records', 
@@ -271,223 +397,35 @@ class RedshiftStoredProcedures:
         END;
         $$;
         """
-        
-        try:
-            self.client.execute_query(create_procedure)
-            logger.info(f"Successfully created procedure {procedure_name}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to create procedure {procedure_name}: {e}")
-            return False
+        return create_procedure
     
-    def _create_get_top_venues_procedure(self) -> bool:
-        """Create procedure to get top performing venues."""
-        procedure_name = f"{self.schema_name}.get_top_venues"
-        
-        create_procedure = f"""
-        CREATE OR REPLACE FUNCTION {procedure_name}(
-            limit_count INTEGER DEFAULT 10,
-            time_period_days INTEGER DEFAULT 365
+    def _artist_trends_view_ddl(self) -> str:
+        """Build the DDL for the view of the latest artist performance snapshot."""
+        return f"""
+        CREATE OR REPLACE VIEW {self.schema_name}.v_artist_trends AS
+        WITH latest AS (
+            SELECT MAX(calculated_on) as calculated_on
+            FROM {self.schema_name}.artist_performance
         )
-        RETURNS TABLE (
-            venue_id VARCHAR(50),
-            venue_name VARCHAR(200),
-            city VARCHAR(100),
-            total_events INTEGER,
-            total_revenue DECIMAL(15,2),
-            avg_attendance_rate DECIMAL(5,2),
-            popularity_rank INTEGER
-        )
-        LANGUAGE plpgsql
-        AS $$
-        BEGIN
-            RETURN QUERY
-            SELECT 
-                v.venue_id,
-                v.name as venue_name,
-                v.city,
-                COUNT(c.concert_id)::INTEGER as total_events,
-                COALESCE(SUM(c.revenue), 0)::DECIMAL(15,2) as total_revenue,
-                COALESCE(AVG(
-                    CASE 
-                        WHEN c.total_attendance IS NOT NULL AND v.capacity > 0 
-                        THEN (c.total_attendance::DECIMAL / v.capacity) * 100 
-                        ELSE NULL 
-                    END
-                ), 0)::DECIMAL(5,2) as avg_attendance_rate,
-                COALESCE(vp.popularity_rank, 999)::INTEGER as popularity_rank
-            FROM {self.schema_name}.venues v
-            LEFT JOIN {self.schema_name}.concerts c ON v.venue_id = c.venue_id
-                AND c.status = 'completed'
-                AND c.event_date >= CURRENT_DATE - INTERVAL '%s days'
-            LEFT JOIN {self.schema_name}.venue_popularity vp ON v.venue_id = vp.venue_id
-                AND DATE(vp.calculated_at) = (
-                    SELECT MAX(DATE(calculated_at)) 
-                    FROM {self.schema_name}.venue_popularity
-                )
-            GROUP BY v.venue_id, v.name, v.city, v.capacity, vp.popularity_rank
-            HAVING COUNT(c.concert_id) > 0
-            ORDER BY 
-                COALESCE(vp.popularity_rank, 999),
-                total_revenue DESC,
-                avg_attendance_rate DESC
-            LIMIT limit_count;
-        END;
-        $$;
-        """ % time_period_days
-        
-        try:
-            self.client.execute_query(create_procedure)
-            logger.info(f"Successfully created function {procedure_name}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to create function {procedure_name}: {e}")
-            return False
-    
-    def _create_get_artist_trends_procedure(self) -> bool:
-        """Create procedure to get artist performance trends."""
-        procedure_name = f"{self.schema_name}.get_artist_trends"
-        
-        create_procedure = f"""
-        CREATE OR REPLACE FUNCTION {procedure_name}(
-            limit_count INTEGER DEFAULT 20,
-            trend_filter VARCHAR(20) DEFAULT 'all'
-        )
-        RETURNS TABLE (
-            artist_id VARCHAR(50),
-            artist_name VARCHAR(200),
-            total_concerts INTEGER,
-            revenue_generated DECIMAL(15,2),
-            fan_engagement_score DECIMAL(5,2),
-            growth_trend VARCHAR(20),
-            popularity_score DECIMAL(5,2)
-        )
-        LANGUAGE plpgsql
-        AS $$
-        BEGIN
-            RETURN QUERY
-            SELECT 
-                a.artist_id,
-                a.name as artist_name,
-                COALESCE(ap.total_concerts, 0)::INTEGER,
-                COALESCE(ap.revenue_generated, 0)::DECIMAL(15,2),
-                COALESCE(ap.fan_engagement_score, 0)::DECIMAL(5,2),
-                COALESCE(ap.growth_trend, 'unknown')::VARCHAR(20),
-                COALESCE(a.popularity_score, 0)::DECIMAL(5,2)
-            FROM {self.schema_name}.artists a
-            LEFT JOIN {self.schema_name}.artist_performance ap ON a.artist_id = ap.artist_id
-                AND DATE(ap.calculated_at) = (
-                    SELECT MAX(DATE(calculated_at)) 
-                    FROM {self.schema_name}.artist_performance
-                )
-            WHERE 
-                CASE 
-                    WHEN trend_filter = 'growing' THEN COALESCE(ap.growth_trend, 'unknown') = 'growing'
-                    WHEN trend_filter = 'declining' THEN COALESCE(ap.growth_trend, 'unknown') = 'declining'
-                    WHEN trend_filter = 'stable' THEN COALESCE(ap.growth_trend, 'unknown') = 'stable'
-                    ELSE TRUE
-                END
-                AND COALESCE(ap.total_concerts, 0) > 0
-            ORDER BY 
-                COALESCE(ap.fan_engagement_score, 0) DESC,
-                COALESCE(ap.revenue_generated, 0) DESC,
-                a.popularity_score DESC
-            LIMIT limit_count;
-        END;
-        $$;
-        """
-        
-        try:
-            self.client.execute_query(create_procedure)
-            logger.info(f"Successfully created function {procedure_name}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to create function {procedure_name}: {e}")
-            return False
-    
-    def _create_get_revenue_analytics_procedure(self) -> bool:
-        """Create procedure to get revenue analytics."""
-        procedure_name = f"{self.schema_name}.get_revenue_analytics"
-        
-        create_procedure = f"""
-        CREATE OR REPLACE FUNCTION {procedure_name}(
-            start_date DATE DEFAULT NULL,
-            end_date DATE DEFAULT NULL,
-            group_by_period VARCHAR(10) DEFAULT 'month'
-        )
-        RETURNS TABLE (
-            period_start DATE,
-            period_end DATE,
-            total_concerts INTEGER,
-            total_revenue DECIMAL(15,2),
-            avg_revenue_per_concert DECIMAL(10,2),
-            total_tickets_sold INTEGER,
-            avg_ticket_price DECIMAL(8,2)
-        )
-        LANGUAGE plpgsql
-        AS $$
-        DECLARE
-            date_trunc_format VARCHAR(10);
-        BEGIN
-            -- Set default dates if not provided
-            start_date := COALESCE(start_date, CURRENT_DATE - INTERVAL '1 year');
-            end_date := COALESCE(end_date, CURRENT_DATE);
-            
-            -- Validate group_by_period
-            IF group_by_period NOT IN ('day', 'week', 'month', 'quarter', 'year') THEN
-                group_by_period := 'month';
-            END IF;
-            
-            RETURN QUERY
-            WITH period_data AS (
-                SELECT 
-                    DATE_TRUNC(group_by_period, c.event_date)::DATE as period_start,
-                    COUNT(c.concert_id) as concert_count,
-                    SUM(c.revenue) as period_revenue,
-                    SUM(ts.quantity) as tickets_sold,
-                    AVG(ts.unit_price) as avg_price
-                FROM {self.schema_name}.concerts c
-                LEFT JOIN {self.schema_name}.ticket_sales ts ON c.concert_id = ts.concert_id
-                WHERE c.event_date >= start_date 
-                    AND c.event_date <= end_date
-                    AND c.status = 'completed'
-                GROUP BY DATE_TRUNC(group_by_period, c.event_date)
-            )
-            SELECT 
-                pd.period_start,
-                CASE 
-                    WHEN group_by_period = 'day' THEN pd.period_start
-                    WHEN group_by_period = 'week' THEN pd.period_start + INTERVAL '6 days'
-                    WHEN group_by_period = 'month' THEN pd.period_start + INTERVAL '1 month' - INTERVAL '1 day'
-                    WHEN group_by_period = 'quarter' THEN pd.period_start + INTERVAL '3 months' - INTERVAL '1 day'
-                    WHEN group_by_period = 'year' THEN pd.period_start + INTERVAL '1 year' - INTERVAL '1 day'
-                END::DATE as period_end,
-                pd.concert_count::INTEGER,
-                COALESCE(pd.period_revenue, 0)::DECIMAL(15,2),
-                CASE 
-                    WHEN pd.concert_count > 0 THEN (pd.period_revenue / pd.concert_count)::DECIMAL(10,2)
-                    ELSE 0::DECIMAL(10,2)
-                END,
-                COALESCE(pd.tickets_sold, 0)::INTEGER,
-                COALESCE(pd.avg_price, 0)::DECIMAL(8,2)
-            FROM period_data pd
-            ORDER BY pd.period_start;
-        END;
-        $$;
+        SELECT 
+            a.artist_id,
+            a.name as artist_name,
+            ap.total_concerts::INTEGER as total_concerts,
+            COALESCE(ap.revenue_generated, 0)::DECIMAL(15,2) as revenue_generated,
+            COALESCE(ap.fan_engagement_score, 0)::DECIMAL(5,2) as fan_engagement_score,
+            COALESCE(ap.growth_trend, 'unknown')::VARCHAR(20) as growth_trend,
+            COALESCE(a.popularity_score, 0)::DECIMAL(5,2) as popularity_score
+        FROM {self.schema_name}.artist_performance ap
+        JOIN latest ON ap.calculated_on = latest.calculated_on
+        JOIN {self.schema_name}.artists a ON a.artist_id = ap.artist_id
+        WHERE ap.total_concerts > 0;
         """
-        
-        try:
-            self.client.execute_query(create_procedure)
-            logger.info(f"Successfully created function {procedure_name}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to create function {procedure_name}: {e}")
-            return False
     
     def execute_venue_popularity_calculation(self) -> bool:
         """Execute venue popularity calculation procedure."""
         try:
             self.client.execute_query(f"CALL {self.schema_name}.calculate_venue_popularity();")
+            self.clear_query_cache()
             logger.info("Venue popularity calculation completed successfully")
             return True
         except Exception as e:
@@ -498,6 +436,7 @@ class RedshiftStoredProcedures:
         """Execute artist performance calculation procedure."""
         try:
             self.client.execute_query(f"CALL {self.schema_name}.calculate_artist_performance();")
+            self.clear_query_cache()
             logger.info("Artist performance calculation completed successfully")
             return True
         except Exception as e:
@@ -508,45 +447,129 @@ class RedshiftStoredProcedures:
         """Execute daily sales summary generation."""
         try:
             if target_date:
-                query = f"CALL {self.schema_name}.generate_daily_sales_summary('{target_date}');"
+                self.client.execute_query(
+                    f"CALL {self.schema_name}.generate_daily_sales_summary(%s);", (target_date,)
+                )
             else:
-                query = f"CALL {self.schema_name}.generate_daily_sales_summary();"
-            
-            self.client.execute_query(query)
+                self.client.execute_query(f"CALL {self.schema_name}.generate_daily_sales_summary();")
+            self.clear_query_cache()
             logger.info(f"Daily sales summary generation completed for {target_date or 'yesterday'}")
             return True
         except Exception as e:
             logger.error(f"Failed to execute daily sales summary generation: {e}")
             return False
     
-    def get_top_venues(self, limit: int = 10, days: int = 365) -> List[Dict[str, Any]]:
-        """Get top performing venues."""
+    def get_top_venues(self, limit: int = 10, days: int = 365,
+                       as_arrow: bool = False) -> List[Dict[str, Any]]:
+        """Get top performing venues, as a pyarrow Table when as_arrow is set."""
         try:
-            query = f"SELECT * FROM {self.schema_name}.get_top_venues({limit}, {days});"
-            return self.client.execute_query(query)
+            # Venues without a rank in the latest popularity run (or with no
+            # run yet) sort after ranked ones as rank 999
+            query = f"""
+            WITH latest_popularity AS (
+                SELECT venue_id, popularity_rank
+                FROM {self.schema_name}.venue_popularity
+                WHERE calculated_on = (
+                    SELECT MAX(calculated_on) FROM {self.schema_name}.venue_popularity
+                )
+            )
+            SELECT 
+                v.venue_id,
+                v.name as venue_name,
+                v.city,
+                COUNT(c.concert_id)::INTEGER as total_events,
+                COALESCE(SUM(c.revenue), 0)::DECIMAL(15,2) as total_revenue,
+                COALESCE(AVG(
+                    CASE 
+                        WHEN c.total_attendance IS NOT NULL AND v.capacity > 0 
+                        THEN (c.total_attendance::DECIMAL / v.capacity) * 100 
+                        ELSE NULL 
+                    END
+                ), 0)::DECIMAL(5,2) as avg_attendance_rate,
+                COALESCE(lp.popularity_rank, 999)::INTEGER as popularity_rank
+            FROM {self.schema_name}.venues v
+            LEFT JOIN {self.schema_name}.concerts c ON v.venue_id = c.venue_id
+                AND c.status = 'completed'
+                AND c.event_date >= CURRENT_DATE - INTERVAL '1 day' * %s
+            LEFT JOIN latest_popularity lp ON v.venue_id = lp.venue_id
+            GROUP BY v.venue_id, v.name, v.city, v.capacity, lp.popularity_rank
+            HAVING COUNT(c.concert_id) > 0
+            ORDER BY 
+                COALESCE(lp.popularity_rank, 999),
+                total_revenue DESC,
+                avg_attendance_rate DESC
+            LIMIT %s;
+            """
+            return self._cached_query(query, (days, limit), as_arrow)
         except Exception as e:
             logger.error(f"Failed to get top venues: {e}")
             return []
     
-    def get_artist_trends(self, limit: int = 20, trend_filter: str = 'all') -> List[Dict[str, Any]]:
-        """Get artist performance trends."""
+    def get_artist_trends(self, limit: int = 20, trend_filter: str = 'all',
+                          as_arrow: bool = False) -> List[Dict[str, Any]]:
+        """Get artist performance trends, as a pyarrow Table when as_arrow is set."""
         try:
-            query = f"SELECT * FROM {self.schema_name}.get_artist_trends({limit}, '{trend_filter}');"
-            return self.client.execute_query(query)
+            query = f"SELECT * FROM {self.schema_name}.v_artist_trends"
+            params: tuple = ()
+            if trend_filter in TREND_FILTERS:
+                query += " WHERE growth_trend = %s"
+                params = (trend_filter,)
+            query += " ORDER BY fan_engagement_score DESC, revenue_generated DESC, popularity_score DESC LIMIT %s;"
+            return self._cached_query(query, params + (limit,), as_arrow)
         except Exception as e:
             logger.error(f"Failed to get artist trends: {e}")
             return []
     
     def get_revenue_analytics(self, start_date: Optional[str] = None, 
                             end_date: Optional[str] = None, 
-                            period: str = 'month') -> List[Dict[str, Any]]:
-        """Get revenue analytics by period."""
+                            period: str = 'month',
+                            as_arrow: bool = False) -> List[Dict[str, Any]]:
+        """Get revenue analytics by period, as a pyarrow Table when as_arrow is set."""
         try:
-            start_param = f"'{start_date}'" if start_date else 'NULL'
-            end_param = f"'{end_date}'" if end_date else 'NULL'
+            if period not in REVENUE_PERIODS:
+                period = 'month'
             
-            query = f"SELECT * FROM {self.schema_name}.get_revenue_analytics({start_param}, {end_param}, '{period}');"
-            return self.client.execute_query(query)
+            query = f"""
+            WITH raw AS (
+                -- Truncate each event date once; the aggregation groups on the projection
+                SELECT 
+                    DATE_TRUNC(%s, c.event_date)::DATE as period_start,
+                    c.concert_id,
+                    c.revenue,
+                    ts.quantity,
+                    ts.unit_price
+                FROM {self.schema_name}.concerts c
+                LEFT JOIN {self.schema_name}.ticket_sales ts ON c.concert_id = ts.concert_id
+                WHERE c.event_date BETWEEN COALESCE(%s::DATE, CURRENT_DATE - INTERVAL '1 year')
+                                       AND COALESCE(%s::DATE, CURRENT_DATE)
+                    AND c.status = 'completed'
+            ),
+            period_data AS (
+                SELECT 
+                    period_start,
+                    COUNT(concert_id) as concert_count,
+                    SUM(revenue) as period_revenue,
+                    SUM(quantity) as tickets_sold,
+                    AVG(unit_price) as avg_price
+                FROM raw
+                GROUP BY period_start
+            )
+            SELECT 
+                pd.period_start,
+                (pd.period_start + %s::INTERVAL - INTERVAL '1 day')::DATE as period_end,
+                pd.concert_count::INTEGER as total_concerts,
+                COALESCE(pd.period_revenue, 0)::DECIMAL(15,2) as total_revenue,
+                CASE 
+                    WHEN pd.concert_count > 0 THEN (pd.period_revenue / pd.concert_count)::DECIMAL(10,2)
+                    ELSE 0::DECIMAL(10,2)
+                END as avg_revenue_per_concert,
+                COALESCE(pd.tickets_sold, 0)::INTEGER as total_tickets_sold,
+                COALESCE(pd.avg_price, 0)::DECIMAL(8,2) as avg_ticket_price
+            FROM period_data pd
+            ORDER BY pd.period_start;
+            """
+            params = (period, start_date or None, end_date or None, REVENUE_PERIODS[period])
+            return self._cached_query(query, params, as_arrow)
         except Exception as e:
             logger.error(f"Failed to get revenue analytics: {e}")
             return []
\ No newline at end of file
@@ -2,10 +2,31 @@
 Artist data model with validation schemas.
 """
 from datetime import date
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from pydantic import Field, field_validator, ConfigDict
 from .base import BaseEntity
 
+try:
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+def _normalize_string_lists(column: "pa.ChunkedArray", lower: bool) -> "pa.ListArray":
+    """Trim (and optionally lowercase) every list element, dropping empty ones."""
+    column = pc.fill_null(column.combine_chunks(), pa.scalar([], column.type))
+    values = pc.utf8_trim_whitespace(pc.list_flatten(column))
+    if lower:
+        values = pc.utf8_lower(values)
+    keep = pc.fill_null(pc.greater(pc.utf8_length(values), 0), False)
+    parents = pc.filter(pc.list_parent_indices(column), keep).to_numpy()
+    offsets = np.zeros(len(column) + 1, dtype=np.int32)
+    np.cumsum(np.bincount(parents, minlength=len(column)), out=offsets[1:])
+    return pa.ListArray.from_arrays(pa.array(offsets), pc.filter(values, keep))
+
 
 class Artist(BaseEntity):
     """Artist entity with comprehensive metadata."""
@@ -54,4 +75,60 @@ class Artist(BaseEntity):
     @classmethod
     def validate_members(cls, v):
         """Ensure member names are properly formatted."""
-        return [member.strip() for member in v if member.strip()]
\ No newline at end of file
+        return [member.strip() for member in v if member.strip()]
+    
+    @classmethod
+    def validate_batch(cls, table: "pa.Table") -> Tuple["pa.Table", "pa.Array"]:
+        """
+        Apply the field constraints and validators to a whole table at once.
+        
+        Meant for columnar input already in Arrow form (e.g. Parquet read with
+        ARTIST_ARROW_SCHEMA); for Python dicts, per-record validation is faster
+        than converting them. Null lists and scores take the field defaults.
+        Returns the normalized table and a mask of the rows that pass; the
+        remaining rows should be validated one by one for their errors.
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for batch validation")
+        
+        raw_names = table['name']
+        names = pc.utf8_trim_whitespace(raw_names)
+        raw_length = pc.utf8_length(raw_names)
+        popularity = pc.fill_null(table['popularity_score'], 0.0)
+        
+        valid = pc.and_(
+            pc.and_(pc.is_valid(table['artist_id']), pc.is_valid(raw_names)),
+            pc.and_(
+                pc.and_(pc.greater_equal(raw_length, 1), pc.less_equal(raw_length, 200)),
+                pc.greater(pc.utf8_length(names), 0)
+            )
+        )
+        valid = pc.and_(
+            valid,
+            pc.and_(pc.greater_equal(popularity, 0.0), pc.less_equal(popularity, 100.0))
+        )
+        
+        table = table.set_column(table.schema.get_field_index('name'), 'name', names)
+        table = table.set_column(
+            table.schema.get_field_index('popularity_score'), 'popularity_score', popularity
+        )
+        for field_name, lower in (('genre', True), ('members', False)):
+            table = table.set_column(
+                table.schema.get_field_index(field_name), field_name,
+                _normalize_string_lists(table[field_name], lower)
+            )
+        return table, pc.fill_null(valid, False).combine_chunks()
+
+
+# Arrow types of the Artist fields, for batch validation
+ARTIST_ARROW_SCHEMA = pa.schema([
+    ('artist_id', pa.string()),
+    ('name', pa.string()),
+    ('genre', pa.list_(pa.string())),
+    ('popularity_score', pa.float64()),
+    ('formation_date', pa.date32()),
+    ('members', pa.list_(pa.string())),
+    ('spotify_id', pa.string()),
+    ('created_at', pa.timestamp('us')),
+    ('updated_at', pa.timestamp('us')),
+]) if PYARROW_AVAILABLE else None
@@ -1,21 +1,32 @@
 """
 Base models and common types for the concert data platform.
 """
-from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+from pydantic import BaseModel, Field, field_serializer
+
+
+def utc_now() -> datetime:
+    """Current UTC time as a naive datetime, like the deprecated datetime.utcnow()."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
 class BaseEntity(BaseModel):
     """Base class for all entities with common fields."""
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
+    
+    @classmethod
+    def build_batch(cls, rows: Iterable[Dict[str, Any]],
+                    now: Optional[datetime] = None) -> List["BaseEntity"]:
+        """Validate many rows, stamping missing timestamps with one shared time."""
+        now = now or utc_now()
+        return [cls.model_validate({'created_at': now, 'updated_at': now, **row}) for row in rows]
     
-    class Config:
-        # Allow validation of datetime objects
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    @field_serializer('created_at', 'updated_at', when_used='json')
+    def serialize_timestamp(self, v: datetime) -> str:
+        """Serialize timestamps as ISO 8601 in JSON output."""
+        return v.isoformat()
 
 
 class Location(BaseModel):
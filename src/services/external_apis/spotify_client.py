@@ -276,7 +276,7 @@ class SpotifyClient(APIClient):
             
             # Validate the data using our Artist model
             try:
-                Artist(**normalized_data)
+                Artist.model_validate(normalized_data)
             except Exception as validation_error:
                 self.logger.warning(
                     "Artist data validation failed",
@@ -364,7 +364,7 @@ class TicketmasterClient(APIClient):
         
             # Validate the data using our Venue model
             try:
-                Venue(**normalized_data)
+                Venue.model_validate(normalized_data)
             except Exception as validation_error:
                 self.logger.warning(
                     "Venue data validation failed",
@@ -480,7 +480,7 @@ class TicketmasterClient(APIClient):
             # Validate the data using our Concert model (skip if missing required fields)
             if artist_id and venue_id:
                 try:
-                    Concert(**normalized_data)
+                    Concert.model_validate(normalized_data)
                 except Exception as validation_error:
                     self.logger.warning(
                         "Concert data validation failed",
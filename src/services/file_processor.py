@@ -367,10 +367,10 @@ class FileUploadProcessor:
                 validation_record = {k: v for k, v in record.items() if not k.startswith('_')}
                 
                 # Validate using Pydantic model
-                validated_instance = model_class(**validation_record)
+                validated_instance = model_class.model_validate(validation_record)
                 
                 # Convert back to dict and preserve source info
-                validated_dict = validated_instance.dict()
+                validated_dict = validated_instance.model_dump()
                 if '_source_row' in record:
                     validated_dict['_source_row'] = record['_source_row']
                 
@@ -168,8 +168,8 @@ class KinesisIntegrationService:
                 return False
             
             # Check Lambda functions
-            deployed_functions = self.lambda_deployer.list_deployed_functions()
             expected_functions = ['kinesis-stream-processor', 'data-quality-processor', 'stream-analytics-processor']
+            deployed_functions = self.lambda_deployer.list_deployed_functions(expected_functions)
             
             deployed_names = [func['function_name'] for func in deployed_functions]
             missing_functions = [name for name in expected_functions if name not in deployed_names]
@@ -443,12 +443,10 @@ class KinesisIntegrationService:
             
             for function_name in functions_to_delete:
                 try:
-                    self.lambda_deployer.lambda_client.delete_function(FunctionName=function_name)
-                    cleanup_details['functions_deleted'].append(function_name)
-                    self.logger.info("Lambda function deleted", function_name=function_name)
+                    if self.lambda_deployer.delete_lambda_function(function_name):
+                        cleanup_details['functions_deleted'].append(function_name)
                 except Exception as e:
-                    if "ResourceNotFoundException" not in str(e):
-                        errors.append(f"Failed to delete function {function_name}: {str(e)}")
+                    errors.append(f"Failed to delete function {function_name}: {str(e)}")
             
             # Note: Kinesis streams are not deleted automatically as they may contain important data
             # In production, streams should be managed separately
@@ -96,6 +96,8 @@ class RedshiftService:
             else:
                 logger.warning(f"No S3 path provided for {table_name}")
         
+        # Statistics are refreshed in the background; finish them before reporting
+        self.data_loader.wait_for_pending_analyze()
         return results
     
     def run_analytics_calculations(self) -> Dict[str, bool]:
@@ -191,8 +193,9 @@ class RedshiftService:
                 latest_venue_calc = self.client.execute_query("""
                     SELECT MAX(calculated_at) as latest_calculation, COUNT(*) as venue_count
                     FROM concert_dw.venue_popularity 
-                    WHERE DATE(calculated_at) = (
-                        SELECT MAX(DATE(calculated_at)) FROM concert_dw.venue_popularity
+                    WHERE calculated_on = (
+                        SELECT calculated_on FROM concert_dw.venue_popularity
+                        ORDER BY calculated_on DESC LIMIT 1
                     );
                 """)
                 
@@ -203,8 +206,9 @@ class RedshiftService:
                 latest_artist_calc = self.client.execute_query("""
                     SELECT MAX(calculated_at) as latest_calculation, COUNT(*) as artist_count
                     FROM concert_dw.artist_performance 
-                    WHERE DATE(calculated_at) = (
-                        SELECT MAX(DATE(calculated_at)) FROM concert_dw.artist_performance
+                    WHERE calculated_on = (
+                        SELECT calculated_on FROM concert_dw.artist_performance
+                        ORDER BY calculated_on DESC LIMIT 1
                     );
                 """)
                 
@@ -237,8 +241,9 @@ class RedshiftService:
         
         for table in tables:
             try:
-                # Run ANALYZE to update statistics
-                analyze_success = self.client.analyze_table(table, 'concert_dw')
+                # Refresh statistics on the columns queries filter and join on;
+                # loads leave this to auto-analyze and this scheduled pass
+                analyze_success = self.client.analyze_table(table, 'concert_dw', predicate_columns=True)
                 
                 # Run VACUUM to reclaim space and sort data
                 vacuum_success = self.client.vacuum_table(table, 'concert_dw')
@@ -262,11 +267,11 @@ class RedshiftService:
             cleanup_queries = [
                 f"""
                 DELETE FROM concert_dw.venue_popularity 
-                WHERE calculated_at < CURRENT_DATE - INTERVAL '{days_to_keep} days';
+                WHERE calculated_on < CURRENT_DATE - INTERVAL '{days_to_keep} days';
                 """,
                 f"""
                 DELETE FROM concert_dw.artist_performance 
-                WHERE calculated_at < CURRENT_DATE - INTERVAL '{days_to_keep} days';
+                WHERE calculated_on < CURRENT_DATE - INTERVAL '{days_to_keep} days';
                 """,
                 f"""
                 DELETE FROM concert_dw.daily_sales_summary 
@@ -0,0 +1,50 @@
+"""
+Tests for the Artist model.
+"""
+import pytest
+
+from ..models.artist import Artist, ARTIST_ARROW_SCHEMA
+
+
+class TestArtistBatchValidation:
+    """Test that Artist.validate_batch agrees with per-record validation."""
+    
+    ROWS = [
+        {'artist_id': 'art_001', 'name': '  The Rolling Stones ', 'genre': [' Rock', '', 'Blues Rock '],
+         'popularity_score': 85.5, 'members': [' Mick Jagger', ' ']},
+        {'artist_id': 'art_002', 'name': 'Solo', 'genre': None, 'popularity_score': None, 'members': None},
+        {'artist_id': 'art_003', 'name': '   ', 'genre': [], 'popularity_score': 50.0, 'members': []},
+        {'artist_id': 'art_004', 'name': '', 'genre': [], 'popularity_score': 50.0, 'members': []},
+        {'artist_id': 'art_005', 'name': 'x' * 201, 'genre': [], 'popularity_score': 50.0, 'members': []},
+        {'artist_id': 'art_006', 'name': 'Too Popular', 'genre': [], 'popularity_score': 100.5, 'members': []},
+        {'artist_id': 'art_007', 'name': 'Unpopular', 'genre': [], 'popularity_score': -1.0, 'members': []},
+        {'artist_id': None, 'name': 'No Id', 'genre': [], 'popularity_score': 10.0, 'members': []},
+        {'artist_id': 'art_009', 'name': None, 'genre': [], 'popularity_score': 10.0, 'members': []},
+    ]
+    
+    @staticmethod
+    def model_result(row):
+        """Validate one row with the model, or None if it is rejected."""
+        fields = {key: value for key, value in row.items() if value is not None}
+        try:
+            return Artist.model_validate(fields)
+        except ValueError:
+            return None
+    
+    def test_validate_batch_matches_model_validate(self):
+        """Test that the batch mask and normalized values match Artist.model_validate row by row."""
+        pa = pytest.importorskip("pyarrow")
+        rows = [{field.name: row.get(field.name) for field in ARTIST_ARROW_SCHEMA} for row in self.ROWS]
+        
+        table, valid = Artist.validate_batch(pa.Table.from_pylist(rows, schema=ARTIST_ARROW_SCHEMA))
+        
+        for index, row in enumerate(self.ROWS):
+            artist = self.model_result(row)
+            assert valid[index].as_py() == (artist is not None), row
+            if artist is not None:
+                batch_row = table.slice(index, 1).to_pylist()[0]
+                assert batch_row['name'] == artist.name
+                assert batch_row['genre'] == artist.genre
+                assert batch_row['members'] == artist.members
+                assert batch_row['popularity_score'] == artist.popularity_score
+
@@ -0,0 +1,171 @@
+"""
+Tests for the Lake Formation client behind the data governance service.
+"""
+import json
+import pytest
+from unittest.mock import patch
+from botocore.exceptions import ClientError, EndpointConnectionError, NoCredentialsError
+
+from ..infrastructure.lake_formation_client import LakeFormationClient
+
+
+def client_error(code: str, operation: str) -> ClientError:
+    """Build a botocore ClientError with the given error code."""
+    return ClientError({'Error': {'Code': code, 'Message': code}}, operation)
+
+
+@pytest.fixture
+def lf():
+    """LakeFormationClient over a mocked boto3 session."""
+    with patch('src.infrastructure.lake_formation_client.boto3.Session'):
+        client = LakeFormationClient(region_name='us-east-1')
+    yield client
+    client._audit_executor.shutdown(wait=True)
+
+
+class TestLakeFormationLineage:
+    """Test cases for lineage tracking and lookup."""
+    
+    def test_client_provisions_lineage_table(self, lf):
+        """Test that the lineage table is created along with the audit log group."""
+        create_kwargs = lf.dynamodb.create_table.call_args[1]
+        assert create_kwargs['TableName'] == 'lake-formation-data-lineage'
+        assert create_kwargs['GlobalSecondaryIndexes'][0]['IndexName'] == 'TargetIndex'
+    
+    def test_client_constructs_without_credentials(self):
+        """Test that a lineage table that can't be created doesn't break client construction."""
+        with patch('src.infrastructure.lake_formation_client.boto3.Session') as mock_session:
+            mock_session.return_value.resource.return_value.create_table.side_effect = NoCredentialsError()
+            client = LakeFormationClient(region_name='us-east-1')
+        client._audit_executor.shutdown(wait=True)
+        
+        assert client.create_lineage_table_if_not_exists() is False
+    
+    def test_track_lineage_logs_before_indexing(self, lf):
+        """Test that lineage reaches CloudWatch first and a missing table does not fail tracking."""
+        calls = []
+        lf.cloudwatch_client.put_log_events.side_effect = lambda **kwargs: calls.append('logs')
+        
+        def put_item(**kwargs):
+            calls.append('dynamodb')
+            raise client_error('ResourceNotFoundException', 'PutItem')
+        lf.lineage_table.put_item.side_effect = put_item
+        
+        result = lf.track_data_lineage('raw.artists', 'dw.artists', 'normalize')
+        
+        assert result.success is True
+        assert calls == ['logs', 'dynamodb']
+        message = json.loads(lf.cloudwatch_client.put_log_events.call_args[1]['logEvents'][0]['message'])
+        assert message['source'] == 'raw.artists' and message['target'] == 'dw.artists'
+    
+    def test_track_lineage_survives_unreachable_table(self, lf):
+        """Test that a connection error on the index write still reports the logged lineage as tracked."""
+        lf.lineage_table.put_item.side_effect = EndpointConnectionError(endpoint_url='https://dynamodb')
+        
+        result = lf.track_data_lineage('raw.artists', 'dw.artists', 'normalize')
+        
+        assert result.success is True
+        lf.cloudwatch_client.put_log_events.assert_called_once()
+    
+    def test_get_lineage_falls_back_to_logs(self, lf):
+        """Test that lineage is read from the log streams when the table cannot be queried."""
+        lf.lineage_table.query.side_effect = client_error('ResourceNotFoundException', 'Query')
+        record = {'lineage_id': 'l1', 'source': 'raw.artists', 'target': 'dw.artists',
+                  'transformation': 'normalize', 'timestamp': '2025-06-01T00:00:00', 'metadata': {}}
+        paginator = lf.cloudwatch_client.get_paginator.return_value
+        paginator.paginate.return_value = [{'events': [{'message': json.dumps(record)}]}]
+        
+        lineage = lf.get_data_lineage('dw.artists', direction='upstream')
+        
+        assert lineage == {'upstream': [record]}
+        paginate_kwargs = paginator.paginate.call_args[1]
+        assert paginate_kwargs['logStreamNamePrefix'] == 'lineage/'
+        assert paginate_kwargs['filterPattern'] == '{ $.target = "dw.artists" }'
+    
+    def test_get_lineage_reads_table(self, lf):
+        """Test that downstream lineage comes from the table keyed by source."""
+        lf.lineage_table.query.return_value = {'Items': [
+            {'source': 'raw.artists', 'target': 'dw.artists', 'lineage_key': 'k', 'metadata': '{"rows": 3}'}
+        ]}
+        
+        lineage = lf.get_data_lineage('raw.artists', direction='downstream')
+        
+        assert lineage == {'downstream': [{'source': 'raw.artists', 'target': 'dw.artists',
+                                           'metadata': {'rows': 3}}]}
+        lf.cloudwatch_client.get_paginator.assert_not_called()
+
+
+class TestLakeFormationPermissions:
+    """Test cases for permission listing."""
+    
+    def test_list_permissions_unfiltered_reads_every_resource_type(self, lf):
+        """Test that an unfiltered listing is one paginated call, so LF-tag grants are not dropped."""
+        paginator = lf.lf_client.get_paginator.return_value
+        paginator.paginate.return_value = [
+            {'PrincipalResourcePermissions': [{'Resource': {'Table': {'Name': 'artists'}}}]},
+            {'PrincipalResourcePermissions': [{'Resource': {'LFTag': {'TagKey': 'tier'}}}]}
+        ]
+        
+        permissions = lf.list_permissions(principal='arn:aws:iam::123456789012:role/analyst')
+        
+        assert len(permissions) == 2
+        paginator.paginate.assert_called_once_with(
+            Principal={'DataLakePrincipalIdentifier': 'arn:aws:iam::123456789012:role/analyst'}
+        )
+    
+    def test_list_permissions_by_resource_type(self, lf):
+        """Test that a resource type filter is passed through."""
+        paginator = lf.lf_client.get_paginator.return_value
+        paginator.paginate.return_value = [{'PrincipalResourcePermissions': []}]
+        
+        assert lf.list_permissions(resource_type='TABLE') == []
+        paginator.paginate.assert_called_once_with(ResourceType='TABLE')
+    
+    def test_bulk_grant_chunks_and_reports_per_table(self, lf):
+        """Test that bulk grants go out 20 entries per call and failures map back to their tables."""
+        grants = [('concert_dw', f'table_{i}', ['SELECT']) for i in range(25)]
+        grants.append(('concert_dw', 'bad_perms', ['READ']))
+        lf.lf_client.batch_grant_permissions.side_effect = [
+            {'Failures': [{'RequestEntry': {'Id': '3'}, 'Error': {'ErrorMessage': 'Table not found'}}]},
+            {'Failures': []}
+        ]
+        
+        results = lf.grant_table_access_bulk('arn:aws:iam::123456789012:role/analyst', grants)
+        
+        batch_sizes = [len(call[1]['Entries']) for call in lf.lf_client.batch_grant_permissions.call_args_list]
+        assert batch_sizes == [20, 5]
+        assert [result.resource for result in results] == [f"{db}.{table}" for db, table, _ in grants]
+        assert results[3].success is False and 'Table not found' in results[3].message
+        assert results[25].success is False and 'Invalid permissions' in results[25].message
+        assert sum(result.success for result in results) == 24
+
+
+class TestLakeFormationCatalog:
+    """Test cases for Glue Data Catalog metadata updates."""
+    
+    def test_metadata_updates_reuse_table_definition(self, lf):
+        """Test that back-to-back updates fetch the table once and accumulate parameters."""
+        lf.glue_client.get_table.return_value = {'Table': {
+            'Name': 'artists', 'DatabaseName': 'concert_dw', 'VersionId': '1',
+            'Parameters': {'classification': 'parquet'}
+        }}
+        
+        assert lf.update_table_metadata('concert_dw', 'artists', {'owner': 'analytics'})['success'] is True
+        assert lf.update_table_metadata('concert_dw', 'artists', {'pii': 'false'})['success'] is True
+        
+        lf.glue_client.get_table.assert_called_once()
+        table_input = lf.glue_client.update_table.call_args[1]['TableInput']
+        assert table_input == {'Name': 'artists', 'Parameters': {
+            'classification': 'parquet', 'owner': 'analytics', 'pii': 'false'
+        }}
+    
+    def test_failed_update_drops_cached_definition(self, lf):
+        """Test that a failed update makes the next one re-read the table."""
+        lf.glue_client.get_table.return_value = {'Table': {'Name': 'artists', 'Parameters': {}}}
+        lf.glue_client.update_table.side_effect = [
+            client_error('ConcurrentModificationException', 'UpdateTable'), {}
+        ]
+        
+        assert lf.update_table_metadata('concert_dw', 'artists', {'owner': 'analytics'})['success'] is False
+        assert lf.update_table_metadata('concert_dw', 'artists', {'owner': 'analytics'})['success'] is True
+        assert lf.glue_client.get_table.call_count == 2
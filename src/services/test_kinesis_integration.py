@@ -6,10 +6,16 @@ import asyncio
 from unittest.mock import Mock, patch, AsyncMock
 from datetime import datetime
 import json
+import base64
+import hashlib
+import gzip
+from botocore.exceptions import ClientError
 
 from ..infrastructure.kinesis_client import KinesisClient, StreamRecord
 from ..services.stream_producer import StreamProducerService, StreamProducerResult
 from ..services.kinesis_integration_service import KinesisIntegrationService, KinesisIntegrationResult
+from ..infrastructure.lambda_functions import ConcertDataProcessor, kinesis_stream_processor_handler
+from ..infrastructure.lambda_deployment import LambdaDeployer, LambdaDeploymentError
 
 
 class TestKinesisClient:
@@ -407,6 +413,259 @@ class TestKinesisIntegrationService:
         assert result.details['integration_health'] == 'unhealthy'
 
 
+class TestConcertDataProcessor:
+    """Test cases for the Kinesis stream processor Lambda."""
+    
+    @pytest.fixture
+    def processor(self):
+        """ConcertDataProcessor with a mock S3 client."""
+        with patch('src.infrastructure.lambda_functions.boto3.client'):
+            return ConcertDataProcessor()
+    
+    def test_write_to_s3_keeps_key_when_compressing(self, processor):
+        """Test that a large JSON body is gzipped under the caller's key."""
+        data = {'records': ['x' * 1000] * 100}
+        
+        assert processor.write_to_s3("processed-bucket", "exports/batch.json", data) is True
+        
+        put_kwargs = processor.s3_client.put_object.call_args[1]
+        assert put_kwargs['Key'] == "exports/batch.json"
+        assert put_kwargs['ContentEncoding'] == 'gzip'
+        assert json.loads(gzip.decompress(put_kwargs['Body'])) == data
+    
+    def kinesis_record(self, sequence_number='1'):
+        """A Kinesis record carrying one artist."""
+        record = {'source': 'spotify', 'data_type': 'artists', 'ingestion_timestamp': '2025-06-01T00:00:00',
+                  'payload': {'artist_id': 'a1', 'name': 'The Band'}}
+        return {
+            'data': base64.b64encode(json.dumps(record).encode()).decode(),
+            'sequenceNumber': sequence_number, 'partitionKey': 'a1',
+            'approximateArrivalTimestamp': 1748736000.0, 'kinesisSchemaVersion': '1.0'
+        }
+    
+    def test_batch_data_and_manifest_share_processed_prefix(self, processor):
+        """Test that batch data lands under processed/<group>/ next to the manifest that lists it."""
+        results, s3_writes, manifest_writes, _ = processor._prepare_batch([self.kinesis_record()])
+        
+        assert results['successful_records'] == 1
+        (_, data_key, _, _), = s3_writes
+        (_, manifest_key, manifest, _), = manifest_writes
+        assert data_key.startswith("processed/artists/") and data_key.endswith(".ndjson.gz")
+        assert manifest_key == data_key.replace(".ndjson.gz", ".manifest")
+        assert manifest['entries'][0]['url'] == f"s3://concert-data-processed/{data_key}"
+    
+    def test_batches_in_the_same_second_get_distinct_keys(self, processor):
+        """Test that concurrent batches for a group written in the same second don't overwrite each other."""
+        with patch('src.infrastructure.lambda_functions.datetime') as mock_datetime:
+            mock_datetime.utcnow.return_value = datetime(2025, 6, 1, 12, 0, 0)
+            _, first_writes, first_manifests, _ = processor._prepare_batch([self.kinesis_record('1')])
+            _, second_writes, second_manifests, _ = processor._prepare_batch([self.kinesis_record('2')])
+        
+        assert first_writes[0][1] != second_writes[0][1]
+        assert first_manifests[0][1] != second_manifests[0][1]
+        assert first_writes[0][1].startswith("processed/artists/2025/06/01/batch_20250601_120000_")
+    
+    def stream_event(self, *kinesis_records):
+        """A Lambda event delivering the given Kinesis records."""
+        return {'Records': [{'eventSource': 'aws:kinesis', 'kinesis': record} for record in kinesis_records]}
+    
+    def test_handler_reports_undecodable_records(self, processor):
+        """Test that a record that fails to decode is returned for redelivery and the rest are written."""
+        bad_record = {**self.kinesis_record('2'), 'data': 'not-base64-json'}
+        
+        with patch('src.infrastructure.lambda_functions._processor', processor):
+            response = kinesis_stream_processor_handler(self.stream_event(self.kinesis_record('1'), bad_record), None)
+        
+        assert response['batchItemFailures'] == [{'itemIdentifier': '2'}]
+        written_keys = [call[1]['Key'] for call in processor.s3_client.put_object.call_args_list]
+        assert any(key.endswith(".manifest") for key in written_keys)
+    
+    def test_handler_reports_whole_batch_when_s3_write_fails(self, processor):
+        """Test that a failed data write returns every record so Kinesis does not move past the batch."""
+        processor.s3_client.put_object.side_effect = ClientError(
+            {'Error': {'Code': 'SlowDown', 'Message': 'SlowDown'}}, 'PutObject'
+        )
+        
+        with patch('src.infrastructure.lambda_functions._processor', processor):
+            response = kinesis_stream_processor_handler(
+                self.stream_event(self.kinesis_record('1'), self.kinesis_record('2')), None
+            )
+        
+        assert response['batchItemFailures'] == [{'itemIdentifier': '1'}, {'itemIdentifier': '2'}]
+        assert processor.s3_client.put_object.call_count == 1
+    
+    def test_handler_reports_whole_batch_on_unexpected_error(self, processor):
+        """Test that an error outside record processing fails the whole batch."""
+        with patch('src.infrastructure.lambda_functions._processor', processor), \
+             patch.object(processor, 'process_records', side_effect=RuntimeError("boom")):
+            response = kinesis_stream_processor_handler(self.stream_event(self.kinesis_record('1')), None)
+        
+        assert response['statusCode'] == 500
+        assert response['batchItemFailures'] == [{'itemIdentifier': '1'}]
+
+
+class TestLambdaDeployer:
+    """Test cases for Lambda deploys of the stream processing functions."""
+    
+    ZIP_CONTENT = b"PK-deployment-package"
+    FUNCTION_ARN = "arn:aws:lambda:us-east-1:123456789012:function:stream-processor"
+    
+    @pytest.fixture
+    def lambda_client(self):
+        """Mock Lambda client."""
+        client = Mock()
+        client.create_function.return_value = {'FunctionArn': self.FUNCTION_ARN}
+        return client
+    
+    @pytest.fixture
+    def deployer(self, lambda_client, tmp_path):
+        """LambdaDeployer over mock clients with a deploy cache in a temp directory."""
+        with patch('src.infrastructure.lambda_deployment.DEPLOY_CACHE_DIR', tmp_path):
+            yield LambdaDeployer(lambda_client=lambda_client, iam_client=Mock(), s3_client=Mock(),
+                                 staging_bucket="staging-bucket", sts_client=Mock())
+    
+    def deploy(self, deployer):
+        """Deploy the test package with fixed configuration."""
+        return deployer.deploy_lambda_function(
+            "stream-processor", "lambda_functions.kinesis_stream_processor_handler",
+            "arn:aws:iam::123456789012:role/lambda-role", self.ZIP_CONTENT
+        )
+    
+    def live_configuration(self, lambda_client):
+        """The get_function_configuration response for the function as the first deploy left it."""
+        create_kwargs = lambda_client.create_function.call_args[1]
+        return {
+            'FunctionArn': self.FUNCTION_ARN,
+            'CodeSha256': base64.b64encode(hashlib.sha256(self.ZIP_CONTENT).digest()).decode('ascii'),
+            'RevisionId': 'rev-1',
+            **{key: create_kwargs[key] for key in ('Role', 'Handler', 'Description', 'Timeout',
+                                                  'MemorySize', 'Environment')}
+        }
+    
+    def test_cached_deploy_is_confirmed_against_live_function(self, deployer, lambda_client):
+        """Test that a deploy cache hit still checks the function and skips only the upload."""
+        assert self.deploy(deployer) == self.FUNCTION_ARN
+        lambda_client.get_function_configuration.return_value = self.live_configuration(lambda_client)
+        
+        assert self.deploy(deployer) == self.FUNCTION_ARN
+        
+        lambda_client.get_function_configuration.assert_called_once_with(FunctionName="stream-processor")
+        assert lambda_client.create_function.call_count == 1
+        lambda_client.update_function_code.assert_not_called()
+    
+    def test_cached_deploy_of_deleted_function_recreates_it(self, deployer, lambda_client):
+        """Test that a function deleted since the cached deploy is created again."""
+        self.deploy(deployer)
+        lambda_client.get_function_configuration.side_effect = ClientError(
+            {'Error': {'Code': 'ResourceNotFoundException', 'Message': 'Function not found'}},
+            'GetFunctionConfiguration'
+        )
+        
+        assert self.deploy(deployer) == self.FUNCTION_ARN
+        assert lambda_client.create_function.call_count == 2
+    
+    def test_cached_deploy_of_changed_code_updates_it(self, deployer, lambda_client):
+        """Test that code changed outside this deployer is uploaded again."""
+        self.deploy(deployer)
+        live = self.live_configuration(lambda_client)
+        lambda_client.get_function_configuration.return_value = {**live, 'CodeSha256': 'other'}
+        lambda_client.create_function.side_effect = ClientError(
+            {'Error': {'Code': 'ResourceConflictException', 'Message': 'Function already exist'}},
+            'CreateFunction'
+        )
+        lambda_client.update_function_code.return_value = {**live, 'RevisionId': 'rev-2'}
+        
+        assert self.deploy(deployer) == self.FUNCTION_ARN
+        lambda_client.update_function_code.assert_called_once()
+
+    
+    def test_function_list_cache_cleared_on_deploy_and_delete(self, deployer, lambda_client):
+        """Test that deploys and deletes are visible to the next list_deployed_functions call."""
+        lambda_client.get_function.return_value = {'Configuration': {
+            'FunctionName': 'stream-processor', 'FunctionArn': self.FUNCTION_ARN, 'Runtime': 'python3.9',
+            'Handler': 'lambda_functions.kinesis_stream_processor_handler', 'Timeout': 300,
+            'MemorySize': 512, 'LastModified': '2025-06-01T00:00:00.000+0000'
+        }}
+        deployer.list_deployed_functions(["stream-processor"])
+        assert deployer._function_list_cache
+        
+        self.deploy(deployer)
+        assert not deployer._function_list_cache
+        
+        deployer.list_deployed_functions(["stream-processor"])
+        assert deployer.delete_lambda_function("stream-processor") is True
+        assert not deployer._function_list_cache
+        lambda_client.delete_function.assert_called_once_with(FunctionName="stream-processor")
+    
+    def test_event_source_mapping_retries_until_success_by_default(self, deployer, lambda_client):
+        """Test that the default mapping never discards records."""
+        lambda_client.create_event_source_mapping.return_value = {'UUID': 'mapping-1'}
+        
+        assert deployer.create_kinesis_event_source_mapping(
+            "stream-processor", "arn:aws:kinesis:us-east-1:123456789012:stream/concerts"
+        ) == 'mapping-1'
+        
+        mapping_kwargs = lambda_client.create_event_source_mapping.call_args[1]
+        assert mapping_kwargs['MaximumRetryAttempts'] == -1
+        assert mapping_kwargs['MaximumRecordAgeInSeconds'] == -1
+        assert 'DestinationConfig' not in mapping_kwargs
+    
+    def test_event_source_mapping_limits_require_failure_destination(self, deployer, lambda_client):
+        """Test that finite retry limits are rejected without somewhere to send discarded batches."""
+        stream_arn = "arn:aws:kinesis:us-east-1:123456789012:stream/concerts"
+        with pytest.raises(LambdaDeploymentError):
+            deployer.create_kinesis_event_source_mapping("stream-processor", stream_arn,
+                                                         maximum_retry_attempts=3)
+        lambda_client.create_event_source_mapping.assert_not_called()
+        
+        lambda_client.create_event_source_mapping.return_value = {'UUID': 'mapping-1'}
+        deployer.create_kinesis_event_source_mapping(
+            "stream-processor", stream_arn, maximum_retry_attempts=3,
+            on_failure_destination_arn="arn:aws:sqs:us-east-1:123456789012:stream-dlq"
+        )
+        assert lambda_client.create_event_source_mapping.call_args[1]['DestinationConfig'] == {
+            'OnFailure': {'Destination': "arn:aws:sqs:us-east-1:123456789012:stream-dlq"}
+        }
+    
+    def test_role_with_failed_policy_attach_is_not_cached(self, deployer):
+        """Test that a new role missing a policy after a retry fails the deploy and is not cached."""
+        s3_policy = 'arn:aws:iam::aws:policy/AmazonS3FullAccess'
+        iam = deployer.iam_client
+        iam.get_role.side_effect = ClientError({'Error': {'Code': 'NoSuchEntity', 'Message': ''}}, 'GetRole')
+        iam.create_role.return_value = {'Role': {'Arn': 'arn:aws:iam::123456789012:role/attach-fails'}}
+        
+        def attach(RoleName, PolicyArn):
+            if PolicyArn == s3_policy:
+                raise ClientError({'Error': {'Code': 'Throttling', 'Message': ''}}, 'AttachRolePolicy')
+        iam.attach_role_policy.side_effect = attach
+        
+        with patch.dict(LambdaDeployer._role_cache, clear=True):
+            with pytest.raises(LambdaDeploymentError, match='AmazonS3FullAccess'):
+                deployer.create_lambda_execution_role('attach-fails')
+            assert 'attach-fails' not in LambdaDeployer._role_cache
+        
+        s3_attempts = [call for call in iam.attach_role_policy.call_args_list if call[1]['PolicyArn'] == s3_policy]
+        assert len(s3_attempts) == 2
+    
+    def test_existing_role_missing_policy_is_repaired(self, deployer):
+        """Test that an existing role gets the managed policies an earlier run failed to attach."""
+        iam = deployer.iam_client
+        iam.get_role.return_value = {'Role': {'Arn': 'arn:aws:iam::123456789012:role/partial'}}
+        iam.get_paginator.return_value.paginate.return_value = [{'AttachedPolicies': [
+            {'PolicyArn': 'arn:aws:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole'},
+            {'PolicyArn': 'arn:aws:iam::aws:policy/service-role/AWSLambdaKinesisExecutionRole'}
+        ]}]
+        
+        with patch.dict(LambdaDeployer._role_cache, clear=True):
+            assert deployer.create_lambda_execution_role('partial') == 'arn:aws:iam::123456789012:role/partial'
+        
+        iam.get_paginator.assert_called_once_with('list_attached_role_policies')
+        iam.attach_role_policy.assert_called_once_with(
+            RoleName='partial', PolicyArn='arn:aws:iam::aws:policy/AmazonS3FullAccess'
+        )
+        iam.create_role.assert_not_called()
+
+
 # Integration test (requires actual AWS resources)
 @pytest.mark.integration
 class TestKinesisIntegrationE2E:
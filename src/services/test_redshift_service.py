@@ -7,7 +7,7 @@ import logging
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, date
 from ..services.redshift_service import RedshiftService
-from ..infrastructure.redshift_client import RedshiftClient
+from ..infrastructure.redshift_client import RedshiftClient, CopyLoadError
 from ..infrastructure.redshift_schema import RedshiftSchemaManager
 from ..infrastructure.redshift_data_loader import RedshiftDataLoader
 from ..infrastructure.redshift_stored_procedures import RedshiftStoredProcedures
@@ -310,6 +310,437 @@ class TestRedshiftService:
         redshift_service.client.close_connection.assert_called_once()
 
 
+class TestRedshiftClient:
+    """Test cases for RedshiftClient on a mocked connection pool."""
+    
+    @pytest.fixture
+    def cursor(self):
+        """Cursor of the single pooled connection."""
+        return MagicMock()
+    
+    @pytest.fixture
+    def client(self, cursor):
+        """RedshiftClient whose pool hands out one mock connection."""
+        with patch('src.infrastructure.redshift_client.boto3.client'), \
+             patch('src.infrastructure.redshift_client.settings'):
+            client = RedshiftClient()
+        conn = MagicMock()
+        conn.closed = 0
+        conn.cursor.return_value.__enter__.return_value = cursor
+        client._pool = MagicMock()
+        client._pool.getconn.return_value = conn
+        return client
+    
+    def test_query_returns_connection_to_pool(self, client, cursor):
+        """Test that a query borrows one pooled connection and gives it back."""
+        cursor.description = [('venue_id',), ('capacity',)]
+        cursor.fetchall.return_value = [('v1', 500), ('v2', 1200)]
+        
+        rows = client.execute_query("SELECT venue_id, capacity FROM concert_dw.venues")
+        
+        assert rows == [{'venue_id': 'v1', 'capacity': 500}, {'venue_id': 'v2', 'capacity': 1200}]
+        conn = client._pool.getconn.return_value
+        client._pool.putconn.assert_called_once_with(conn, close=False)
+    
+    def test_failed_query_releases_pool_slot(self, client, cursor):
+        """Test that a failing query rolls back and frees its slot for other callers."""
+        import psycopg2
+        cursor.execute.side_effect = psycopg2.Error("relation does not exist")
+        
+        with pytest.raises(psycopg2.Error):
+            client.execute_query("SELECT * FROM missing")
+        
+        conn = client._pool.getconn.return_value
+        conn.rollback.assert_called_once()
+        client._pool.putconn.assert_called_once_with(conn, close=False)
+        # Every slot is free again, so no later caller blocks
+        assert all(client._pool_slots.acquire(blocking=False) for _ in range(client.max_connections))
+    
+    def test_closed_connection_is_replaced(self, client, cursor):
+        """Test that a connection closed while idle in the pool is discarded."""
+        closed, fresh = MagicMock(closed=1), MagicMock(closed=0)
+        fresh.cursor.return_value.__enter__.return_value = cursor
+        client._pool.getconn.side_effect = [closed, fresh]
+        cursor.fetchone.return_value = (42,)
+        
+        assert client.execute_scalar("SELECT COUNT(*) FROM concert_dw.venues") == 42
+        client._pool.putconn.assert_any_call(closed, close=True)
+        client._pool.putconn.assert_called_with(fresh, close=False)
+    
+    def test_bulk_insert_pages_rows(self, client, cursor):
+        """Test that bulk inserts send multi-row VALUES pages in one committed transaction."""
+        rows = [('s1', 'c1', 2), ('s2', 'c1', 4)]
+        with patch('src.infrastructure.redshift_client.execute_values') as execute_values:
+            assert client.bulk_insert("concert_dw.ticket_sales", ['sale_id', 'concert_id', 'quantity'],
+                                      rows, page_size=500) == 2
+        
+        execute_values.assert_called_once_with(
+            cursor, "INSERT INTO concert_dw.ticket_sales (sale_id, concert_id, quantity) VALUES %s",
+            rows, page_size=500
+        )
+        client._pool.getconn.return_value.commit.assert_called_once()
+        
+        assert client.bulk_insert("concert_dw.ticket_sales", ['sale_id'], []) == 0
+        client._pool.getconn.assert_called_once()
+    
+    def test_query_arrow_builds_columns(self, client, cursor):
+        """Test that Arrow results hold one column per selected field, even with no rows."""
+        cursor.description = [('city',), ('total_events',)]
+        cursor.fetchall.return_value = [('Austin', 12), ('Denver', 7)]
+        
+        table = client.execute_query_arrow("SELECT city, total_events FROM concert_dw.v_city_events")
+        
+        assert table.column_names == ['city', 'total_events']
+        assert table.to_pylist() == [{'city': 'Austin', 'total_events': 12},
+                                     {'city': 'Denver', 'total_events': 7}]
+        
+        cursor.fetchall.return_value = []
+        empty = client.execute_query_arrow("SELECT city, total_events FROM concert_dw.v_city_events")
+        assert empty.column_names == ['city', 'total_events'] and empty.num_rows == 0
+    
+    def test_execute_copy_returns_load_metrics(self, client, cursor):
+        """Test that a successful COPY reports rows and files loaded."""
+        cursor.fetchone.return_value = (250, 3)
+        
+        assert client.execute_copy("COPY t FROM 's3://bucket/t/'") == (250, 3)
+    
+    def test_execute_copy_raises_with_load_errors(self, client, cursor):
+        """Test that a failed COPY raises CopyLoadError carrying the stl_load_errors rows."""
+        import psycopg2
+        load_errors = [{'filename': 's3://bucket/t/part-0.json', 'line_number': 7,
+                        'colname': 'price', 'err_reason': 'Invalid digit'}]
+        cursor.execute.side_effect = [psycopg2.Error("Load into table 't' failed"), None]
+        cursor.fetchall.return_value = load_errors
+        
+        with pytest.raises(CopyLoadError) as exc_info:
+            client.execute_copy("COPY t FROM 's3://bucket/t/'")
+        
+        assert exc_info.value.load_errors == load_errors
+        assert "stl_load_errors" in cursor.execute.call_args_list[1][0][0]
+
+
+class TestRedshiftDataLoader:
+    """Test cases for the COPY statements built by RedshiftDataLoader."""
+    
+    @pytest.fixture
+    def client(self):
+        """Mock Redshift client whose COPYs succeed."""
+        client = Mock(spec=RedshiftClient)
+        client.execute_query.return_value = []
+        client.execute_copy.return_value = (10, 1)
+        return client
+    
+    @pytest.fixture
+    def data_loader(self, client):
+        """RedshiftDataLoader over the mock client."""
+        loader = RedshiftDataLoader(client, "arn:aws:iam::123456789012:role/RedshiftRole")
+        yield loader
+        loader.wait_for_pending_analyze()
+    
+    def test_load_defaults_to_json(self, data_loader, client):
+        """Test that table loads default to JSON, which the demo pipeline uploads."""
+        assert data_loader.load_artists_data("s3://bucket/raw/artists.json") is True
+        
+        copy_query = client.execute_copy.call_args[0][0]
+        assert "FROM 's3://bucket/raw/artists.json'" in copy_query
+        assert "FORMAT AS JSON 'auto'" in copy_query
+        assert "PARQUET" not in copy_query
+    
+    def test_load_parquet_opt_in(self, data_loader, client):
+        """Test that Parquet staged by prepare_s3_payload is loaded as Parquet."""
+        assert data_loader.load_artists_data("s3://bucket/staged/", file_format='PARQUET') is True
+        
+        copy_query = client.execute_copy.call_args[0][0]
+        assert "FORMAT AS PARQUET SERIALIZETOJSON" in copy_query
+        assert "JSON 'auto'" not in copy_query
+    
+    def test_load_file_list_through_manifest(self, data_loader, client):
+        """Test that a list of files is loaded by one COPY from a generated manifest."""
+        import json
+        data_loader._s3_client = Mock()
+        data_loader._s3_client.head_object.return_value = {'ContentLength': 2048}
+        data_loader._slice_count = 2
+        files = ["s3://bucket/staged/part-0000.parquet", "s3://bucket/staged/part-0001.parquet"]
+        
+        assert data_loader.load_concerts_data(files, file_format='PARQUET') is True
+        
+        put_kwargs = data_loader._s3_client.put_object.call_args[1]
+        manifest = json.loads(put_kwargs['Body'])
+        assert manifest == {'entries': [{'url': path, 'mandatory': True, 'meta': {'content_length': 2048}}
+                                        for path in files]}
+        copy_query = " ".join(client.execute_copy.call_args[0][0].split())
+        assert f"FROM 's3://bucket/{put_kwargs['Key']}'" in copy_query
+        assert "MANIFEST" in copy_query
+        client.execute_copy.assert_called_once()
+    
+    def test_established_tables_skip_compression_and_stats(self, data_loader, client):
+        """Test that loads into an encoded, non-empty table turn off COMPUPDATE and STATUPDATE."""
+        data_loader.load_venues_data("s3://bucket/raw/venues.json")
+        assert "COMPUPDATE OFF" not in client.execute_copy.call_args[0][0]
+        
+        client.execute_query.return_value = [{'encoded': 'Y', 'tbl_rows': 1200}]
+        data_loader.load_venues_data("s3://bucket/raw/venues.json")
+        assert "COMPUPDATE OFF STATUPDATE OFF" in client.execute_copy.call_args[0][0]
+        
+        # Established tables are remembered without probing svv_table_info again
+        probes = client.execute_query.call_count
+        data_loader.load_venues_data("s3://bucket/raw/venues.json")
+        assert client.execute_query.call_count == probes
+    
+    def test_text_loads_tolerate_bad_rows_by_default(self, data_loader, client):
+        """Test that JSON loads keep skipping up to 100 bad rows unless told otherwise."""
+        data_loader.load_ticket_sales_data("s3://bucket/raw/ticket_sales.json")
+        assert "MAXERROR 100" in client.execute_copy.call_args[0][0]
+        
+        strict_loader = RedshiftDataLoader(client, data_loader.iam_role, max_errors=0)
+        strict_loader.load_ticket_sales_data("s3://bucket/raw/ticket_sales.json")
+        assert "MAXERROR 0" in client.execute_copy.call_args[0][0]
+    
+    def test_upsert_rebuild_swaps_in_fresh_table(self, data_loader, client):
+        """Test the statement sequence of a rebuild upsert on a table with no dependents."""
+        client.execute_scalar.return_value = False
+        
+        assert data_loader.upsert_data("daily_sales_staged", "s3://bucket/daily.json.gz",
+                                       ["sale_date"], ["revenue"], rebuild=True) is True
+        
+        statements = [" ".join(stmt.split()) for stmt in client.execute_in_transaction.call_args[0][0]]
+        assert statements[0].startswith("CREATE TEMP TABLE daily_sales_staged_staging "
+                                        "(LIKE concert_dw.daily_sales_staged)")
+        assert statements[1].startswith("COPY daily_sales_staged_staging FROM 's3://bucket/daily.json.gz'")
+        assert "GZIP" in statements[1]
+        assert statements[2] == ("CREATE TABLE concert_dw.daily_sales_staged_rebuild "
+                                 "(LIKE concert_dw.daily_sales_staged);")
+        assert statements[3].startswith("INSERT INTO concert_dw.daily_sales_staged_rebuild")
+        assert statements[4:] == [
+            "ALTER TABLE concert_dw.daily_sales_staged RENAME TO daily_sales_staged_previous;",
+            "ALTER TABLE concert_dw.daily_sales_staged_rebuild RENAME TO daily_sales_staged;",
+            "DROP TABLE concert_dw.daily_sales_staged_previous;",
+            "DROP TABLE daily_sales_staged_staging;",
+        ]
+    
+    def test_upsert_rebuild_merges_tables_with_dependents(self, data_loader, client):
+        """Test that a rebuild of a table with views or foreign keys on it falls back to MERGE."""
+        client.execute_scalar.return_value = True
+        client.execute_query.side_effect = [
+            [],  # svv_table_info probe
+            [{'column_name': 'concert_id'}, {'column_name': 'status'}],
+        ]
+        
+        assert data_loader.upsert_data("concerts", "s3://bucket/concerts.json",
+                                       ["concert_id"], ["status"], rebuild=True) is True
+        
+        statements = [" ".join(stmt.split()) for stmt in client.execute_in_transaction.call_args[0][0]]
+        assert len(statements) == 4
+        assert statements[0].startswith("CREATE TEMP TABLE concerts_staging (LIKE concert_dw.concerts) "
+                                        "BACKUP NO DISTKEY")
+        assert statements[2].startswith("MERGE INTO concert_dw.concerts main USING concerts_staging staging "
+                                        "ON main.concert_id = staging.concert_id")
+        assert statements[3] == "DROP TABLE concerts_staging;"
+        assert not any("_previous" in stmt for stmt in statements)
+    
+    def test_prepare_s3_payload_writes_ddl_typed_parquet(self, data_loader):
+        """Test that staged Parquet carries the DDL column types, not ones inferred from the rows."""
+        import io
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        uploads = {}
+        data_loader._s3_client = Mock()
+        data_loader._s3_client.upload_fileobj.side_effect = (
+            lambda buffer, bucket, key, **kwargs: uploads.__setitem__(key, buffer.read())
+        )
+        data_loader._slice_count = 2
+        sales = [{
+            'sale_id': 's1', 'concert_id': 'c1', 'price_tier': 'vip', 'quantity': 2,
+            'unit_price': 125.5, 'total_amount': 251, 'purchase_timestamp': datetime(2025, 6, 1, 20, 30),
+            'customer_segment': None, 'created_at': datetime(2025, 6, 1), 'updated_at': datetime(2025, 6, 1)
+        }]
+        
+        paths = data_loader.prepare_s3_payload(sales, 'ticket_sales', 's3://bucket/staged/')
+        
+        assert len(paths) == 1 and paths[0].startswith("s3://bucket/staged/ticket_sales_")
+        assert "/date=2025-06-01/part-0000.parquet" in paths[0]
+        table = pq.read_table(io.BytesIO(next(iter(uploads.values()))))
+        assert table.schema.field('unit_price').type == pa.decimal128(8, 2)
+        assert table.schema.field('total_amount').type == pa.decimal128(10, 2)
+        assert table.schema.field('quantity').type == pa.int32()
+        assert table.schema.field('customer_segment').type == pa.string()
+        assert str(table.column('unit_price')[0].as_py()) == "125.50"
+    
+    def test_prepare_s3_payload_empty_input(self, data_loader):
+        """Test that no records stage no files."""
+        data_loader._s3_client = Mock()
+        
+        assert data_loader.prepare_s3_payload([], 'venues', 's3://bucket/staged/') == []
+        data_loader._s3_client.upload_fileobj.assert_not_called()
+    
+    def test_plain_json_loads_uncompressed(self, data_loader, client):
+        """Test that plain .json input is not read as GZIP."""
+        data_loader.load_venues_data("s3://bucket/raw/venues.json")
+        
+        assert "GZIP" not in client.execute_copy.call_args[0][0]
+    
+    @pytest.mark.parametrize("s3_path,codec", [
+        ("s3://bucket/batch.ndjson.gz", "GZIP"),
+        ("s3://bucket/batch.json.zst", "ZSTD"),
+        ("s3://bucket/batch.json.bz2", "BZIP2"),
+        ("s3://bucket/raw/", None),
+        (["s3://bucket/a.json.gz", "s3://bucket/b.json.gz"], "GZIP"),
+    ])
+    def test_compression_inferred_from_suffix(self, s3_path, codec):
+        """Test that the COPY codec follows the file suffix."""
+        assert RedshiftDataLoader._infer_compression(s3_path) == codec
+    
+    def test_explicit_compression_for_manifest(self, data_loader, client):
+        """Test that manifests only compress when asked, since their name says nothing of the files."""
+        data_loader.load_manifest_data("concerts", "s3://bucket/processed/concerts/batch.manifest")
+        assert "GZIP" not in client.execute_copy.call_args[0][0]
+        
+        data_loader.load_manifest_data("concerts", "s3://bucket/processed/concerts/batch.manifest",
+                                       compression='gzip')
+        assert "GZIP" in client.execute_copy.call_args[0][0]
+
+
+class TestRedshiftSchemaManager:
+    """Test cases for RedshiftSchemaManager migrations."""
+    
+    @pytest.fixture
+    def client(self):
+        """Mock RedshiftClient reporting the analytics tables as existing."""
+        client = Mock(spec=RedshiftClient)
+        client.table_exists.return_value = True
+        return client
+    
+    def test_existing_table_gains_calculated_on(self, client):
+        """Test that a table created before calculated_on gets the column, its backfill and the sort key."""
+        client.execute_scalar.side_effect = [None, 'calculated_at']
+        
+        assert RedshiftSchemaManager(client)._create_venue_popularity_table() is True
+        
+        statements = client.execute_in_transaction.call_args[0][0]
+        assert "ADD COLUMN calculated_on DATE NOT NULL DEFAULT CURRENT_DATE" in statements[0]
+        assert "SET calculated_on = calculated_at::DATE" in statements[1]
+        client.execute_query.assert_called_once_with(
+            "ALTER TABLE concert_dw.venue_popularity ALTER SORTKEY (calculated_on, popularity_rank);"
+        )
+    
+    def test_migrated_table_is_left_alone(self, client):
+        """Test that a table already sorted on calculated_on is not altered."""
+        client.execute_scalar.side_effect = [1, 'calculated_on']
+        
+        assert RedshiftSchemaManager(client)._create_artist_performance_table() is True
+        
+        client.execute_in_transaction.assert_not_called()
+        client.execute_query.assert_not_called()
+
+
+class TestRedshiftStoredProcedures:
+    """Test cases for the analytics queries."""
+    
+    @pytest.fixture
+    def client(self):
+        """Mock Redshift client."""
+        client = Mock(spec=RedshiftClient)
+        client.execute_query.return_value = [{'venue_id': 'v1', 'popularity_rank': 999}]
+        return client
+    
+    @pytest.fixture
+    def procedures(self, client):
+        """RedshiftStoredProcedures over the mock client."""
+        return RedshiftStoredProcedures(client)
+    
+    def test_materialized_views_created_before_procedures(self, procedures, client):
+        """Test that the auto-refreshed views are rebuilt before the procedures that read them."""
+        client.execute_query.return_value = [{'proname': 'calculate_venue_popularity'}]
+        
+        assert procedures.create_all_procedures() is True
+        
+        statements = [" ".join(call[0][0].split()) for call in client.execute_query.call_args_list]
+        views = ['mv_venue_metrics', 'mv_artist_metrics', 'mv_ticket_sales_metrics']
+        for index, view in enumerate(views):
+            assert statements[2 * index] == f"DROP MATERIALIZED VIEW IF EXISTS concert_dw.{view};"
+            assert statements[2 * index + 1].startswith(
+                f"CREATE MATERIALIZED VIEW concert_dw.{view} AUTO REFRESH YES AS"
+            )
+            # Auto refresh is only possible without volatile functions
+            assert "CURRENT_DATE" not in statements[2 * index + 1]
+        assert "pg_proc" in statements[-1]
+        
+        payload, = client.execute_in_transaction.call_args[0][0]
+        assert "JOIN concert_dw.mv_artist_metrics m" in payload
+        assert "CREATE OR REPLACE VIEW concert_dw.v_artist_trends" in payload
+    
+    def test_daily_sales_summary_upserts_with_merge(self, procedures):
+        """Test that daily summaries are merged on date and concert rather than deleted and reinserted."""
+        ddl = " ".join(procedures._generate_daily_sales_summary_ddl().split())
+        
+        assert "MERGE INTO concert_dw.daily_sales_summary summary" in ddl
+        assert ("ON summary.summary_date = new_summary.summary_date "
+                "AND summary.concert_id = new_summary.concert_id") in ddl
+        assert "WHEN MATCHED THEN UPDATE SET" in ddl and "WHEN NOT MATCHED THEN INSERT" in ddl
+        assert "DELETE FROM" not in ddl
+    
+    def test_top_venues_fall_back_to_unranked(self, procedures, client):
+        """Test that venues missing from the latest popularity run still fill the limit, ranked 999."""
+        assert procedures.get_top_venues(limit=5, days=90) == [{'venue_id': 'v1', 'popularity_rank': 999}]
+        
+        query, params = client.execute_query.call_args[0]
+        query = " ".join(query.split())
+        assert params == (90, 5)
+        assert "FROM concert_dw.venues v LEFT JOIN concert_dw.concerts c" in query
+        assert "LEFT JOIN latest_popularity lp" in query
+        assert "COALESCE(lp.popularity_rank, 999)::INTEGER as popularity_rank" in query
+    
+    def test_analytics_arguments_are_bound_not_interpolated(self, procedures, client):
+        """Test that caller-supplied filters and dates reach Redshift only as query parameters."""
+        procedures.get_artist_trends(limit=7, trend_filter='growing')
+        query, params = client.execute_query.call_args[0]
+        assert "WHERE growth_trend = %s" in query and params == ('growing', 7)
+        
+        procedures.get_artist_trends(trend_filter="all'; DROP TABLE concert_dw.artists; --")
+        query, params = client.execute_query.call_args[0]
+        assert "WHERE" not in query and "DROP" not in query and params == (20,)
+        
+        procedures.get_revenue_analytics("2025-01-01'; --", None, period='fortnight')
+        query, params = client.execute_query.call_args[0]
+        assert "2025-01-01" not in query
+        assert params == ('month', "2025-01-01'; --", None, '1 month')
+    
+    def test_analytics_as_arrow(self, procedures, client):
+        """Test that as_arrow reads through the Arrow query path and is cached apart from row dicts."""
+        arrow_table = Mock()
+        client.execute_query_arrow.return_value = arrow_table
+        
+        assert procedures.get_top_venues(limit=5, as_arrow=True) is arrow_table
+        assert procedures.get_top_venues(limit=5, as_arrow=True) is arrow_table
+        assert procedures.get_top_venues(limit=5) == [{'venue_id': 'v1', 'popularity_rank': 999}]
+        
+        client.execute_query_arrow.assert_called_once()
+        client.execute_query.assert_called_once()
+    
+    def test_analytics_results_cached_until_cleared(self, procedures, client):
+        """Test that repeated analytics calls reuse the cached result until the cache is cleared."""
+        first = procedures.get_top_venues(limit=5)
+        first.append({'venue_id': 'caller-added'})
+        assert procedures.get_top_venues(limit=5) == [{'venue_id': 'v1', 'popularity_rank': 999}]
+        assert client.execute_query.call_count == 1
+        
+        procedures.get_top_venues(limit=6)
+        assert client.execute_query.call_count == 2
+        
+        procedures.clear_query_cache()
+        procedures.get_top_venues(limit=5)
+        assert client.execute_query.call_count == 3
+    
+    def test_expired_results_are_queried_again(self, client):
+        """Test that results older than the TTL are not reused."""
+        procedures = RedshiftStoredProcedures(client, cache_ttl_seconds=0)
+        
+        procedures.get_top_venues()
+        procedures.get_top_venues()
+        assert client.execute_query.call_count == 2
+
+
 class TestRedshiftIntegration:
     """Integration tests for Redshift components."""
     